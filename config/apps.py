@@ -6,4 +6,7 @@ class CoreConfig(AppConfig):
     name = "src.core"
 
     def ready(self):
+        from src.core.infrastructure.database.pool_metrics import register_database_pool_metrics
+
+        register_database_pool_metrics()
         print("🚀 Core app ready")
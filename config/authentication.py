@@ -27,11 +27,23 @@ class GraphQLAuthenticationBackend:
         try:
             payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=["HS256"])
 
+            if settings.SESSION_REVOCATION_LOG_ENABLED:
+                from src.feature.sessions.infrastructure.services.revocation_registry import get_revocation_registry
+
+                # Logged out/revoked tokens are rejected from memory, no session query per request
+                registry = get_revocation_registry()
+                registry.sync_if_stale()
+                if registry.is_revoked(payload):
+                    return None
+
             user_id = payload.get("user_id")
             if not user_id:
                 return None
 
             user = User.objects.get(id=UUID(user_id))
+            # "Log out everywhere" bumps token_version: older tokens stop verifying
+            if user.token_version != int(payload.get("ver", 0)):
+                return None
             return user
 
         except (jwt.InvalidTokenError, User.DoesNotExist, ValueError):
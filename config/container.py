@@ -0,0 +1,125 @@
+# config/container.py
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from strawberry.dataloader import DataLoader
+from strawberry.django.context import StrawberryDjangoContext
+
+from src.feature.users.application.use_cases.user_use_cases import UserUseCases
+from src.feature.users.domain.repositories.user_repository import UserRepository
+from src.feature.users.infrastructure.database.cached_repository import build_user_repository
+from src.feature.users.infrastructure.graphql.loaders import build_user_loader
+from src.feature.users.infrastructure.graphql.user_resolvers import UserResolvers
+from src.feature.users.infrastructure.services.user_service import UserService
+from src.feature.sessions.application.use_cases.session_use_cases import SessionUseCases
+from src.feature.sessions.domain.repositories.session_repository import SessionRepository
+from src.feature.sessions.infrastructure.database.cached_repository import build_session_repository
+from src.feature.sessions.infrastructure.graphql.auth_resolvers import AuthResolvers
+from src.feature.sessions.infrastructure.graphql.loaders import build_active_sessions_loader
+from src.feature.sessions.infrastructure.services.auth_service import AuthService
+from src.feature.sessions.infrastructure.services.jwt_service import JWTService
+
+
+class Container:
+    """
+    Application-scoped dependency container: repositories, use cases, services and resolvers are
+    stateless, so each is built once on first use and shared by every request.
+
+    Tests swap pieces with overrides, e.g. Container(overrides={"user_repository": FakeUserRepository()});
+    everything built on top of an overridden dependency picks it up.
+    """
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None):
+        self._instances: Dict[str, Any] = dict(overrides or {})
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        # Idempotent factories: a concurrent first call at worst builds a duplicate that is dropped
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._instances.setdefault(name, factory())
+        return instance
+
+    # ===== REPOSITORIES =====
+    @property
+    def user_repository(self) -> UserRepository:
+        return self._get("user_repository", build_user_repository)
+
+    @property
+    def session_repository(self) -> SessionRepository:
+        return self._get("session_repository", build_session_repository)
+
+    # ===== USE CASES =====
+    @property
+    def user_use_cases(self) -> UserUseCases:
+        return self._get("user_use_cases", lambda: UserUseCases(self.user_repository))
+
+    @property
+    def session_use_cases(self) -> SessionUseCases:
+        return self._get("session_use_cases", lambda: SessionUseCases(self.session_repository, self.user_repository))
+
+    # ===== SERVICES =====
+    @property
+    def jwt_service(self) -> JWTService:
+        return self._get("jwt_service", JWTService)
+
+    @property
+    def user_service(self) -> UserService:
+        return self._get("user_service", lambda: UserService(self.user_use_cases))
+
+    @property
+    def auth_service(self) -> AuthService:
+        return self._get("auth_service", lambda: AuthService(self.session_use_cases, self.user_repository, jwt_service=self.jwt_service))
+
+    # ===== RESOLVERS =====
+    @property
+    def user_resolvers(self) -> UserResolvers:
+        return self._get("user_resolvers", lambda: UserResolvers(self.user_service))
+
+    @property
+    def auth_resolvers(self) -> AuthResolvers:
+        return self._get("auth_resolvers", lambda: AuthResolvers(self.auth_service))
+
+    def context(self, request=None, response=None) -> "GraphQLContext":
+        # One per operation; also for schema.execute outside the HTTP view (management commands, tests)
+        return GraphQLContext(request=request, response=response, container=self, loaders=Loaders(self))
+
+
+class Loaders:
+    """
+    Request-scoped DataLoaders for relationship fields. Unlike the container they memoize results,
+    so a fresh set is created per operation and never shared between requests.
+    """
+
+    def __init__(self, container: Container):
+        self.container = container
+        self._loaders: Dict[str, DataLoader] = {}
+
+    def _get(self, name: str, factory: Callable[[], DataLoader]) -> DataLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = self._loaders[name] = factory()
+        return loader
+
+    @property
+    def user_by_id(self) -> DataLoader:
+        return self._get("user_by_id", lambda: build_user_loader(self.container.user_use_cases))
+
+    @property
+    def active_sessions_by_user_id(self) -> DataLoader:
+        return self._get("active_sessions_by_user_id", lambda: build_active_sessions_loader(self.container.session_use_cases))
+
+
+@dataclass
+class GraphQLContext(StrawberryDjangoContext):
+    container: Container = field(default=None)
+    loaders: Loaders = field(default=None)
+
+
+_container: Optional[Container] = None
+
+
+def get_container() -> Container:
+    global _container
+    if _container is None:
+        _container = Container()
+    return _container
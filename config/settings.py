@@ -26,6 +26,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "src.core.infrastructure.web.middleware.ReplicaStickinessMiddleware",
     "django.middleware.common.CommonMiddleware",
     # CSRF omitido intencionalmente para GraphQL API
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -62,9 +63,55 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD"),
         "HOST": config("DB_HOST"),
         "PORT": config("DB_PORT"),
+        # Persistent connections are per thread: under ASGI the sync_to_async threads come and go and leak them,
+        # so keep 0 there and use DB_POOL_ENABLED; > 0 only for WSGI with a fixed thread count
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=0, cast=int),  # seconds
+        "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
     }
 }
 
+# ===== CONNECTION POOL (psycopg 3) =====
+# Recommended for ASGI deployments (connection reuse across sync_to_async threads without leaking them)
+# Sizing: workers * DB_POOL_MAX_SIZE must stay below Postgres max_connections
+DB_POOL_ENABLED = config("DB_POOL_ENABLED", default=False, cast=bool)
+if DB_POOL_ENABLED:
+    from psycopg_pool import ConnectionPool
+
+    DATABASES["default"]["CONN_MAX_AGE"] = 0  # Django requires it with pooling, the pool owns connection lifetime
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+            "max_lifetime": config("DB_POOL_MAX_LIFETIME", default=1800.0, cast=float),  # seconds
+            "max_idle": config("DB_POOL_MAX_IDLE", default=300.0, cast=float),  # seconds
+            "timeout": config("DB_POOL_TIMEOUT", default=10.0, cast=float),  # seconds to wait for a connection
+            "check": ConnectionPool.check_connection,  # health check on borrow
+        },
+    }
+
+# ===== ASYNC DATABASE DRIVER (psycopg 3) =====
+# Repositories (by table name, or "*") whose reads run on psycopg's async driver instead of the sync ORM in
+# sync_to_async (no thread hop per query). PostgreSQL only; writes stay on the ORM. Each worker opens its own
+# pool next to Django's connections: count it against Postgres max_connections too
+DATABASE_ASYNC_DRIVER_REPOSITORIES = config("DATABASE_ASYNC_DRIVER_REPOSITORIES", default="", cast=Csv())
+DATABASE_ASYNC_POOL_MIN_SIZE = config("DATABASE_ASYNC_POOL_MIN_SIZE", default=1, cast=int)
+DATABASE_ASYNC_POOL_MAX_SIZE = config("DATABASE_ASYNC_POOL_MAX_SIZE", default=10, cast=int)
+DATABASE_ASYNC_POOL_TIMEOUT = config("DATABASE_ASYNC_POOL_TIMEOUT", default=10.0, cast=float)  # seconds to wait for a connection
+
+# ===== READ REPLICAS =====
+# Comma separated host[:port] list; each replica reuses the primary credentials/options.
+# Listing reads (find/count/find_one with criteria) go to a replica unless the request already wrote.
+DATABASE_READ_REPLICAS = []
+for index, replica in enumerate(config("DB_REPLICA_HOSTS", default="", cast=Csv())):
+    replica_host, _, replica_port = replica.partition(":")
+    alias = f"replica_{index + 1}"
+    DATABASES[alias] = {**DATABASES["default"], "HOST": replica_host, "PORT": replica_port or DATABASES["default"]["PORT"], "TEST": {"MIRROR": "default"}}
+    DATABASE_READ_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["src.core.infrastructure.database.routing.PrimaryReplicaRouter"]
+DATABASE_PRIMARY_PIN_COOKIE = config("DB_PRIMARY_PIN_COOKIE", default="db_primary_pin")
+DATABASE_PRIMARY_PIN_SECONDS = config("DB_PRIMARY_PIN_SECONDS", default=5, cast=int)  # >= worst expected replica lag
+
 AUTH_USER_MODEL = "users.UserModel"
 
 # Password validation
@@ -89,6 +136,126 @@ JWT_SECRET_KEY = config("JWT_SECRET_KEY")
 JWT_ACCESS_TOKEN_LIFETIME = config("JWT_ACCESS_TOKEN_LIFETIME", default=60, cast=int)
 JWT_REFRESH_TOKEN_LIFETIME = config("JWT_REFRESH_TOKEN_LIFETIME", default=7, cast=int)
 
+# Stateless access tokens: only refresh sessions are persisted, access tokens are short-lived signed JWTs
+# bound to the refresh session (revoking the refresh session revokes them once they expire)
+JWT_STATELESS_ACCESS_TOKENS = config("JWT_STATELESS_ACCESS_TOKENS", default=False, cast=bool)
+JWT_STATELESS_ACCESS_TOKEN_LIFETIME = config("JWT_STATELESS_ACCESS_TOKEN_LIFETIME", default=5, cast=int)  # minutes
+
+# ===== CACHES =====
+# locmem by default (per process); point CACHE_BACKEND/CACHE_LOCATION at Redis/Memcached to share across workers
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+# Read-through user cache (find_by_id/find_by_email). Local LRU TTL bounds staleness across workers;
+# the optional shared tier (a CACHES alias, e.g. "default") is invalidated on every user write
+USER_CACHE_ENABLED = config("USER_CACHE_ENABLED", default=True, cast=bool)
+USER_CACHE_MAX_SIZE = config("USER_CACHE_MAX_SIZE", default=10000, cast=int)
+USER_CACHE_TTL_SECONDS = config("USER_CACHE_TTL_SECONDS", default=30.0, cast=float)
+USER_CACHE_SHARED_ALIAS = config("USER_CACHE_SHARED_ALIAS", default="")
+USER_CACHE_SHARED_TTL_SECONDS = config("USER_CACHE_SHARED_TTL_SECONDS", default=300.0, cast=float)
+# Emails that matched no user (unknown-account logins skip the database). Kept in the shared tier only, so it
+# needs USER_CACHE_SHARED_ALIAS; creating the user clears the entry for every worker
+USER_NEGATIVE_CACHE_TTL_SECONDS = config("USER_NEGATIVE_CACHE_TTL_SECONDS", default=30.0, cast=float)  # 0 = disabled
+# Token versions checked on every validate/refresh. Staleness window: "log out everywhere" made on another worker
+# is seen after at most this TTL (the worker's local copy expiring); the bumping worker and the shared tier see it at once
+USER_TOKEN_VERSION_CACHE_TTL_SECONDS = config("USER_TOKEN_VERSION_CACHE_TTL_SECONDS", default=5.0, cast=float)
+
+# Session validity cache (validate_session/refresh_access_token lookups by session ID).
+# Staleness window: a logout/revocation made by another worker is seen after at most SESSION_CACHE_TTL_SECONDS
+# (the worker's local copy expiring); the writing worker sees it immediately. The optional shared tier
+# (a CACHES alias) only saves database reads, revocations bump generations there so stale entries are ignored.
+SESSION_CACHE_ENABLED = config("SESSION_CACHE_ENABLED", default=True, cast=bool)
+SESSION_CACHE_MAX_SIZE = config("SESSION_CACHE_MAX_SIZE", default=10000, cast=int)
+SESSION_CACHE_TTL_SECONDS = config("SESSION_CACHE_TTL_SECONDS", default=5.0, cast=float)
+SESSION_CACHE_SHARED_ALIAS = config("SESSION_CACHE_SHARED_ALIAS", default="")
+SESSION_CACHE_SHARED_TTL_SECONDS = config("SESSION_CACHE_SHARED_TTL_SECONDS", default=60.0, cast=float)
+
+# ===== FIND RESULT CACHE =====
+# usersFind/sessionsFind pages cached per normalized criteria, keyed by per-table versions bumped on every write.
+# Writes from other workers are only seen through FIND_CACHE_VERSION_ALIAS (a CACHES alias), otherwise after the TTL
+FIND_CACHE_ENABLED = config("FIND_CACHE_ENABLED", default=True, cast=bool)
+FIND_CACHE_VERSION_ALIAS = config("FIND_CACHE_VERSION_ALIAS", default="")
+USER_FIND_CACHE_TTL_SECONDS = config("USER_FIND_CACHE_TTL_SECONDS", default=10.0, cast=float)  # 0 = disabled
+USER_FIND_CACHE_MAX_SIZE = config("USER_FIND_CACHE_MAX_SIZE", default=256, cast=int)
+SESSION_FIND_CACHE_TTL_SECONDS = config("SESSION_FIND_CACHE_TTL_SECONDS", default=5.0, cast=float)
+SESSION_FIND_CACHE_MAX_SIZE = config("SESSION_FIND_CACHE_MAX_SIZE", default=256, cast=int)
+
+# ===== PASSWORD HASHING EXECUTOR =====
+# Dedicated pool for PBKDF2 hashing/verification so logins never block the ORM thread
+PASSWORD_EXECUTOR_MODE = config("PASSWORD_EXECUTOR_MODE", default="thread")  # thread | process
+PASSWORD_EXECUTOR_WORKERS = config("PASSWORD_EXECUTOR_WORKERS", default=2, cast=int)
+PASSWORD_EXECUTOR_MAX_PENDING = config("PASSWORD_EXECUTOR_MAX_PENDING", default=64, cast=int)
+PASSWORD_EXECUTOR_TIMEOUT = config("PASSWORD_EXECUTOR_TIMEOUT", default=5.0, cast=float)  # seconds
+# Unknown emails still verify against a dummy hash so they take as long as a wrong password for a real user
+AUTH_UNIFORM_LOGIN_TIMING = config("AUTH_UNIFORM_LOGIN_TIMING", default=True, cast=bool)
+
+# Sessions revoked per UPDATE by the bulk revocation mutation (short statements, short locks)
+SESSION_BULK_REVOKE_CHUNK_SIZE = config("SESSION_BULK_REVOKE_CHUNK_SIZE", default=5000, cast=int)
+
+# ===== REVOCATION CHANGELOG =====
+# Logout/revocations append to auth_session_revocations; each worker replays it into an in-memory set so
+# token checks need no session query. Revocations from other workers apply within the poll interval
+SESSION_REVOCATION_LOG_ENABLED = config("SESSION_REVOCATION_LOG_ENABLED", default=True, cast=bool)
+SESSION_REVOCATION_POLL_SECONDS = config("SESSION_REVOCATION_POLL_SECONDS", default=1.0, cast=float)
+SESSION_REVOCATION_USER_TTL_DAYS = config("SESSION_REVOCATION_USER_TTL_DAYS", default=30, cast=int)  # >= longest token lifetime (remember_me refresh)
+
+# ===== EXPIRED SESSION REAPER =====
+SESSION_REAPER_BATCH_SIZE = config("SESSION_REAPER_BATCH_SIZE", default=1000, cast=int)
+SESSION_REAPER_SLEEP_SECONDS = config("SESSION_REAPER_SLEEP_SECONDS", default=0.1, cast=float)  # pause between batches
+SESSION_REAPER_MAX_RUNTIME_SECONDS = config("SESSION_REAPER_MAX_RUNTIME_SECONDS", default=60.0, cast=float)  # 0 = unbounded
+# In-process periodic reaper; otherwise schedule `manage.py reap_sessions`
+SESSION_REAPER_ENABLED = config("SESSION_REAPER_ENABLED", default=False, cast=bool)
+SESSION_REAPER_INTERVAL_SECONDS = config("SESSION_REAPER_INTERVAL_SECONDS", default=300.0, cast=float)
+
+# ===== AUTH SESSION PARTITIONING (PostgreSQL) =====
+# auth_sessions range-partitioned on expires_at; expired partitions are dropped instead of row deletes.
+# PREMAKE future partitions must cover the longest session lifetime (JWT_REFRESH_TOKEN_LIFETIME)
+SESSION_PARTITIONING_ENABLED = config("SESSION_PARTITIONING_ENABLED", default=False, cast=bool)
+SESSION_PARTITION_INTERVAL = config("SESSION_PARTITION_INTERVAL", default="day")  # day | week
+SESSION_PARTITION_PREMAKE = config("SESSION_PARTITION_PREMAKE", default=14, cast=int)  # intervals
+SESSION_PARTITION_RETENTION = config("SESSION_PARTITION_RETENTION", default=1, cast=int)  # expired intervals kept
+SESSION_PARTITION_DROP = config("SESSION_PARTITION_DROP", default=True, cast=bool)  # False = detach only
+
+# ===== CLIENT ADDRESSES =====
+# Reverse proxies in front of the app that append to X-Forwarded-For (0 = clients connect directly, use REMOTE_ADDR).
+# Used for session IPs and rate limiting; never set it higher than the real number of proxies, or clients can spoof it
+TRUSTED_PROXY_COUNT = config("TRUSTED_PROXY_COUNT", default=0, cast=int)
+
+# ===== GRAPHQL DOCUMENTS =====
+# Parsed/validated documents are cached by query text (LRU); persisted queries (APQ) let clients send only a sha256 hash
+GRAPHQL_DOCUMENT_CACHE_SIZE = config("GRAPHQL_DOCUMENT_CACHE_SIZE", default=1000, cast=int)
+GRAPHQL_PERSISTED_QUERIES_ENABLED = config("GRAPHQL_PERSISTED_QUERIES_ENABLED", default=True, cast=bool)
+GRAPHQL_PERSISTED_QUERIES_CACHE_SIZE = config("GRAPHQL_PERSISTED_QUERIES_CACHE_SIZE", default=1000, cast=int)
+GRAPHQL_PERSISTED_QUERIES_TTL_SECONDS = config("GRAPHQL_PERSISTED_QUERIES_TTL_SECONDS", default=86400.0, cast=float)
+# JSON file {"<sha256>": "<query>"}; with GRAPHQL_PERSISTED_QUERIES_ONLY, only these documents are executed
+GRAPHQL_PERSISTED_QUERIES_MANIFEST = config("GRAPHQL_PERSISTED_QUERIES_MANIFEST", default="")
+GRAPHQL_PERSISTED_QUERIES_ONLY = config("GRAPHQL_PERSISTED_QUERIES_ONLY", default=False, cast=bool)
+
+# ===== GRAPHQL COST LIMITS =====
+# Static cost per operation (field weights x criteria limit, + filters), checked before execution
+GRAPHQL_COST_LIMITS_ENABLED = config("GRAPHQL_COST_LIMITS_ENABLED", default=True, cast=bool)
+GRAPHQL_MAX_QUERY_COST = config("GRAPHQL_MAX_QUERY_COST", default=10000, cast=int)
+GRAPHQL_MAX_QUERY_DEPTH = config("GRAPHQL_MAX_QUERY_DEPTH", default=10, cast=int)
+GRAPHQL_MAX_FILTER_DEPTH = config("GRAPHQL_MAX_FILTER_DEPTH", default=4, cast=int)  # nestedFilters levels
+GRAPHQL_COST_UNBOUNDED_LIST_SIZE = config("GRAPHQL_COST_UNBOUNDED_LIST_SIZE", default=1000, cast=int)  # items assumed for a criteria without limit
+GRAPHQL_COST_DEFAULT_LIST_SIZE = config("GRAPHQL_COST_DEFAULT_LIST_SIZE", default=20, cast=int)  # items assumed for relationship lists
+# Per-client token buckets charged by cost (authenticated user, else client address); capacity must stay >= GRAPHQL_MAX_QUERY_COST.
+# Off until configured: behind a proxy set TRUSTED_PROXY_COUNT first, and buckets are per worker process
+GRAPHQL_RATE_LIMIT_ENABLED = config("GRAPHQL_RATE_LIMIT_ENABLED", default=False, cast=bool)
+GRAPHQL_RATE_LIMIT_CAPACITY = config("GRAPHQL_RATE_LIMIT_CAPACITY", default=20000, cast=float)
+GRAPHQL_RATE_LIMIT_REFILL_PER_SECOND = config("GRAPHQL_RATE_LIMIT_REFILL_PER_SECOND", default=2000, cast=float)
+GRAPHQL_RATE_LIMIT_MAX_CLIENTS = config("GRAPHQL_RATE_LIMIT_MAX_CLIENTS", default=100000, cast=int)
+
+# ===== GRAPHQL BATCHING =====
+# POST /graphql/ with a JSON array runs the queries concurrently and the mutations one at a time in array order, with shared
+# DataLoaders; each operation is still cost-limited on its own
+GRAPHQL_BATCH_ENABLED = config("GRAPHQL_BATCH_ENABLED", default=True, cast=bool)
+GRAPHQL_BATCH_MAX_SIZE = config("GRAPHQL_BATCH_MAX_SIZE", default=10, cast=int)
+
 # ===== CONFIGURACIÓN CORS PARA API =====
 CORS_ALLOW_ALL_ORIGINS = True  # Solo para desarrollo
 CORS_ALLOW_CREDENTIALS = True
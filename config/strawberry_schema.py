@@ -1,5 +1,9 @@
 # config/strawberry_schema.py
 import strawberry
+from django.conf import settings
+from strawberry.extensions import ParserCache, ValidationCache
+
+from src.core.infrastructure.web.strawberry.query_cost import QueryCostLimiter
 
 from src.feature.users.infrastructure.graphql.user_resolvers import UserQueries, UserMutations
 from src.feature.sessions.infrastructure.graphql.auth_resolvers import AuthQueries, AuthMutations
@@ -20,5 +24,7 @@ class Mutation(UserMutations, AuthMutations):
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    # Repeated documents (persisted or not) skip parsing and validation; QueryCostLimiter is a class: one instance per operation
+    extensions=[ParserCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE), ValidationCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE), QueryCostLimiter],
 )
 
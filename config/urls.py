@@ -1,10 +1,14 @@
 from django.contrib import admin
 from django.urls import path
-from strawberry.django.views import AsyncGraphQLView
 
+from src.core.infrastructure.metrics.views import metrics_view
+
+from .container import get_container
 from .strawberry_schema import schema
+from .views import GraphQLView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("graphql/", AsyncGraphQLView.as_view(schema=schema)),
+    path("graphql/", GraphQLView.as_view(schema=schema, container=get_container())),
+    path("metrics/", metrics_view),
 ]
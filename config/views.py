@@ -0,0 +1,161 @@
+# config/views.py
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from graphql import DocumentNode, GraphQLError, parse
+from graphql.utilities import get_operation_ast
+from strawberry.django.views import AsyncGraphQLView
+from strawberry.exceptions import MissingQueryError
+from strawberry.extensions import ParserCache
+from strawberry.http.exceptions import HTTPException
+from strawberry.schema.exceptions import InvalidOperationTypeError
+from strawberry.types import ExecutionResult
+from strawberry.types.graphql import OperationType
+
+from src.core.infrastructure.web.strawberry.persisted_queries import PersistedQueryError, PersistedQueryStore, get_persisted_queries
+
+from .container import Container, GraphQLContext, get_container
+
+
+@dataclass
+class BatchExecutionResult:
+    results: List[ExecutionResult]
+
+    @property
+    def errors(self) -> Optional[List[GraphQLError]]:
+        # Read by the base view to report errors (Sentry hook)
+        return [error for result in self.results for error in result.errors or []] or None
+
+
+class GraphQLView(AsyncGraphQLView):
+    # Every operation gets the application-scoped container in info.context instead of building its own dependencies
+    container: Optional[Container] = None
+    persisted_queries: Optional[PersistedQueryStore] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Django builds one view instance per request: extensions of the request being parsed
+        self._request_extensions: Optional[Dict[str, Any]] = None
+
+    async def get_context(self, request, response) -> GraphQLContext:
+        return (self.container or get_container()).context(request, response)
+
+    # ===== PERSISTED QUERIES =====
+    def parse_json(self, data) -> Any:
+        body = super().parse_json(data)
+        if isinstance(body, dict):
+            self._request_extensions = body.get("extensions")
+        return body
+
+    def parse_query_params(self, params) -> Dict[str, Any]:
+        params = super().parse_query_params(params)
+        extensions = params.get("extensions")
+        self._request_extensions = super().parse_json(extensions) if isinstance(extensions, str) else extensions
+        return params
+
+    async def parse_http_body(self, request):
+        request_data = await super().parse_http_body(request)
+        request_data.query = self.resolve_query(request_data.query, self._request_extensions)
+        return request_data
+
+    def resolve_query(self, query: Optional[str], extensions: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+            return query
+        return (self.persisted_queries or get_persisted_queries()).resolve(query, extensions)
+
+    async def execute_operation(self, request, context, root_value):
+        if self.is_batch(request):
+            return await self.execute_batch(request, context, root_value)
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as error:
+            return self._error_result(error.message, error.code)
+
+    # ===== BATCHING =====
+    @staticmethod
+    def is_batch(request) -> bool:
+        return request.method == "POST" and request.content_type == "application/json" and request.body.lstrip()[:1] == b"["
+
+    async def execute_batch(self, request, context, root_value) -> BatchExecutionResult:
+        """
+        A JSON array of operations. Queries run concurrently on the event loop; mutations run one at a
+        time in array order, each starting after the previous one finished, so a later mutation can rely
+        on an earlier one. Queries are not ordered against the mutations: one that must see a mutation's
+        effect belongs in a later request. All entries share the request context, so one set of
+        DataLoaders batches and memoizes across them (a user loaded by one operation is not fetched
+        again by another).
+        """
+        if not settings.GRAPHQL_BATCH_ENABLED:
+            raise HTTPException(400, "Batched operations are not supported")
+        try:
+            operations = json.loads(request.body)
+        except json.JSONDecodeError as error:
+            raise HTTPException(400, "Unable to parse request body as JSON") from error
+        if not operations or not all(isinstance(operation, dict) for operation in operations):
+            raise HTTPException(400, "A batch must be a non-empty array of operations")
+        if len(operations) > settings.GRAPHQL_BATCH_MAX_SIZE:
+            raise HTTPException(400, f"Batch of {len(operations)} operations exceeds the maximum of {settings.GRAPHQL_BATCH_MAX_SIZE}")
+
+        queries = [self._batched_query(operation) for operation in operations]
+        results: List[Optional[ExecutionResult]] = [None] * len(operations)
+
+        async def run(indexes: List[int]):
+            for index in indexes:
+                query, error_result = queries[index]
+                results[index] = error_result or await self._execute_batched(query, operations[index], context, root_value)
+
+        mutations = [index for index, (query, _) in enumerate(queries) if self._is_mutation(query, operations[index].get("operationName"))]
+        mutation_indexes = set(mutations)
+        # One task runs the mutations in array order, every other entry gets its own
+        await asyncio.gather(run(mutations), *(run([index]) for index in range(len(operations)) if index not in mutation_indexes))
+        return BatchExecutionResult(results=results)
+
+    def _batched_query(self, operation: Dict[str, Any]) -> Tuple[Optional[str], Optional[ExecutionResult]]:
+        # (query, None), or (None, error result) when its persisted query cannot be resolved
+        try:
+            return self.resolve_query(operation.get("query"), operation.get("extensions")), None
+        except PersistedQueryError as error:
+            return None, self._error_result(error.message, error.code)
+
+    def _is_mutation(self, query: Optional[str], operation_name: Optional[str]) -> bool:
+        # Unparsable entries are left to schema.execute to report
+        try:
+            operation = get_operation_ast(self._parse(query), operation_name) if query else None
+        except GraphQLError:
+            return False
+        return operation is not None and operation.operation.value == OperationType.MUTATION.value
+
+    def _parse(self, query: str) -> DocumentNode:
+        # Through the schema's ParserCache: executing the entry afterwards reuses this parse
+        for extension in self.schema.extensions:
+            if isinstance(extension, ParserCache):
+                return extension.cached_parse_document(query)
+        return parse(query)
+
+    async def _execute_batched(self, query: Optional[str], operation: Dict[str, Any], context, root_value) -> ExecutionResult:
+        # Errors stay with their operation: one bad entry does not fail the whole batch
+        try:
+            return await self.schema.execute(
+                query,
+                root_value=root_value,
+                variable_values=operation.get("variables"),
+                context_value=context,
+                operation_name=operation.get("operationName"),
+                allowed_operation_types=OperationType.from_http("POST"),
+            )
+        except MissingQueryError:
+            return self._error_result("No GraphQL query found in the request", "MISSING_QUERY")
+        except InvalidOperationTypeError as error:
+            return self._error_result(f"{error.as_http_error_reason('POST')} in a batch", "INVALID_OPERATION_TYPE")
+
+    async def process_result(self, request, result):
+        if isinstance(result, BatchExecutionResult):
+            return [await super(GraphQLView, self).process_result(request, item) for item in result.results]
+        return await super().process_result(request, result)
+
+    @staticmethod
+    def _error_result(message: str, code: str) -> ExecutionResult:
+        return ExecutionResult(data=None, errors=[GraphQLError(message, extensions={"code": code})])
@@ -1,12 +1,15 @@
 # src/core/application/use_cases/base_crud_use_cases.py
-from typing import List, Optional, Tuple, TypeVar, Generic
+import copy
+from typing import List, Optional, TypeVar, Generic
 from uuid import UUID
+from django.conf import settings
 
 from src.core.domain.entities.base_entity import BaseEntity
 from src.core.domain.repositories.base_repository import BaseRepository
 from src.core.exceptions.base_exceptions import NotFoundError
+from src.core.infrastructure.cache.find_cache import get_find_cache
 from src.shared.criteria.prepare import PrepareFind, PrepareFindOne
-from src.shared.criteria.base_criteria import Criteria
+from src.shared.criteria.pagination import Page
 
 T = TypeVar("T", bound=BaseEntity)
 
@@ -16,17 +19,25 @@ class BaseCrudUseCases(Generic[T]):
         self.repository = repository
         self.entity_name = entity_name
 
-    async def find_with_criteria(self, prepare: PrepareFind) -> Tuple[List[T], int]:
-        entities = await self.repository.find_with_criteria(prepare.criteria)
-
-        count_criteria = Criteria(
-            filters=prepare.criteria.filters,
-            orders=prepare.criteria.orders,
-            projection=prepare.criteria.projection,
-            options=prepare.criteria.options,
-        )
-        total_count = await self.repository.count_with_criteria(count_criteria)
-        return entities, total_count
+    async def find_with_criteria(self, prepare: PrepareFind) -> Page[T]:
+        # Total count comes from the same query (or an estimate) according to criteria.options.count_mode
+        policy = prepare.cache
+        version = await self.repository.data_version() if policy is not None and settings.FIND_CACHE_ENABLED else None
+        if version is None:
+            return await self.repository.find_page_with_criteria(prepare.criteria)
+
+        # Keyed by the table version read before the query: a write during it makes the entry unreachable
+        cache = get_find_cache().namespace(policy.namespace, max_size=policy.max_size, ttl_seconds=policy.ttl_seconds)
+        key = (version, prepare.criteria.fingerprint())
+        page = cache.get(key)
+        if page is None:
+            page = await self.repository.find_page_with_criteria(prepare.criteria)
+            cache.set(key, copy.deepcopy(page))
+            return page
+        return copy.deepcopy(page)
+
+    async def find_by_ids(self, entity_ids: List[UUID]) -> List[T]:
+        return await self.repository.find_by_ids(entity_ids)
 
     async def find_one_with_criteria(self, prepare: PrepareFindOne) -> Optional[T]:
         return await self.repository.find_one_with_criteria(prepare.criteria)
@@ -1,7 +1,7 @@
 from abc import ABC
 from datetime import datetime, timezone
 from uuid import uuid4, UUID
-from typing import Optional
+from typing import Optional, Set
 
 
 class BaseEntity(ABC):
@@ -11,10 +11,30 @@ class BaseEntity(ABC):
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
+        # Persistence state: new entities are INSERTed, loaded ones only UPDATE their changed fields
+        object.__setattr__(self, "_is_new", True)
+        object.__setattr__(self, "_dirty_fields", set())
         self.id = id or uuid4()
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
 
+    def __setattr__(self, name, value):
+        if not name.startswith("_"):
+            self.__dict__.setdefault("_dirty_fields", set()).add(name)
+        super().__setattr__(name, value)
+
+    @property
+    def is_new(self) -> bool:
+        return self.__dict__.get("_is_new", True)
+
+    @property
+    def dirty_fields(self) -> Set[str]:
+        return set(self.__dict__.get("_dirty_fields", ()))
+
+    def mark_persisted(self):
+        object.__setattr__(self, "_is_new", False)
+        object.__setattr__(self, "_dirty_fields", set())
+
     def update_timestamp(self):
         self.updated_at = datetime.now(timezone.utc)
 
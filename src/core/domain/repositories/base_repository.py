@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, TypeVar, Generic
+from typing import Hashable, Optional, List, TypeVar, Generic
 from uuid import UUID
 
 from src.core.domain.entities.base_entity import BaseEntity
+from src.shared.criteria.pagination import Page
 
 T = TypeVar("T", bound=BaseEntity)
 
@@ -12,10 +13,18 @@ class BaseRepository(ABC, Generic[T]):
     async def save(self, entity: T) -> T:
         pass
 
+    @abstractmethod
+    async def save_many(self, entities: List[T]) -> List[T]:
+        pass
+
     @abstractmethod
     async def find_by_id(self, entity_id: UUID) -> Optional[T]:
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, entity_ids: List[UUID]) -> List[T]:
+        pass
+
     @abstractmethod
     async def delete(self, entity_id: UUID) -> bool:
         pass
@@ -28,6 +37,10 @@ class BaseRepository(ABC, Generic[T]):
     async def find_with_criteria(self, criteria) -> List[T]:
         pass
 
+    @abstractmethod
+    async def find_page_with_criteria(self, criteria) -> Page[T]:
+        pass
+
     @abstractmethod
     async def find_one_with_criteria(self, criteria) -> Optional[T]:
         pass
@@ -35,3 +48,7 @@ class BaseRepository(ABC, Generic[T]):
     @abstractmethod
     async def count_with_criteria(self, criteria) -> int:
         pass
+
+    async def data_version(self) -> Optional[Hashable]:
+        # Changes on every write to the underlying data; None means results must not be cached
+        return None
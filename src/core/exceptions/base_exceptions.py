@@ -28,3 +28,7 @@ class ConflictError(BaseDomainException):
 
 class UnauthorizedError(BaseDomainException):
     pass
+
+
+class ServiceUnavailableError(BaseDomainException):
+    pass
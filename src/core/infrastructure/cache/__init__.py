@@ -0,0 +1,6 @@
+from .ttl_cache import TTLCache
+from .shared_tier import LockedCounters, SharedTier, invalidated_since
+from .table_versions import TableVersions, get_table_versions
+from .find_cache import FindResultCache, get_find_cache
+
+__all__ = ["TTLCache", "SharedTier", "LockedCounters", "invalidated_since", "TableVersions", "get_table_versions", "FindResultCache", "get_find_cache"]
@@ -0,0 +1,38 @@
+# src/core/infrastructure/cache/find_cache.py
+import threading
+from typing import Any, Dict, Optional
+
+from src.core.infrastructure.cache.ttl_cache import TTLCache
+from src.core.infrastructure.metrics.registry import metrics_registry
+
+
+class FindResultCache:
+    # One bounded TTL cache per feature, sized/aged by that feature's CriteriaServiceHelper
+    def __init__(self):
+        self._namespaces: Dict[str, TTLCache] = {}
+        self._lock = threading.Lock()
+
+    def namespace(self, name: str, max_size: int, ttl_seconds: float) -> TTLCache:
+        cache = self._namespaces.get(name)
+        if cache is None:
+            with self._lock:
+                cache = self._namespaces.setdefault(name, TTLCache(max_size=max_size, ttl_seconds=ttl_seconds))
+        return cache
+
+    def clear(self):
+        for cache in list(self._namespaces.values()):
+            cache.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: cache.snapshot() for name, cache in list(self._namespaces.items())}
+
+
+_find_cache: Optional[FindResultCache] = None
+
+
+def get_find_cache() -> FindResultCache:
+    global _find_cache
+    if _find_cache is None:
+        _find_cache = FindResultCache()
+        metrics_registry.register("find_cache", _find_cache.snapshot)
+    return _find_cache
@@ -0,0 +1,90 @@
+# src/core/infrastructure/cache/shared_tier.py
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# Cache fills that started before a shared-tier invalidation mark (within this margin of clock skew between workers) are dropped
+INVALIDATION_MARK_SECONDS = 60.0
+CLOCK_SKEW_SECONDS = 1.0
+
+
+def invalidated_since(invalidated_at: Optional[float], started_at: float) -> bool:
+    return invalidated_at is not None and invalidated_at >= started_at - CLOCK_SKEW_SECONDS
+
+
+class SharedTier:
+    """
+    Async access to a Django cache alias shared by every worker, for the caches layered over the database.
+
+    The shared tier is an optimisation, never a dependency: an unavailable backend degrades to the local
+    tier + database. Every call logs and counts the failure and returns None (or the default) instead of
+    failing the request.
+    """
+
+    def __init__(self, alias: Optional[str], name: str):
+        self.alias = alias or None
+        self.name = name
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.alias is not None
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        value = await self._call("aget", key, default)
+        return default if value is None else value
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        return await self._call("aget_many", list(keys)) or {}
+
+    async def set(self, key: str, value: Any, timeout: Optional[float]):
+        await self._call("aset", key, value, timeout=timeout)
+
+    async def set_many(self, values: Dict[str, Any], timeout: Optional[float]):
+        await self._call("aset_many", values, timeout=timeout)
+
+    async def add(self, key: str, value: Any, timeout: Optional[float]) -> bool:
+        return bool(await self._call("aadd", key, value, timeout=timeout))
+
+    async def incr(self, key: str) -> Optional[int]:
+        # None when the key is missing (evicted or expired) or the backend failed
+        try:
+            return await caches[self.alias].aincr(key)
+        except ValueError:
+            return None
+        except Exception:
+            self._failed("aincr")
+            return None
+
+    async def delete(self, key: str):
+        await self._call("adelete", key)
+
+    async def delete_many(self, keys: Iterable[str]):
+        await self._call("adelete_many", list(keys))
+
+    async def _call(self, method: str, *args, **kwargs):
+        try:
+            return await getattr(caches[self.alias], method)(*args, **kwargs)
+        except Exception:
+            self._failed(method)
+            return None
+
+    def _failed(self, method: str):
+        with self._lock:
+            self.errors += 1
+        logger.warning("%s: shared tier '%s' %s failed", self.name, self.alias, method, exc_info=True)
+
+
+class LockedCounters:
+    """Thread-safe increments of integer metric attributes; subclasses set self._lock."""
+
+    _lock: threading.Lock
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
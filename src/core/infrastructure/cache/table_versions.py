@@ -0,0 +1,56 @@
+# src/core/infrastructure/cache/table_versions.py
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+
+from src.core.infrastructure.metrics.registry import metrics_registry
+from .shared_tier import SharedTier
+
+
+class TableVersions:
+    """
+    Monotonic per-table data versions, bumped by repositories after every write. Cached query results
+    are keyed by the version they were read at, so a write makes them unreachable instead of deleting them.
+
+    The local counter covers writes made by this process; with a shared alias the counter is mirrored
+    in a Django cache so writes from other workers change the version too. Without one, other workers'
+    writes only show up once the cached result's TTL runs out.
+    """
+
+    def __init__(self, shared_alias: Optional[str] = None):
+        self.shared = SharedTier(shared_alias, "Table versions")
+        self._local: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.bumps = 0
+
+    @staticmethod
+    def shared_key(table: str) -> str:
+        return f"table_version:{table}"
+
+    async def get(self, table: str) -> Tuple[int, int]:
+        shared = await self.shared.get(self.shared_key(table), 0) if self.shared.enabled else 0
+        return self._local.get(table, 0), shared
+
+    async def bump(self, table: str):
+        with self._lock:
+            self._local[table] = self._local.get(table, 0) + 1
+            self.bumps += 1
+        if self.shared.enabled:
+            key = self.shared_key(table)
+            await self.shared.add(key, 0, timeout=None)
+            await self.shared.incr(key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"tables": dict(self._local), "bumps": self.bumps, "shared_alias": self.shared.alias, "shared_errors": self.shared.errors}
+
+
+_table_versions: Optional[TableVersions] = None
+
+
+def get_table_versions() -> TableVersions:
+    global _table_versions
+    if _table_versions is None:
+        _table_versions = TableVersions(shared_alias=settings.FIND_CACHE_VERSION_ALIAS)
+        metrics_registry.register("table_versions", _table_versions.snapshot)
+    return _table_versions
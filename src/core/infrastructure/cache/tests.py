@@ -0,0 +1,33 @@
+# src/core/infrastructure/cache/tests.py
+import asyncio
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from src.core.infrastructure.cache.shared_tier import SharedTier
+
+
+class SharedTierTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_unavailable_backend_degrades_to_defaults(self):
+        shared = SharedTier("missing-alias", "Test cache")
+
+        async def calls():
+            return await shared.get("key", 0), await shared.get_many(["key"]), await shared.add("key", 1, timeout=None)
+
+        with self.assertLogs("src.core.infrastructure.cache.shared_tier", "WARNING"):
+            self.assertEqual(asyncio.run(calls()), (0, {}, False))
+        self.assertEqual(shared.errors, 3)
+
+    def test_incr_of_a_missing_key_is_not_an_error(self):
+        shared = SharedTier("default", "Test cache")
+
+        async def calls():
+            missing = await shared.incr("counter")
+            await shared.add("counter", 0, timeout=None)
+            return missing, await shared.incr("counter")
+
+        self.assertEqual(asyncio.run(calls()), (None, 1))
+        self.assertEqual(shared.errors, 0)
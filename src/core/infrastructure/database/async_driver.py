@@ -0,0 +1,153 @@
+# src/core/infrastructure/database/async_driver.py
+import asyncio
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, models
+from django.db.models import QuerySet
+from django.db.models.query import MAX_GET_RESULTS, ModelIterable
+
+from src.core.infrastructure.metrics.registry import metrics_registry
+
+
+class AsyncPsycopgReader:
+    """
+    Read path for repositories that runs on psycopg's async driver instead of the sync ORM in sync_to_async.
+
+    The queryset is still built and compiled by Django, and rows become model instances through the
+    compiler's converters exactly like ModelIterable does; only the round trip is async, on a per event
+    loop psycopg AsyncConnectionPool, so a query costs no thread hop and concurrent reads do not queue
+    behind the single thread_sensitive ORM thread.
+
+    Connections run in autocommit: reads see every committed write, but never the uncommitted state of
+    an ORM transaction. PostgreSQL only; other querysets (values(), select_related, prefetch_related,
+    other backends) stay on the ORM.
+    """
+
+    def __init__(self, min_size: int = 1, max_size: int = 10, timeout: float = 10.0):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        # Pools are bound to the event loop that opened them
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = weakref.WeakKeyDictionary()
+        self.queries = 0
+
+    @staticmethod
+    def supports(queryset: QuerySet) -> bool:
+        return (
+            queryset._iterable_class is ModelIterable
+            and not queryset._prefetch_related_lookups
+            and not queryset.query.select_related
+            and connections[queryset.db].vendor == "postgresql"
+        )
+
+    # ===== QUERIES =====
+    async def fetch_models(self, queryset: QuerySet) -> List[models.Model]:
+        compiler = queryset.query.get_compiler(using=queryset.db)
+        try:
+            sql, params = compiler.as_sql()
+        except EmptyResultSet:
+            return []
+        rows = await self._fetch(queryset.db, sql, params)
+        if compiler.has_extra_select:
+            rows = [row[: compiler.col_count] for row in rows]
+
+        # Same row -> instance mapping as ModelIterable (no related populators: select_related is unsupported)
+        select, klass_info, annotation_col_map = compiler.select, compiler.klass_info, compiler.annotation_col_map
+        model_fields_start, model_fields_end = klass_info["select_fields"][0], klass_info["select_fields"][-1] + 1
+        init_list = [column[0].target.attname for column in select[model_fields_start:model_fields_end]]
+        instances = []
+        for row in compiler.results_iter([rows]):
+            instance = klass_info["model"].from_db(queryset.db, init_list, row[model_fields_start:model_fields_end])
+            for attr_name, column_position in (annotation_col_map or {}).items():
+                setattr(instance, attr_name, row[column_position])
+            instances.append(instance)
+        return instances
+
+    async def get(self, queryset: QuerySet, **lookup) -> models.Model:
+        # QuerySet.get semantics: DoesNotExist / MultipleObjectsReturned
+        clone = queryset.filter(**lookup) if lookup else queryset
+        if not clone.query.is_sliced:
+            clone = clone.order_by()[:MAX_GET_RESULTS]
+        instances = await self.fetch_models(clone)
+        if len(instances) == 1:
+            return instances[0]
+        if not instances:
+            raise queryset.model.DoesNotExist(f"{queryset.model._meta.object_name} matching query does not exist.")
+        raise queryset.model.MultipleObjectsReturned(f"get() returned more than one {queryset.model._meta.object_name}")
+
+    async def first(self, queryset: QuerySet) -> Optional[models.Model]:
+        ordered = queryset if queryset.ordered else queryset.order_by("pk")
+        instances = await self.fetch_models(ordered[:1])
+        return instances[0] if instances else None
+
+    async def count(self, queryset: QuerySet) -> int:
+        inner = queryset.order_by().values("pk").query.get_compiler(using=queryset.db)
+        try:
+            sql, params = inner.as_sql()
+        except EmptyResultSet:
+            return 0
+        rows = await self._fetch(queryset.db, f"SELECT COUNT(*) FROM ({sql}) subquery", params)
+        return rows[0][0]
+
+    async def exists(self, queryset: QuerySet) -> bool:
+        try:
+            sql, params = queryset.query.exists().get_compiler(using=queryset.db).as_sql()
+        except EmptyResultSet:
+            return False
+        return bool(await self._fetch(queryset.db, sql, params))
+
+    # ===== CONNECTIONS =====
+    async def _fetch(self, alias: str, sql: str, params: Sequence[Any]) -> List[Tuple]:
+        pool = await self._pool(alias)
+        self.queries += 1
+        async with pool.connection() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(sql, params)
+                return await cursor.fetchall()
+
+    async def _pool(self, alias: str):
+        # One pool per database alias and event loop; concurrent first queries wait on the same opening
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        opening = pools.get(alias)
+        if opening is None:
+            opening = pools[alias] = asyncio.ensure_future(self._open_pool(alias))
+        return await opening
+
+    async def _open_pool(self, alias: str):
+        import psycopg
+        from psycopg_pool import AsyncConnectionPool
+
+        # Django's own connection parameters: same server, credentials and type adapters (inet as text, tz-aware timestamps)
+        params = connections[alias].get_connection_params()
+        params.pop("cursor_factory", None)
+        # Client-side binding, like Django's psycopg cursor: the compiled SQL uses %s placeholders throughout
+        pool = AsyncConnectionPool(kwargs={**params, "autocommit": True, "cursor_factory": psycopg.AsyncClientCursor}, min_size=self.min_size, max_size=self.max_size, timeout=self.timeout, open=False, name=f"async-reader-{alias}")
+        await pool.open()
+        return pool
+
+    async def close(self):
+        # Closes the pools of the running event loop (management commands running several loops call it before each ends)
+        for opening in self._pools.pop(asyncio.get_running_loop(), {}).values():
+            await (await opening).close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"queries": self.queries, "min_size": self.min_size, "max_size": self.max_size, "loops": len(self._pools)}
+
+
+def uses_async_driver(model_class) -> bool:
+    enabled = settings.DATABASE_ASYNC_DRIVER_REPOSITORIES
+    return "*" in enabled or model_class._meta.db_table in enabled
+
+
+_async_reader: Optional[AsyncPsycopgReader] = None
+
+
+def get_async_reader() -> AsyncPsycopgReader:
+    global _async_reader
+    if _async_reader is None:
+        _async_reader = AsyncPsycopgReader(min_size=settings.DATABASE_ASYNC_POOL_MIN_SIZE, max_size=settings.DATABASE_ASYNC_POOL_MAX_SIZE, timeout=settings.DATABASE_ASYNC_POOL_TIMEOUT)
+        metrics_registry.register("async_reader", _async_reader.snapshot)
+    return _async_reader
@@ -8,7 +8,23 @@ T = TypeVar("T", bound=BaseEntity)
 M = TypeVar("M", bound=models.Model)
 
 
+class LoadedColumns:
+    # Read-only view of a partially loaded model (QuerySet.only): deferred columns read as None
+    # instead of lazily issuing one query per row
+    def __init__(self, model: models.Model, deferred: set):
+        self._model = model
+        self._deferred = deferred
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._deferred:
+            return None
+        return getattr(self._model, name)
+
+
 class BaseEntityMapper(ABC, Generic[T, M]):
+    # Entity attribute -> model columns it is persisted to, only when they differ
+    field_columns: Dict[str, List[str]] = {}
+
     @abstractmethod
     def model_to_entity(self, model: M) -> T:
         pass
@@ -17,8 +33,22 @@ class BaseEntityMapper(ABC, Generic[T, M]):
     def entity_to_model_data(self, entity: T) -> Dict[str, Any]:
         pass
 
+    def to_entity(self, model: M) -> T:
+        deferred = model.get_deferred_fields()
+        entity = self.model_to_entity(LoadedColumns(model, deferred) if deferred else model)
+        entity.mark_persisted()
+        return entity
+
+    def changed_model_data(self, entity: T) -> Dict[str, Any]:
+        columns = set()
+        for field in entity.dirty_fields:
+            columns.update(self.field_columns.get(field, [field]))
+
+        data = self.entity_to_model_data(entity)
+        return {key: value for key, value in data.items() if key in columns}
+
     def models_to_entities(self, models: List[M]) -> List[T]:
-        return [self.model_to_entity(model) for model in models]
+        return [self.to_entity(model) for model in models]
 
     def entities_to_model_data_list(self, entities: List[T]) -> List[Dict[str, Any]]:
         return [self.entity_to_model_data(entity) for entity in entities]
@@ -0,0 +1,41 @@
+# src/core/infrastructure/database/pool_metrics.py
+from typing import Any, Dict
+
+from django.db import connections
+
+from src.core.infrastructure.metrics.registry import metrics_registry
+
+
+def database_pool_snapshot(alias: str = "default") -> Dict[str, Any]:
+    connection = connections[alias]
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return {"enabled": False, "conn_max_age": connection.settings_dict.get("CONN_MAX_AGE"), "health_checks": connection.settings_dict.get("CONN_HEALTH_CHECKS")}
+
+    # psycopg_pool counters are cumulative since the pool was opened
+    stats = pool.get_stats()
+    pool_size = stats.get("pool_size", 0)
+    idle = stats.get("pool_available", 0)
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        "enabled": True,
+        "min_size": stats.get("pool_min", pool.min_size),
+        "max_size": stats.get("pool_max", pool.max_size),
+        "size": pool_size,
+        "in_use": pool_size - idle,
+        "idle": idle,
+        "waiting": stats.get("requests_waiting", 0),
+        "checkouts": requests,
+        "checkout_wait_ms_total": wait_ms,
+        "checkout_wait_ms_avg": round(wait_ms / requests, 3) if requests else 0.0,
+        "checkout_timeouts": stats.get("requests_errors", 0),
+        "connections_opened": stats.get("connections_num", 0),
+        "connections_lost": stats.get("connections_lost", 0),  # discarded by the health check on borrow
+        "connection_errors": stats.get("connections_errors", 0),
+    }
+
+
+def register_database_pool_metrics():
+    for alias in connections:
+        metrics_registry.register(f"database_pool.{alias}", lambda alias=alias: database_pool_snapshot(alias))
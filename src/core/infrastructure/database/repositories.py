@@ -1,58 +1,129 @@
 # ===== 1. FIXED CORE REPOSITORY (src/core/infrastructure/database/repositories.py) =====
+import json
+from copy import copy
 from typing import Type, Optional, List, Dict, Any, TypeVar
 from uuid import UUID
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import Count, QuerySet, Window
 from django.core.exceptions import ObjectDoesNotExist
 from asgiref.sync import sync_to_async
 from src.core.domain.entities.base_entity import BaseEntity
 from src.core.domain.repositories.base_repository import BaseRepository
 from src.core.infrastructure.database.mappers.base_mapper import BaseEntityMapper
+from src.core.infrastructure.cache.table_versions import get_table_versions
+from src.core.infrastructure.database.async_driver import AsyncPsycopgReader, get_async_reader, uses_async_driver
+from src.core.infrastructure.database.routing import pin_to_primary, read_database
+from src.shared.criteria.pagination import Page
 
 T = TypeVar("T", bound=BaseEntity)
 
+TOTAL_COUNT_ANNOTATION = "criteria_total_count"
+
 
 class DjangoBaseRepository(BaseRepository[T]):
-    def __init__(self, model_class: Type[models.Model], mapper: BaseEntityMapper[T, models.Model]):
+    def __init__(self, model_class: Type[models.Model], mapper: BaseEntityMapper[T, models.Model], async_driver: Optional[bool] = None):
         self.model_class = model_class
         self.mapper = mapper
+        # Reads on the async psycopg driver (DATABASE_ASYNC_DRIVER_REPOSITORIES) or the sync ORM in sync_to_async
+        self.async_reader: Optional[AsyncPsycopgReader] = get_async_reader() if (uses_async_driver(model_class) if async_driver is None else async_driver) else None
 
     # ===== CORE OPERATIONS =====
     async def save(self, entity: T) -> T:
-        data = self.mapper.entity_to_model_data(entity)
-        model, _ = await sync_to_async(self.model_class.objects.update_or_create)(id=entity.id, defaults=data)
-        return self.mapper.model_to_entity(model)
+        # No pre-read: new entities are a bare INSERT, loaded ones an UPDATE of their changed columns
+        if entity.is_new:
+            return await self._insert(entity)
+        return await self._update(entity)
+
+    async def save_many(self, entities: List[T]) -> List[T]:
+        # New entities go out as one multi-row INSERT; everything runs in a single transaction
+        if not entities:
+            return []
+        pin_to_primary()
+        saved = await sync_to_async(self._save_many_sync)(entities)
+        await self._data_changed()
+        return saved
 
     async def find_by_id(self, entity_id: UUID) -> Optional[T]:
         try:
-            model = await sync_to_async(self.model_class.objects.get)(id=entity_id)
-            return self.mapper.model_to_entity(model)
+            model = await self._query_get(self.model_class.objects.all(), id=entity_id)
+            return self.mapper.to_entity(model)
         except ObjectDoesNotExist:
             return None
 
+    async def find_by_ids(self, entity_ids: List[UUID]) -> List[T]:
+        # One id__in query; missing ids are simply absent from the result
+        if not entity_ids:
+            return []
+        models = await self._query_list(self.model_class.objects.filter(id__in=list(entity_ids)))
+        return self.mapper.models_to_entities(models)
+
     async def delete(self, entity_id: UUID) -> bool:
         try:
-            deleted_count, _ = await sync_to_async(self.model_class.objects.filter(id=entity_id).delete)()
+            deleted_count = await self._query_delete(self.model_class.objects.filter(id=entity_id))
             return deleted_count > 0
         except Exception:
             return False
 
     async def exists_by_id(self, entity_id: UUID) -> bool:
-        return await sync_to_async(self.model_class.objects.filter(id=entity_id).exists)()
+        return await self._query_exists(self.model_class.objects.filter(id=entity_id))
 
     # ===== NEW METHODS FOR GENERIC CRITERIA =====
     async def find_with_criteria(self, criteria) -> List[T]:
         from src.shared.criteria.converter import CriteriaConverter
 
-        queryset = self.model_class.objects.all()
+        queryset = self.model_class.objects.using(read_database())
         filtered_queryset = CriteriaConverter.apply_criteria(queryset, criteria)
-        models = await sync_to_async(list)(filtered_queryset)
+        models = await self._query_list(filtered_queryset)
         return self.mapper.models_to_entities(models)
 
+    async def find_page_with_criteria(self, criteria) -> Page[T]:
+        from src.shared.criteria.converter import CriteriaConverter
+        from src.shared.criteria.base_criteria import CountMode
+
+        # One extra row tells whether another page exists in the walking direction
+        page_criteria = copy(criteria)
+        if criteria.limit is not None:
+            page_criteria.limit = criteria.limit + 1
+
+        # Exact totals ride along the page query as COUNT(*) OVER (); a cursor's seek predicate
+        # would shrink that window, so cursor pages count separately
+        count_mode = criteria.options.count_mode
+        window_count = count_mode == CountMode.EXACT and not criteria.has_cursor()
+        annotations = {TOTAL_COUNT_ANNOTATION: Window(Count("*"))} if window_count else None
+
+        queryset = CriteriaConverter.apply_criteria(self.model_class.objects.using(read_database()), page_criteria, annotations)
+        models = await self._query_list(queryset)
+        has_more = criteria.limit is not None and len(models) > criteria.limit
+        if has_more:
+            models = models[: criteria.limit]
+
+        if criteria.before is not None:
+            models.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, criteria.after is not None or bool(criteria.offset)
+
+        page = Page(items=self.mapper.models_to_entities(models), has_next_page=has_next and bool(models))
+        if models:
+            orders = CriteriaConverter.keyset_orders(criteria, self.model_class)
+            if has_next:
+                page.next_cursor = CriteriaConverter.cursor_for(models[-1], orders)
+            if has_prev:
+                page.prev_cursor = CriteriaConverter.cursor_for(models[0], orders)
+
+        if window_count and (models or not criteria.offset):
+            page.total_count = self._row_value(models[0], TOTAL_COUNT_ANNOTATION) if models else 0
+        elif count_mode == CountMode.ESTIMATED:
+            page.total_count = await self._query_estimated_count(self._count_queryset(criteria), filtered=criteria.has_filters())
+        elif count_mode == CountMode.EXACT:
+            page.total_count = await self._query_count(self._count_queryset(criteria))
+        return page
+
     async def find_one_with_criteria(self, criteria) -> Optional[T]:
         from src.shared.criteria.converter import CriteriaConverter
         from src.shared.criteria.base_criteria import Criteria
 
-        queryset = self.model_class.objects.all()
+        queryset = self.model_class.objects.using(read_database())
         criteria_no_pagination = Criteria(
             filters=criteria.filters,
             orders=criteria.orders,
@@ -64,16 +135,149 @@ class DjangoBaseRepository(BaseRepository[T]):
         filtered_queryset = CriteriaConverter.apply_criteria(queryset, criteria_no_pagination)
 
         try:
-            model = await sync_to_async(filtered_queryset.first)()
-            return self.mapper.model_to_entity(model) if model else None
+            model = await self._query_first(filtered_queryset)
+            return self.mapper.to_entity(model) if model else None
         except ObjectDoesNotExist:
             return None
 
+    async def data_version(self):
+        return await get_table_versions().get(self.model_class._meta.db_table)
+
     async def count_with_criteria(self, criteria) -> int:
+        return await self._query_count(self._count_queryset(criteria))
+
+    def _count_queryset(self, criteria) -> QuerySet:
         from src.shared.criteria.converter import CriteriaConverter
         from src.shared.criteria.base_criteria import Criteria
 
-        queryset = self.model_class.objects.all()
-        count_criteria = Criteria(filters=criteria.filters, orders=criteria.orders, options=criteria.options)
-        filtered_queryset = CriteriaConverter.apply_criteria(queryset, count_criteria)
-        return await sync_to_async(filtered_queryset.count)()
+        queryset = self.model_class.objects.using(read_database())
+        return CriteriaConverter.apply_criteria(queryset, Criteria(filters=criteria.filters, options=criteria.options))
+
+    @staticmethod
+    def _row_value(row, name: str):
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+    # ===== PERSISTENCE HELPERS =====
+    def _save_many_sync(self, entities: List[T]) -> List[T]:
+        new_entities = [entity for entity in entities if entity.is_new]
+        saved: Dict[UUID, T] = {}
+
+        with transaction.atomic(savepoint=False):
+            if new_entities:
+                new_models = [self.model_class(**self._insert_model_data(entity)) for entity in new_entities]
+                for model in self.model_class.objects.bulk_create(new_models):
+                    saved[model.id] = self.mapper.to_entity(model)
+
+            for entity in entities:
+                if entity.is_new:
+                    continue
+                changes = self.mapper.changed_model_data(entity)
+                if changes:
+                    self.model_class.objects.filter(id=entity.id).update(**changes)
+                entity.mark_persisted()
+                saved[entity.id] = entity
+
+        return [saved[entity.id] for entity in entities]
+
+    def _insert_model_data(self, entity: T) -> Dict[str, Any]:
+        return self.mapper.entity_to_model_data(entity)
+
+    async def _insert(self, entity: T, **extra_fields) -> T:
+        data = self._insert_model_data(entity)
+        data.update(extra_fields)
+        model = self.model_class(**data)
+        await self._model_save(model, force_insert=True)
+        return self.mapper.to_entity(model)
+
+    async def _update(self, entity: T, **extra_fields) -> T:
+        changes = self.mapper.changed_model_data(entity)
+        changes.update(extra_fields)
+        if not changes:
+            return entity
+
+        updated_count = await self._query_update(self.model_class.objects.filter(id=entity.id), **changes)
+        if not updated_count:
+            # Row is gone: keep the previous update_or_create semantics
+            return await self._insert(entity, **extra_fields)
+
+        entity.mark_persisted()
+        return entity
+
+    # ===== QUERY EXECUTION =====
+    # Django 5.2's async queryset API (aget, acount, async for, ...) is itself sync_to_async over these
+    # same calls, so every ORM query goes through one wrapper here. Reads of repositories on the async
+    # driver skip it; writes always use the ORM (transactions, signals, primary pinning)
+    def _async_reader_for(self, queryset: QuerySet) -> Optional[AsyncPsycopgReader]:
+        return self.async_reader if self.async_reader is not None and self.async_reader.supports(queryset) else None
+
+    async def _query_list(self, queryset: QuerySet) -> List[models.Model]:
+        reader = self._async_reader_for(queryset)
+        if reader is not None:
+            return await reader.fetch_models(queryset)
+        return await sync_to_async(list)(queryset)
+
+    async def _query_get(self, queryset: QuerySet, **lookup) -> models.Model:
+        reader = self._async_reader_for(queryset)
+        if reader is not None:
+            return await reader.get(queryset, **lookup)
+        return await sync_to_async(queryset.get)(**lookup)
+
+    async def _query_first(self, queryset: QuerySet) -> Optional[models.Model]:
+        reader = self._async_reader_for(queryset)
+        if reader is not None:
+            return await reader.first(queryset)
+        return await sync_to_async(queryset.first)()
+
+    async def _query_count(self, queryset: QuerySet) -> int:
+        reader = self._async_reader_for(queryset)
+        if reader is not None:
+            return await reader.count(queryset)
+        return await sync_to_async(queryset.count)()
+
+    async def _query_estimated_count(self, queryset: QuerySet, filtered: bool) -> int:
+        return await sync_to_async(self._estimated_count_sync)(queryset, filtered)
+
+    def _estimated_count_sync(self, queryset: QuerySet, filtered: bool) -> int:
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return queryset.count()
+
+        if not filtered:
+            # Kept current by autovacuum/ANALYZE; -1 means the table was never analyzed
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [self.model_class._meta.db_table])
+                row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return row[0]
+
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def _query_exists(self, queryset: QuerySet) -> bool:
+        reader = self._async_reader_for(queryset)
+        if reader is not None:
+            return await reader.exists(queryset)
+        return await sync_to_async(queryset.exists)()
+
+    async def _query_update(self, queryset: QuerySet, **values) -> int:
+        pin_to_primary()
+        updated_count = await sync_to_async(queryset.update)(**values)
+        if updated_count:
+            await self._data_changed()
+        return updated_count
+
+    async def _query_delete(self, queryset: QuerySet) -> int:
+        pin_to_primary()
+        deleted_count, _ = await sync_to_async(queryset.delete)()
+        if deleted_count:
+            await self._data_changed()
+        return deleted_count
+
+    async def _model_save(self, model: models.Model, **kwargs):
+        pin_to_primary()
+        await sync_to_async(model.save)(**kwargs)
+        await self._data_changed()
+
+    async def _data_changed(self):
+        # After the write, never before: a read racing ahead of the commit would cache old rows under the new version
+        await get_table_versions().bump(self.model_class._meta.db_table)
@@ -0,0 +1,64 @@
+# src/core/infrastructure/database/routing.py
+import random
+from contextvars import ContextVar
+from typing import List, Optional
+
+from django.conf import settings
+
+PRIMARY_DATABASE = "default"
+
+
+class RoutingState:
+    # Mutable per-request holder so a pin set inside one resolver task is seen by its siblings
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned
+        self.wrote = False
+
+
+_routing_state: ContextVar[Optional[RoutingState]] = ContextVar("database_routing_state", default=None)
+
+
+def begin_request(pinned: bool = False) -> RoutingState:
+    state = RoutingState(pinned=pinned)
+    _routing_state.set(state)
+    return state
+
+
+def pin_to_primary():
+    # Read-your-writes: once this request wrote, later reads must not hit a lagging replica
+    state = _routing_state.get()
+    if state is None:
+        state = begin_request()
+    state.pinned = True
+    state.wrote = True
+
+
+def is_pinned_to_primary() -> bool:
+    state = _routing_state.get()
+    return state is not None and state.pinned
+
+
+def replica_aliases() -> List[str]:
+    return list(getattr(settings, "DATABASE_READ_REPLICAS", []))
+
+
+def read_database() -> str:
+    replicas = replica_aliases()
+    if not replicas or is_pinned_to_primary():
+        return PRIMARY_DATABASE
+    return random.choice(replicas)
+
+
+class PrimaryReplicaRouter:
+    # Unqualified queries stay on the primary; repositories opt listing reads into replicas via read_database()
+    def db_for_read(self, model, **hints):
+        return PRIMARY_DATABASE
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DATABASE
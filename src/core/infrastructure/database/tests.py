@@ -0,0 +1,28 @@
+# src/core/infrastructure/database/tests.py
+from django.test import SimpleTestCase, override_settings
+
+from src.core.infrastructure.database.async_driver import AsyncPsycopgReader, uses_async_driver
+from src.feature.sessions.infrastructure.database.models import SessionModel
+from src.feature.users.infrastructure.database.models import UserModel
+from src.feature.users.infrastructure.database.repositories import DjangoUserRepository
+
+
+class AsyncDriverSelectionTests(SimpleTestCase):
+    @override_settings(DATABASE_ASYNC_DRIVER_REPOSITORIES=["users"])
+    def test_repositories_are_selected_by_table(self):
+        self.assertTrue(uses_async_driver(UserModel))
+        self.assertFalse(uses_async_driver(SessionModel))
+
+    @override_settings(DATABASE_ASYNC_DRIVER_REPOSITORIES=["*"])
+    def test_wildcard_selects_every_repository(self):
+        self.assertIsNotNone(DjangoUserRepository().async_reader)
+        self.assertIsNone(DjangoUserRepository(async_driver=False).async_reader)
+
+    def test_querysets_the_reader_cannot_map_stay_on_the_orm(self):
+        for queryset in (UserModel.objects.values("id"), SessionModel.objects.select_related("user"), UserModel.objects.prefetch_related("auth_sessions")):
+            self.assertFalse(AsyncPsycopgReader.supports(queryset))
+
+    @override_settings(DATABASE_ASYNC_DRIVER_REPOSITORIES=["*"])
+    def test_non_postgresql_databases_fall_back_to_the_orm(self):
+        # The test database is SQLite
+        self.assertIsNone(DjangoUserRepository()._async_reader_for(UserModel.objects.all()))
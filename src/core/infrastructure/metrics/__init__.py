@@ -0,0 +1,3 @@
+from .registry import MetricsRegistry, TimingStats, metrics_registry
+
+__all__ = ["MetricsRegistry", "TimingStats", "metrics_registry"]
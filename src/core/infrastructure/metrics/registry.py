@@ -0,0 +1,39 @@
+# src/core/infrastructure/metrics/registry.py
+import threading
+from typing import Any, Callable, Dict
+
+
+class TimingStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.last_ms = elapsed_ms
+            if elapsed_ms > self.max_ms:
+                self.max_ms = elapsed_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg_ms = self.total_ms / self.count if self.count else 0.0
+            return {"count": self.count, "avg_ms": round(avg_ms, 3), "max_ms": round(self.max_ms, 3), "last_ms": round(self.last_ms, 3)}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def register(self, name: str, provider: Callable[[], Dict[str, Any]]):
+        self._providers[name] = provider
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: provider() for name, provider in list(self._providers.items())}
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,8 @@
+# src/core/infrastructure/metrics/views.py
+from django.http import JsonResponse
+
+from .registry import metrics_registry
+
+
+def metrics_view(request):
+    return JsonResponse(metrics_registry.snapshot())
@@ -0,0 +1,3 @@
+from .password_executor import PasswordHashExecutor, get_password_executor
+
+__all__ = ["PasswordHashExecutor", "get_password_executor"]
@@ -0,0 +1,152 @@
+# src/core/infrastructure/security/password_executor.py
+import asyncio
+import secrets
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+from src.core.exceptions.base_exceptions import ServiceUnavailableError
+from src.core.infrastructure.metrics.registry import TimingStats, metrics_registry
+
+
+# ===== WORKER FUNCTIONS (module level so they can be pickled for process pools) =====
+def _timed_check_password(password: str, encoded: str):
+    started = time.monotonic()
+    valid = check_password(password, encoded)
+    return valid, started, time.monotonic()
+
+
+def _timed_make_password(password: str):
+    started = time.monotonic()
+    encoded = make_password(password)
+    return encoded, started, time.monotonic()
+
+
+def _init_process_worker():
+    import django
+
+    django.setup()
+
+
+class PasswordHashExecutor:
+    """
+    Runs password hashing/verification off the thread used by sync_to_async for ORM calls,
+    so a burst of logins does not queue behind (or in front of) unrelated queries.
+    """
+
+    def __init__(self, mode: str = "thread", max_workers: int = 2, max_pending: int = 64, timeout_seconds: float = 5.0):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Invalid password executor mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._dummy_hash: Optional[str] = None
+
+        self.queue_wait = TimingStats()
+        self.hash_time = TimingStats()
+        self.rejected_count = 0
+        self.timeout_count = 0
+
+    async def verify(self, password: str, encoded: str) -> bool:
+        return await self._run(_timed_check_password, password, encoded)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_timed_make_password, password)
+
+    async def verify_dummy(self, password: str) -> bool:
+        # Same hasher and work factor as a real check, for callers that have no user to check against
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(secrets.token_urlsafe(32))
+        await self.verify(password, self._dummy_hash)
+        return False
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "rejected": self.rejected_count,
+            "timeouts": self.timeout_count,
+            "queue_wait": self.queue_wait.snapshot(),
+            "hash_time": self.hash_time.snapshot(),
+        }
+
+    # ===== INTERNALS =====
+    async def _run(self, fn, *args) -> Any:
+        self._acquire_slot()
+
+        submitted = time.monotonic()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release_slot()
+            raise
+
+        # The slot is held until the worker finishes, even if the caller gave up on it
+        future.add_done_callback(lambda _: self._release_slot())
+
+        try:
+            result, started, finished = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self.timeout_count += 1
+            raise ServiceUnavailableError("Authentication is taking too long, please try again", error_code="PASSWORD_HASHER_TIMEOUT")
+
+        self.queue_wait.observe(max(started - submitted, 0.0) * 1000)
+        self.hash_time.observe((finished - started) * 1000)
+        return result
+
+    def _acquire_slot(self):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected_count += 1
+                raise ServiceUnavailableError("Too many concurrent authentication requests, please try again", error_code="PASSWORD_HASHER_BUSY")
+            self._pending += 1
+
+    def _release_slot(self):
+        with self._lock:
+            self._pending -= 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.mode == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_process_worker)
+                    else:
+                        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+
+_password_executor: Optional[PasswordHashExecutor] = None
+
+
+def get_password_executor() -> PasswordHashExecutor:
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = PasswordHashExecutor(
+            mode=settings.PASSWORD_EXECUTOR_MODE,
+            max_workers=settings.PASSWORD_EXECUTOR_WORKERS,
+            max_pending=settings.PASSWORD_EXECUTOR_MAX_PENDING,
+            timeout_seconds=settings.PASSWORD_EXECUTOR_TIMEOUT,
+        )
+        metrics_registry.register("password_hasher", _password_executor.snapshot)
+    return _password_executor
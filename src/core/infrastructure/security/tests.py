@@ -0,0 +1,69 @@
+# src/core/infrastructure/security/tests.py
+import asyncio
+import threading
+import time
+
+from django.test import SimpleTestCase, override_settings
+
+from src.core.exceptions.base_exceptions import ServiceUnavailableError
+from src.core.infrastructure.security.password_executor import PasswordHashExecutor
+
+
+def _held_until(released: threading.Event):
+    started = time.monotonic()
+    released.wait(timeout=5)
+    return True, started, time.monotonic()
+
+
+class PasswordExecutorSaturationTests(SimpleTestCase):
+    def setUp(self):
+        self.executor = PasswordHashExecutor(max_workers=1, max_pending=1, timeout_seconds=5)
+        self.released = threading.Event()
+        self.addCleanup(self.executor.shutdown)
+        self.addCleanup(self.released.set)
+
+    def test_requests_beyond_max_pending_are_rejected_not_queued(self):
+        async def scenario():
+            held = asyncio.ensure_future(self.executor._run(_held_until, self.released))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(ServiceUnavailableError) as raised:
+                await self.executor._run(_held_until, self.released)
+            self.released.set()
+            await held
+            return raised.exception
+
+        error = asyncio.run(scenario())
+        self.assertEqual(error.error_code, "PASSWORD_HASHER_BUSY")
+        self.assertEqual((self.executor.rejected_count, self.executor._pending), (1, 0))
+
+    def test_timed_out_work_keeps_its_slot_until_the_worker_finishes(self):
+        self.executor.timeout_seconds = 0.01
+
+        async def scenario():
+            with self.assertRaises(ServiceUnavailableError) as raised:
+                await self.executor._run(_held_until, self.released)
+            # The hashing thread is still busy: the slot stays taken
+            self.assertEqual(self.executor._pending, 1)
+            self.released.set()
+            await asyncio.sleep(0.05)
+            return raised.exception
+
+        error = asyncio.run(scenario())
+        self.assertEqual(error.error_code, "PASSWORD_HASHER_TIMEOUT")
+        self.assertEqual((self.executor.timeout_count, self.executor._pending), (1, 0))
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.PBKDF2PasswordHasher"])
+class DummyVerificationTests(SimpleTestCase):
+    def setUp(self):
+        self.executor = PasswordHashExecutor(max_workers=1)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_dummy_check_runs_a_real_verification_and_never_succeeds(self):
+        async def scenario():
+            return await self.executor.verify_dummy("pw12345678"), await self.executor.verify_dummy("pw12345678")
+
+        self.assertEqual(asyncio.run(scenario()), (False, False))
+        # One hash for the dummy, then one verification per call, all on the hashing pool
+        self.assertEqual(self.executor.hash_time.snapshot()["count"], 3)
+        self.assertTrue(self.executor._dummy_hash.startswith("pbkdf2_sha256$"))
@@ -0,0 +1,35 @@
+# src/core/infrastructure/web/middleware.py
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from src.core.infrastructure.database.routing import begin_request
+
+
+class ReplicaStickinessMiddleware:
+    # Keeps a client on the primary for a short window after it wrote, covering replica lag
+    # between requests (e.g. refreshToken right after login)
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = begin_request(pinned=self._has_pin(request))
+        return self._process_response(state, self.get_response(request))
+
+    async def __acall__(self, request):
+        state = begin_request(pinned=self._has_pin(request))
+        return self._process_response(state, await self.get_response(request))
+
+    def _has_pin(self, request) -> bool:
+        return settings.DATABASE_PRIMARY_PIN_COOKIE in request.COOKIES
+
+    def _process_response(self, state, response):
+        if state.wrote and settings.DATABASE_PRIMARY_PIN_SECONDS > 0:
+            response.set_cookie(settings.DATABASE_PRIMARY_PIN_COOKIE, "1", max_age=settings.DATABASE_PRIMARY_PIN_SECONDS, httponly=True, samesite="Lax")
+        return response
@@ -1,4 +1,3 @@
-# Clean helpers - only validators used
 from .validators import (
     validate_uuid,
     validate_required,
@@ -6,6 +5,8 @@ from .validators import (
     validate_positive_integer,
     validate_string_length,
 )
+from .selection import selected_item_fields
+from .context import request_container, request_loaders, http_request, client_ip, bearer_token
 
 __all__ = [
     "validate_uuid",
@@ -13,4 +14,10 @@ __all__ = [
     "validate_email_format",
     "validate_positive_integer",
     "validate_string_length",
+    "selected_item_fields",
+    "request_container",
+    "request_loaders",
+    "http_request",
+    "client_ip",
+    "bearer_token",
 ]
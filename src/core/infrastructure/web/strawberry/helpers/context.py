@@ -0,0 +1,46 @@
+from typing import Any, Optional
+
+import strawberry
+from django.conf import settings
+
+
+def request_container(info: strawberry.Info) -> Any:
+    # The application-scoped dependency container the GraphQL view (or the caller of schema.execute) put in the context
+    container = getattr(info.context, "container", None)
+    if container is None:
+        raise RuntimeError("GraphQL context has no dependency container; execute the schema with container.context()")
+    return container
+
+
+def request_loaders(info: strawberry.Info) -> Any:
+    # Request-scoped DataLoaders; a new set per operation so batches and memoized results never leak across requests
+    loaders = getattr(info.context, "loaders", None)
+    if loaders is None:
+        raise RuntimeError("GraphQL context has no DataLoaders; execute the schema with container.context()")
+    return loaders
+
+
+def http_request(info: strawberry.Info) -> Any:
+    # The Django request, or None when the schema is executed from code (management commands, tests)
+    return getattr(info.context, "request", None)
+
+
+def client_ip(request) -> Optional[str]:
+    # Behind TRUSTED_PROXY_COUNT reverse proxies the client is that many entries from the right of X-Forwarded-For;
+    # anything further left is client supplied. Requests that did not pass through every proxy keep REMOTE_ADDR
+    if request is None:
+        return None
+    proxies = settings.TRUSTED_PROXY_COUNT
+    if proxies > 0:
+        forwarded = [address.strip() for address in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if address.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR") or None
+
+
+def bearer_token(request) -> Optional[str]:
+    header = request.headers.get("Authorization", "") if request is not None else ""
+    scheme, _, token = header.partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    return token.strip() or None
@@ -0,0 +1,27 @@
+from typing import Iterable, List, Optional, Set
+
+import strawberry
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+
+
+def _flatten(selections: Iterable) -> List[SelectedField]:
+    fields = []
+    for selection in selections:
+        if isinstance(selection, (FragmentSpread, InlineFragment)):
+            fields.extend(_flatten(selection.selections))
+        elif isinstance(selection, SelectedField):
+            fields.append(selection)
+    return fields
+
+
+def selected_item_fields(info: Optional[strawberry.Info], path: Iterable[str] = ("data", "items")) -> Optional[Set[str]]:
+    # GraphQL field names requested under e.g. usersFind { data { items { ... } } };
+    # empty when the items are not selected at all, None when there is no GraphQL context
+    if info is None:
+        return None
+
+    # info.selected_fields holds the resolver's own field; its children are the response type's fields
+    fields = _flatten(selection for field in _flatten(info.selected_fields) for selection in field.selections)
+    for name in path:
+        fields = _flatten(selection for field in fields if field.name == name for selection in field.selections)
+    return {field.name for field in fields}
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from src.core.infrastructure.cache.ttl_cache import TTLCache
+from src.core.infrastructure.metrics.registry import metrics_registry
+
+
+class PersistedQueryError(Exception):
+    # Reported as a GraphQL error with extensions.code, the shape APQ clients look for before retrying with the full query
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class PersistedQueryStore:
+    """
+    Automatic persisted queries (Apollo APQ protocol): clients send
+    extensions.persistedQuery.sha256Hash instead of the document, and register it once by sending both.
+
+    Registered documents live in a bounded per-process LRU+TTL; a miss answers PersistedQueryNotFound
+    and the client resends the full query. Manifest (allow-listed) documents are never evicted,
+    and in allow-list mode they are the only documents executed, by hash or by full text.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 86400.0, manifest: Optional[Dict[str, str]] = None, allowlist_only: bool = False):
+        self.cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.manifest = dict(manifest or {})
+        self.allowlist_only = allowlist_only
+        if allowlist_only and not self.manifest:
+            raise ImproperlyConfigured("GRAPHQL_PERSISTED_QUERIES_ONLY requires a GRAPHQL_PERSISTED_QUERIES_MANIFEST")
+
+        self._lock = threading.Lock()
+        self.registered = 0
+        self.rejected = 0
+
+    @staticmethod
+    def hash_query(query: str) -> str:
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+    def resolve(self, query: Optional[str], extensions: Optional[Dict[str, Any]]) -> Optional[str]:
+        # Returns the document to execute, or raises PersistedQueryError
+        persisted = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+        if persisted is None:
+            if self.allowlist_only and query is not None and self.hash_query(query) not in self.manifest:
+                self._reject("Query is not in the persisted query allow-list", "PERSISTED_QUERY_NOT_ALLOWED")
+            return query
+
+        query_hash = persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        if not isinstance(query_hash, str) or persisted.get("version", 1) != 1:
+            self._reject("Unsupported persisted query", "PERSISTED_QUERY_UNSUPPORTED")
+
+        if query is None:
+            query = self.manifest.get(query_hash) or self.cache.get(query_hash)
+            if query is None:
+                # The (only) expected miss: the client retries with the full document
+                raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            return query
+
+        if self.hash_query(query) != query_hash:
+            self._reject("provided sha does not match query", "PERSISTED_QUERY_HASH_MISMATCH")
+        if query_hash not in self.manifest:
+            if self.allowlist_only:
+                self._reject("Query is not in the persisted query allow-list", "PERSISTED_QUERY_NOT_ALLOWED")
+            self.cache.set(query_hash, query)
+            with self._lock:
+                self.registered += 1
+        return query
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"cache": self.cache.snapshot(), "manifest_size": len(self.manifest), "allowlist_only": self.allowlist_only, "registered": self.registered, "rejected": self.rejected}
+
+    def _reject(self, message: str, code: str):
+        with self._lock:
+            self.rejected += 1
+        raise PersistedQueryError(message, code)
+
+
+def load_manifest(path: str) -> Dict[str, str]:
+    # {"<sha256>": "<document>", ...}; hashes are checked so a stale manifest fails at startup, not per request
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    for query_hash, query in manifest.items():
+        if PersistedQueryStore.hash_query(query) != query_hash:
+            raise ImproperlyConfigured(f"Persisted query manifest {path}: hash {query_hash} does not match its document")
+    return manifest
+
+
+_persisted_queries: Optional[PersistedQueryStore] = None
+
+
+def get_persisted_queries() -> PersistedQueryStore:
+    global _persisted_queries
+    if _persisted_queries is None:
+        _persisted_queries = PersistedQueryStore(
+            max_size=settings.GRAPHQL_PERSISTED_QUERIES_CACHE_SIZE,
+            ttl_seconds=settings.GRAPHQL_PERSISTED_QUERIES_TTL_SECONDS,
+            manifest=load_manifest(settings.GRAPHQL_PERSISTED_QUERIES_MANIFEST),
+            allowlist_only=settings.GRAPHQL_PERSISTED_QUERIES_ONLY,
+        )
+        metrics_registry.register("persisted_queries", _persisted_queries.snapshot)
+    return _persisted_queries
@@ -0,0 +1,274 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from graphql import ExecutionResult as GraphQLExecutionResult
+from graphql import FieldNode, FragmentDefinitionNode, FragmentSpreadNode, GraphQLError, GraphQLSchema, SelectionSetNode, get_named_type, get_nullable_type, is_list_type
+from graphql.utilities import get_operation_ast, value_from_ast_untyped
+from strawberry.extensions import SchemaExtension
+
+from src.core.exceptions.base_exceptions import UnauthorizedError
+from src.core.infrastructure.cache.ttl_cache import TTLCache
+from src.core.infrastructure.metrics.registry import metrics_registry
+from src.core.infrastructure.web.strawberry.helpers.context import bearer_token, client_ip
+
+# "Type.field" -> weight of one resolution (default: 1 for object fields, 0 for scalars)
+DEFAULT_FIELD_COSTS = {
+    "Mutation.login": 50,  # password hash
+    "Mutation.userCreate": 50,  # password hash
+    "Mutation.refreshToken": 5,
+    "Mutation.revokeSessionsBulk": 500,
+}
+
+PAGE_ITEMS_FIELD = "items"
+
+
+class QueryCostError(Exception):
+    def __init__(self, message: str, code: str, **details):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.details = details
+
+
+@dataclass
+class QueryCost:
+    cost: int
+    depth: int
+
+
+class QueryCostAnalyzer:
+    """
+    Static cost of an operation, computed on the validated document before execution.
+
+    Every object field costs its weight times the number of times it resolves: list fields multiply
+    their subtree by the expected item count. A page's items count as the criteria `limit`
+    (unbounded_list_size without one), relationship lists as default_list_size.
+    Each criteria filter (nested ones included) adds one unit.
+    """
+
+    def __init__(self, max_cost: int = 10000, max_depth: int = 10, max_filter_depth: int = 4, unbounded_list_size: int = 1000, default_list_size: int = 20, field_costs: Optional[Dict[str, int]] = None):
+        self.max_cost = max_cost
+        self.max_depth = max_depth
+        self.max_filter_depth = max_filter_depth
+        self.unbounded_list_size = unbounded_list_size
+        self.default_list_size = default_list_size
+        self.field_costs = DEFAULT_FIELD_COSTS if field_costs is None else field_costs
+
+    def analyze(self, schema: GraphQLSchema, document, operation_name: Optional[str] = None, variables: Optional[Dict[str, Any]] = None) -> QueryCost:
+        operation = get_operation_ast(document, operation_name)
+        if operation is None:
+            return QueryCost(cost=0, depth=0)
+
+        root_type = schema.get_root_type(operation.operation)
+        fragments = {definition.name.value: definition for definition in document.definitions if isinstance(definition, FragmentDefinitionNode)}
+        cost, depth = self._selection_cost(schema, operation.selection_set, root_type, fragments, variables or {}, 1, None)
+
+        if depth > self.max_depth:
+            raise QueryCostError(f"Query depth {depth} exceeds the maximum of {self.max_depth}", "QUERY_TOO_DEEP", depth=depth, maxDepth=self.max_depth)
+        if cost > self.max_cost:
+            raise QueryCostError(f"Query cost {cost} exceeds the maximum of {self.max_cost}", "QUERY_TOO_COMPLEX", cost=cost, maxCost=self.max_cost)
+        return QueryCost(cost=cost, depth=depth)
+
+    def _selection_cost(self, schema: GraphQLSchema, selection_set: SelectionSetNode, parent_type, fragments, variables, depth: int, pending_limit: Optional[int]) -> Tuple[int, int]:
+        cost, max_depth = 0, depth
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field_cost, field_depth = self._field_cost(schema, selection, parent_type, fragments, variables, depth, pending_limit)
+            else:
+                if isinstance(selection, FragmentSpreadNode):
+                    fragment = fragments.get(selection.name.value)
+                    if fragment is None:
+                        continue
+                    type_condition, fragment_selection = fragment.type_condition, fragment.selection_set
+                else:
+                    type_condition, fragment_selection = selection.type_condition, selection.selection_set
+                fragment_type = schema.get_type(type_condition.name.value) if type_condition is not None else parent_type
+                field_cost, field_depth = self._selection_cost(schema, fragment_selection, fragment_type, fragments, variables, depth, pending_limit)
+            cost += field_cost
+            max_depth = max(max_depth, field_depth)
+        return cost, max_depth
+
+    def _field_cost(self, schema: GraphQLSchema, node: FieldNode, parent_type, fragments, variables, depth: int, pending_limit: Optional[int]) -> Tuple[int, int]:
+        name = node.name.value
+        field = getattr(parent_type, "fields", {}).get(name)
+        if name.startswith("__") or field is None:
+            # Introspection is not charged
+            return 0, depth
+
+        weight = self.field_costs.get(f"{parent_type.name}.{name}", 1 if node.selection_set else 0)
+        filter_cost = 0
+        if self._takes_criteria(field):
+            # Criteria-driven list: no criteria or no limit means every row
+            arguments = {argument.name.value: value_from_ast_untyped(argument.value, variables) for argument in node.arguments}
+            criteria = arguments.get("input", {}).get("criteria") if isinstance(arguments.get("input"), dict) else None
+            criteria = criteria if isinstance(criteria, dict) else {}
+            filter_cost, filter_depth = self._filter_stats(criteria.get("filters"))
+            if filter_depth > self.max_filter_depth:
+                raise QueryCostError(f"Filter nesting depth {filter_depth} exceeds the maximum of {self.max_filter_depth}", "FILTER_TOO_DEEP", depth=filter_depth, maxDepth=self.max_filter_depth)
+            limit = criteria.get("limit")
+            pending_limit = max(int(limit), 0) if isinstance(limit, (int, float)) else self.unbounded_list_size
+
+        multiplier = 1
+        if is_list_type(get_nullable_type(field.type)):
+            # The criteria limit sizes the page (FindData.items); any other list is a relationship
+            multiplier = pending_limit if pending_limit is not None and name == PAGE_ITEMS_FIELD else self.default_list_size
+            pending_limit = None
+
+        child_cost, child_depth = 0, depth
+        if node.selection_set:
+            child_cost, child_depth = self._selection_cost(schema, node.selection_set, get_named_type(field.type), fragments, variables, depth + 1, pending_limit)
+        return filter_cost + multiplier * (weight + child_cost), child_depth
+
+    @staticmethod
+    def _takes_criteria(field) -> bool:
+        # Fields with an `input` argument carrying a CriteriaInput (usersFind, sessionsFind, ...)
+        input_argument = field.args.get("input")
+        return input_argument is not None and "criteria" in getattr(get_named_type(input_argument.type), "fields", {})
+
+    def _filter_stats(self, filters, level: int = 1) -> Tuple[int, int]:
+        # (number of filters, nesting depth)
+        if not isinstance(filters, list) or not filters:
+            return 0, 0
+        count, depth = 0, level
+        for filter_input in filters:
+            count += 1
+            if isinstance(filter_input, dict):
+                nested_count, nested_depth = self._filter_stats(filter_input.get("nestedFilters"), level + 1)
+                count += nested_count
+                depth = max(depth, nested_depth)
+        return count, depth
+
+
+class TokenBucketLimiter:
+    """
+    Per-client token buckets charged by query cost: a client spending its budget on heavy queries is
+    throttled on its own, everyone else keeps their full bucket. Idle buckets are dropped once they would
+    have refilled completely, and at most max_clients are tracked (LRU). Buckets live in the process:
+    with N workers a client can spend up to N times the capacity.
+    """
+
+    def __init__(self, capacity: float = 20000, refill_per_second: float = 2000, max_clients: int = 100000):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.buckets = TTLCache(max_size=max_clients, ttl_seconds=capacity / refill_per_second)
+        self._lock = threading.Lock()
+        self.throttled = 0
+
+    def consume(self, client_key: str, amount: float) -> float:
+        # 0 when allowed, otherwise seconds until the bucket holds enough tokens
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self.buckets.peek(client_key) or (self.capacity, now)
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_per_second)
+            if tokens < amount:
+                self.buckets.set(client_key, (tokens, now))
+                self.throttled += 1
+                return (amount - tokens) / self.refill_per_second
+            self.buckets.set(client_key, (tokens - amount, now))
+            return 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "refill_per_second": self.refill_per_second, "clients": self.buckets.snapshot()["size"], "throttled": self.throttled}
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Rejects operations over the depth/cost/filter limits before any resolver runs, then charges the
+    client's token bucket with the cost. Strawberry builds one instance per operation.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if settings.GRAPHQL_COST_LIMITS_ENABLED and execution_context.graphql_document is not None:
+            try:
+                query_cost = get_query_cost_analyzer().analyze(execution_context.schema._schema, execution_context.graphql_document, execution_context.operation_name, execution_context.variables)
+                self._charge(execution_context.context, query_cost.cost)
+            except QueryCostError as error:
+                get_query_cost_stats().record(error.code)
+                # A result set before execution makes Strawberry skip it
+                execution_context.result = GraphQLExecutionResult(data=None, errors=[GraphQLError(error.message, extensions={"code": error.code, **error.details})])
+            else:
+                get_query_cost_stats().record(None, query_cost.cost)
+        yield
+
+    def _charge(self, context, cost: int):
+        client_key = self.client_key(context)
+        if not settings.GRAPHQL_RATE_LIMIT_ENABLED or client_key is None:
+            return
+        retry_after = get_query_rate_limiter().consume(client_key, max(cost, 1))
+        if retry_after:
+            raise QueryCostError("Rate limit exceeded, retry later", "RATE_LIMITED", cost=cost, retryAfter=round(retry_after, 3))
+
+    @staticmethod
+    def client_key(context) -> Optional[str]:
+        # Only HTTP operations are rate limited; schema.execute from code has no request.
+        # A valid bearer token gets the user's own bucket, so clients sharing an address (NAT, proxy) are not
+        # throttled together; anonymous clients are keyed by address (see TRUSTED_PROXY_COUNT)
+        request = getattr(context, "request", None)
+        if request is None:
+            return None
+        token = bearer_token(request)
+        container = getattr(context, "container", None)
+        if token and container is not None:
+            try:
+                user_id = container.jwt_service.decode_token(token).get("user_id")
+            except UnauthorizedError:
+                user_id = None
+            if user_id:
+                return f"user:{user_id}"
+        address = client_ip(request)
+        return f"ip:{address}" if address else None
+
+
+class QueryCostStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.analyzed = 0
+        self.rejected: Dict[str, int] = {}
+        self.max_cost = 0
+
+    def record(self, rejected_code: Optional[str], cost: int = 0):
+        with self._lock:
+            self.analyzed += 1
+            if rejected_code:
+                self.rejected[rejected_code] = self.rejected.get(rejected_code, 0) + 1
+            self.max_cost = max(self.max_cost, cost)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"analyzed": self.analyzed, "rejected": dict(self.rejected), "max_cost": self.max_cost, "rate_limiter": _query_rate_limiter.snapshot() if _query_rate_limiter else None}
+
+
+_query_cost_analyzer: Optional[QueryCostAnalyzer] = None
+_query_rate_limiter: Optional[TokenBucketLimiter] = None
+_query_cost_stats: Optional[QueryCostStats] = None
+
+
+def get_query_cost_analyzer() -> QueryCostAnalyzer:
+    global _query_cost_analyzer
+    if _query_cost_analyzer is None:
+        _query_cost_analyzer = QueryCostAnalyzer(
+            max_cost=settings.GRAPHQL_MAX_QUERY_COST,
+            max_depth=settings.GRAPHQL_MAX_QUERY_DEPTH,
+            max_filter_depth=settings.GRAPHQL_MAX_FILTER_DEPTH,
+            unbounded_list_size=settings.GRAPHQL_COST_UNBOUNDED_LIST_SIZE,
+            default_list_size=settings.GRAPHQL_COST_DEFAULT_LIST_SIZE,
+        )
+    return _query_cost_analyzer
+
+
+def get_query_rate_limiter() -> TokenBucketLimiter:
+    global _query_rate_limiter
+    if _query_rate_limiter is None:
+        _query_rate_limiter = TokenBucketLimiter(capacity=settings.GRAPHQL_RATE_LIMIT_CAPACITY, refill_per_second=settings.GRAPHQL_RATE_LIMIT_REFILL_PER_SECOND, max_clients=settings.GRAPHQL_RATE_LIMIT_MAX_CLIENTS)
+    return _query_rate_limiter
+
+
+def get_query_cost_stats() -> QueryCostStats:
+    global _query_cost_stats
+    if _query_cost_stats is None:
+        _query_cost_stats = QueryCostStats()
+        metrics_registry.register("query_cost", _query_cost_stats.snapshot)
+    return _query_cost_stats
@@ -38,7 +38,10 @@ class FindData(Generic[T]):
 class FindResponse(Generic[T]):
     success: bool = strawberry.field(description="Operation success status")
     data: FindData[T] = strawberry.field(description="Response data")
-    total_count: int = strawberry.field(description="Total count of items")
+    total_count: Optional[int] = strawberry.field(default=None, description="Total count of items (estimated or null depending on criteria.options.countMode)")
+    has_next_page: bool = strawberry.field(default=False, description="Whether more items follow this page")
+    next_cursor: Optional[str] = strawberry.field(default=None, description="Cursor for the next page (pass as criteria.after)")
+    prev_cursor: Optional[str] = strawberry.field(default=None, description="Cursor for the previous page (pass as criteria.before)")
     message: Optional[str] = strawberry.field(default=None, description="Response message")
     error_code: Optional[str] = strawberry.field(default=None, description="Error code if failed")
 
@@ -1,4 +1,4 @@
-from typing import Any, List as PyList
+from typing import Any, Optional, List as PyList
 from src.core.exceptions.base_exceptions import BaseDomainException
 
 
@@ -8,8 +8,8 @@ class ResponseBuilder:
         return {"success": True, "data": data, "message": message or "Operation completed successfully"}
 
     @staticmethod
-    def success_list(data: PyList[Any], total_count: int, message: str = None) -> dict:
-        return {"success": True, "data": data, "total_count": total_count, "message": message or f"Found {len(data)} items"}
+    def success_list(data: PyList[Any], total_count: Optional[int], message: str = None, next_cursor: str = None, prev_cursor: str = None, has_next_page: bool = False) -> dict:
+        return {"success": True, "data": data, "total_count": total_count, "has_next_page": has_next_page, "next_cursor": next_cursor, "prev_cursor": prev_cursor, "message": message or f"Found {len(data)} items"}
 
     @staticmethod
     def success_operation(message: str = None, affected_count: int = None) -> dict:
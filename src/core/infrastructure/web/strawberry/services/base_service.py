@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from src.core.exceptions.base_exceptions import BaseDomainException
 from ..responses.response_builder import ResponseBuilder
 
@@ -17,8 +17,8 @@ class BaseService:
     def handle_success_delete(self, affected_count: int = 1) -> Dict[str, Any]:
         return self.builder.success_operation(message=f"{self.entity_name} deleted successfully", affected_count=affected_count)
 
-    def handle_success_find(self, data: list, total_count: int) -> Dict[str, Any]:
-        return self.builder.success_list(data=data, total_count=total_count, message=f"Found {len(data)} {self.entity_name.lower()}(s)")
+    def handle_success_find(self, data: list, total_count: Optional[int], next_cursor: str = None, prev_cursor: str = None, has_next_page: bool = False) -> Dict[str, Any]:
+        return self.builder.success_list(data=data, total_count=total_count, message=f"Found {len(data)} {self.entity_name.lower()}(s)", next_cursor=next_cursor, prev_cursor=prev_cursor, has_next_page=has_next_page)
 
     def handle_success_find_one(self, data: Any) -> Dict[str, Any]:
         if data is None:
@@ -0,0 +1,136 @@
+# src/core/infrastructure/web/strawberry/tests.py
+import asyncio
+import json
+from types import SimpleNamespace
+
+import jwt
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from graphql import parse
+from strawberry.extensions import ParserCache
+from strawberry.types import ExecutionResult
+
+from config.container import Container
+from config.strawberry_schema import schema
+from config.views import GraphQLView
+from src.core.infrastructure.web.strawberry.query_cost import QueryCostAnalyzer, QueryCostError, QueryCostLimiter
+
+PAGE_OF_USERS = "query($limit: Int) { usersFind(input: {criteria: {limit: $limit}}) { data { items { id email } } } }"
+
+
+def nested_filters_query(levels: int) -> str:
+    filter_input = '{field: "email", operator: EQ, value: "a@b.co"}'
+    for _ in range(levels - 1):
+        filter_input = f'{{field: "email", operator: AND, nestedFilters: [{filter_input}]}}'
+    return f"{{ usersFind(input: {{criteria: {{filters: [{filter_input}], limit: 1}}}}) {{ success }} }}"
+
+
+class QueryCostAnalyzerTests(SimpleTestCase):
+    def setUp(self):
+        self.analyzer = QueryCostAnalyzer(max_cost=10000, max_depth=10, max_filter_depth=4, unbounded_list_size=1000, default_list_size=20)
+
+    def analyze(self, query, variables=None):
+        return self.analyzer.analyze(schema._schema, parse(query), variables=variables)
+
+    def test_limit_from_variable_sizes_the_page(self):
+        # usersFind + data + limit x items
+        self.assertEqual(self.analyze(PAGE_OF_USERS, {"limit": 5}).cost, 7)
+        self.assertEqual(self.analyze(PAGE_OF_USERS, {"limit": 50}).cost, 52)
+
+    def test_missing_limit_variable_counts_as_unbounded(self):
+        self.assertEqual(self.analyze(PAGE_OF_USERS, {"limit": None}).cost, 1002)
+
+    def test_nested_filter_depth(self):
+        self.assertEqual(self.analyze(nested_filters_query(4)).cost, 5)
+
+        with self.assertRaises(QueryCostError) as raised:
+            self.analyze(nested_filters_query(5))
+        self.assertEqual(raised.exception.code, "FILTER_TOO_DEEP")
+        self.assertEqual(raised.exception.details, {"depth": 5, "maxDepth": 4})
+
+    def test_fragments_cost_the_same_as_inline_fields(self):
+        inline = "{ usersFind(input: {criteria: {limit: 5}}) { data { items { id activeSessions { id } } } } }"
+        spread = "{ usersFind(input: {criteria: {limit: 5}}) { data { items { ...UserSessions } } } } fragment UserSessions on UserGraphQLType { id activeSessions { id } }"
+        typed = "{ usersFind(input: {criteria: {limit: 5}}) { data { items { ... on UserGraphQLType { id activeSessions { id } } } } } }"
+
+        self.assertEqual(self.analyze(inline).cost, 107)
+        self.assertEqual(self.analyze(spread), self.analyze(inline))
+        self.assertEqual(self.analyze(typed), self.analyze(inline))
+
+
+class ClientKeyTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.container = Container()
+
+    def context(self, **headers):
+        return SimpleNamespace(request=self.factory.post("/graphql/", REMOTE_ADDR="10.0.0.1", **headers), container=self.container)
+
+    def test_direct_clients_are_keyed_by_remote_addr(self):
+        self.assertEqual(QueryCostLimiter.client_key(self.context(HTTP_X_FORWARDED_FOR="203.0.113.9")), "ip:10.0.0.1")
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_trusted_proxy_forwarded_address_is_used(self):
+        self.assertEqual(QueryCostLimiter.client_key(self.context(HTTP_X_FORWARDED_FOR="198.51.100.1, 203.0.113.9")), "ip:203.0.113.9")
+
+    @override_settings(TRUSTED_PROXY_COUNT=2)
+    def test_request_bypassing_the_proxies_keeps_remote_addr(self):
+        self.assertEqual(QueryCostLimiter.client_key(self.context(HTTP_X_FORWARDED_FOR="203.0.113.9")), "ip:10.0.0.1")
+
+    def test_authenticated_clients_get_their_own_bucket(self):
+        jwt_service = self.container.jwt_service
+        token = jwt.encode({"user_id": "6f1c5b8e-2d4e-4c1a-9a57-1c3f0d1e2b3a"}, jwt_service.secret_key, algorithm=jwt_service.algorithm)
+
+        self.assertEqual(QueryCostLimiter.client_key(self.context(HTTP_AUTHORIZATION=f"Bearer {token}")), "user:6f1c5b8e-2d4e-4c1a-9a57-1c3f0d1e2b3a")
+
+    def test_invalid_token_falls_back_to_the_address(self):
+        self.assertEqual(QueryCostLimiter.client_key(self.context(HTTP_AUTHORIZATION="Bearer not-a-jwt")), "ip:10.0.0.1")
+
+
+class TracedGraphQLView(GraphQLView):
+    """Records when each batched entry starts and ends instead of executing it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    async def _execute_batched(self, query, operation, context, root_value):
+        name = operation.get("operationName") or parse(query).definitions[0].name.value
+        self.events.append(("start", name))
+        await asyncio.sleep(0.01)
+        self.events.append(("end", name))
+        return ExecutionResult(data={"name": name}, errors=None)
+
+
+@override_settings(GRAPHQL_BATCH_ENABLED=True, GRAPHQL_PERSISTED_QUERIES_ENABLED=False)
+class BatchedOperationsTests(SimpleTestCase):
+    def execute(self, operations):
+        view = TracedGraphQLView(schema=schema)
+        request = RequestFactory().post("/graphql/", data=json.dumps(operations), content_type="application/json")
+        result = asyncio.run(view.execute_batch(request, None, None))
+        return view.events, [item.data["name"] for item in result.results]
+
+    def test_mutations_run_one_at_a_time_in_array_order(self):
+        events, names = self.execute([
+            {"query": "mutation M1 { logout(input: {}) { success } }"},
+            {"query": "query Q1 { health }"},
+            {"query": "mutation M2 { logout(input: {}) { success } }"},
+            {"query": "query Q2 { health } mutation M3 { logout(input: {}) { success } }", "operationName": "M3"},
+        ])
+
+        self.assertEqual(names, ["M1", "Q1", "M2", "M3"])
+        mutation_events = [event for event in events if event[1].startswith("M")]
+        self.assertEqual(mutation_events, [("start", "M1"), ("end", "M1"), ("start", "M2"), ("end", "M2"), ("start", "M3"), ("end", "M3")])
+        # Queries do not wait for the mutations
+        self.assertLess(events.index(("start", "Q1")), events.index(("end", "M1")))
+
+    def test_classification_parse_is_reused_by_execution(self):
+        parser = next(extension for extension in schema.extensions if isinstance(extension, ParserCache))
+        query = "mutation Cached { logout(input: {}) { success } }"
+
+        self.assertTrue(TracedGraphQLView(schema=schema)._is_mutation(query, None))
+        hits = parser.cached_parse_document.cache_info().hits
+        parser.cached_parse_document(query)
+        self.assertEqual(parser.cached_parse_document.cache_info().hits, hits + 1)
+
+    def test_unparsable_entries_are_not_mutations(self):
+        self.assertFalse(TracedGraphQLView(schema=schema)._is_mutation("{ nope", None))
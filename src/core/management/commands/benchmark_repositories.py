@@ -0,0 +1,115 @@
+import asyncio
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+from config.container import Container
+from config.strawberry_schema import schema
+from src.core.infrastructure.cache.find_cache import get_find_cache
+from src.core.infrastructure.database.async_driver import get_async_reader
+from src.feature.users.infrastructure.database.cached_repository import get_user_cache
+from src.feature.users.infrastructure.database.models import UserModel
+
+
+USER_FIND_ONE = 'query($email: String!) { userFindOne(input: {criteria: {filters: [{field: "email", operator: EQ, value: $email}]}}) { success } }'
+USERS_FIND = "{ usersFind(input: {criteria: {limit: 10}}) { success totalCount } }"
+SESSIONS_FIND = "{ sessionsFind(input: {criteria: {limit: 10}}) { success totalCount } }"
+
+# Every request hits the database: the find-result and read-through caches would otherwise serve most of the load from memory
+UNCACHED = {"FIND_CACHE_ENABLED": False, "USER_CACHE_ENABLED": False, "SESSION_CACHE_ENABLED": False}
+VARIANTS = {
+    "sync_to_async": {**UNCACHED, "DATABASE_ASYNC_DRIVER_REPOSITORIES": []},
+    "async_driver": {**UNCACHED, "DATABASE_ASYNC_DRIVER_REPOSITORIES": ["*"]},
+}
+
+
+class Command(BaseCommand):
+    help = "Compare p50/p99 GraphQL latency under concurrent load of repository reads on the sync ORM (sync_to_async) and on the async psycopg driver, caches off"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per variant")
+        parser.add_argument("--concurrency", type=int, default=50, help="Concurrent in-flight requests")
+        parser.add_argument("--users", type=int, default=10, help="Users seeded for the benchmark")
+        parser.add_argument("--rounds", type=int, default=3, help="Rounds per variant; variants run in a shuffled order every round")
+        parser.add_argument("--with-caches", action="store_true", help="Also measure the configured caches on the sync ORM path (each run starts cold)")
+
+    def handle(self, *args, **options):
+        prefix = f"bench-{uuid.uuid4().hex[:8]}-"
+        emails = [f"{prefix}{index}@example.com" for index in range(options["users"])]
+        if connection.vendor != "postgresql":
+            self.stderr.write("The async driver only serves PostgreSQL: on this database both variants run the sync ORM")
+        variants = dict(VARIANTS)
+        if options["with_caches"]:
+            variants["cached"] = {"DATABASE_ASYNC_DRIVER_REPOSITORIES": []}
+
+        rounds = max(options["rounds"], 1)
+        requests_per_round = max(options["requests"] // rounds, 1)
+        results = {name: ([], 0, 0.0) for name in variants}
+
+        try:
+            asyncio.run(self._seed(Container().context(), emails))
+            for _ in range(rounds):
+                # Interleaved, shuffled order: no variant always runs first (cold) or last (warm)
+                for name in random.sample(list(variants), len(variants)):
+                    with override_settings(**variants[name]):
+                        self._reset_caches()
+                        # Repositories pick their cache wrappers when built: one container per run
+                        context = Container().context()
+                        latencies, errors, elapsed = asyncio.run(self._run(context, emails, requests_per_round, options["concurrency"]))
+                    all_latencies, all_errors, all_elapsed = results[name]
+                    results[name] = (all_latencies + latencies, all_errors + errors, all_elapsed + elapsed)
+        finally:
+            UserModel.objects.filter(email__startswith=prefix).delete()
+
+        for name, (latencies, errors, elapsed) in results.items():
+            self._report(name, latencies, errors, elapsed)
+
+    @staticmethod
+    def _reset_caches():
+        get_find_cache().clear()
+        get_user_cache().clear()
+
+    async def _seed(self, context, emails):
+        for email in emails:
+            result = await schema.execute(f'mutation {{ userCreate(input: {{email: "{email}", password: "Bench-{uuid.uuid4().hex}", firstName: "Bench", lastName: "User"}}) {{ success }} }}', context_value=context)
+            if result.errors or not result.data["userCreate"]["success"]:
+                raise RuntimeError(f"Could not seed benchmark user {email}: {result.errors or result.data}")
+
+    async def _run(self, context, emails, total_requests, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+        errors = 0
+
+        async def request(index):
+            nonlocal errors
+            operation = index % 3
+            async with semaphore:
+                started = time.perf_counter()
+                if operation == 0:
+                    result = await schema.execute(USER_FIND_ONE, variable_values={"email": emails[index % len(emails)]}, context_value=context)
+                elif operation == 1:
+                    result = await schema.execute(USERS_FIND, context_value=context)
+                else:
+                    result = await schema.execute(SESSIONS_FIND, context_value=context)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if result.errors:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(request(index) for index in range(total_requests)))
+        elapsed = time.perf_counter() - started
+        # Its pools belong to this run's event loop
+        await get_async_reader().close()
+        return latencies, errors, elapsed
+
+    def _report(self, variant, latencies, errors, elapsed):
+        latencies.sort()
+
+        def percentile(value):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * value))]
+
+        self.stdout.write(f"{variant:<14} requests={len(latencies)} errors={errors} p50={percentile(0.50):.2f}ms p99={percentile(0.99):.2f}ms throughput={len(latencies) / elapsed:.1f} req/s")
@@ -1,63 +1,78 @@
-from typing import Optional, Tuple
+import ipaddress
+import logging
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
-from django.contrib.auth.hashers import check_password
+from django.conf import settings
 
 from src.core.application.use_cases.base_crud_use_cases import BaseCrudUseCases
 from src.core.domain.value_objects.email import Email
 from src.core.exceptions.base_exceptions import ValidationException, NotFoundError, UnauthorizedError
+from src.core.infrastructure.security.password_executor import PasswordHashExecutor, get_password_executor
+from src.feature.users.domain.entities.user import User
+from src.shared.criteria.base_criteria import Criteria, Filter, FilterOperator
 from src.feature.users.domain.repositories.user_repository import UserRepository
 from ...domain.entities.session import Session
 from ...domain.repositories.session_repository import SessionRepository
 from ...domain.value_objects.token_type import TokenType
 
+logger = logging.getLogger(__name__)
+
 
 class SessionUseCases(BaseCrudUseCases[Session]):
-    def __init__(self, session_repository: SessionRepository, user_repository: UserRepository):
+    def __init__(self, session_repository: SessionRepository, user_repository: UserRepository, stateless_access_tokens: Optional[bool] = None, password_executor: Optional[PasswordHashExecutor] = None):
         super().__init__(session_repository, "Session")
         self.session_repository = session_repository
         self.user_repository = user_repository
+        self.password_executor = password_executor or get_password_executor()
+        self.stateless_access_tokens = settings.JWT_STATELESS_ACCESS_TOKENS if stateless_access_tokens is None else stateless_access_tokens
+        self.stateless_access_duration = settings.JWT_STATELESS_ACCESS_TOKEN_LIFETIME
+        self.uniform_login_timing = settings.AUTH_UNIFORM_LOGIN_TIMING
 
-    async def authenticate_user(self, email: str, password: str, remember_me: bool = False, ip_address: Optional[str] = None, user_agent: Optional[str] = None, device_info: Optional[str] = None) -> Tuple[Session, Session]:  # (access_session, refresh_session)
+    async def authenticate_user(self, email: str, password: str, remember_me: bool = False, ip_address: Optional[str] = None, user_agent: Optional[str] = None, device_info: Optional[str] = None) -> Tuple[Session, Session, User]:  # (access_session, refresh_session, user)
         if not email or not password:
             raise ValidationException("Email and password are required")
 
         email_vo = Email(email)
-        user = await self.user_repository.find_by_email(email_vo)
-        if not user:
+        # Single query: user entity + password hash
+        credentials = await self.user_repository.find_credentials_by_email(email_vo)
+        if not credentials:
+            # Unknown emails (often served from the negative cache) still pay for one hash check,
+            # so response time does not reveal which accounts exist
+            if self.uniform_login_timing:
+                await self.password_executor.verify_dummy(password)
             raise UnauthorizedError("Invalid email or password")
 
+        user = credentials.user
+
         # Validate user status
         if not user.is_active:
             raise UnauthorizedError("Account is not active")
 
-        from src.feature.users.infrastructure.database.models import UserModel
-        from asgiref.sync import sync_to_async
-
-        try:
-            django_user = await sync_to_async(UserModel.objects.get)(id=user.id)
-            password_valid = await sync_to_async(django_user.check_password)(password)
-
-            if not password_valid:
-                raise UnauthorizedError("Invalid email or password")
-
-        except Exception:
+        # Verified on the dedicated hashing pool, not on the shared ORM thread
+        password_valid = await self.password_executor.verify(password, credentials.password_hash)
+        if not password_valid:
             raise UnauthorizedError("Invalid email or password")
 
         # Create sessions
         access_duration = 60 if not remember_me else 720  # 1 hour vs 12 hours
         refresh_duration = 7 if not remember_me else 30  # 7 days vs 30 days
 
-        access_session = Session.create_access_token_session(user_id=user.id, duration_minutes=access_duration, ip_address=ip_address, user_agent=user_agent)
-        access_session.device_info = device_info
-
-        refresh_session = Session.create_refresh_token_session(user_id=user.id, duration_days=refresh_duration, ip_address=ip_address, user_agent=user_agent)
+        refresh_session = Session.create_refresh_token_session(user_id=user.id, duration_days=refresh_duration, ip_address=ip_address, user_agent=user_agent, token_version=user.token_version)
         refresh_session.device_info = device_info
 
-        # Save sessions
-        access_session = await self.session_repository.save(access_session)
-        refresh_session = await self.session_repository.save(refresh_session)
+        if self.stateless_access_tokens:
+            # Only the refresh session is persisted
+            refresh_session = await self.session_repository.save(refresh_session)
+            access_session = Session.create_stateless_access_session(refresh_session, duration_minutes=self.stateless_access_duration)
+            return access_session, refresh_session, user
 
-        return access_session, refresh_session
+        access_session = Session.create_access_token_session(user_id=user.id, duration_minutes=access_duration, ip_address=ip_address, user_agent=user_agent, token_version=user.token_version)
+        access_session.device_info = device_info
+
+        # Save both sessions atomically in one multi-row INSERT
+        access_session, refresh_session = await self.session_repository.save_many([access_session, refresh_session])
+
+        return access_session, refresh_session, user
 
     async def refresh_access_token(self, refresh_token_id: UUID) -> Session:
         refresh_session = await self.session_repository.find_by_id(refresh_token_id)
@@ -70,8 +85,12 @@ class SessionUseCases(BaseCrudUseCases[Session]):
         if refresh_session.token_type != TokenType.REFRESH:
             raise ValidationException("Invalid token type for refresh operation")
 
+        if self.stateless_access_tokens:
+            # No write: the access token is derived from the refresh session
+            return Session.create_stateless_access_session(refresh_session, duration_minutes=self.stateless_access_duration)
+
         # Create new access token
-        access_session = Session.create_access_token_session(user_id=refresh_session.user_id, ip_address=refresh_session.ip_address, user_agent=refresh_session.user_agent)
+        access_session = Session.create_access_token_session(user_id=refresh_session.user_id, ip_address=refresh_session.ip_address, user_agent=refresh_session.user_agent, token_version=refresh_session.token_version)
         access_session.device_info = refresh_session.device_info
 
         return await self.session_repository.save(access_session)
@@ -86,8 +105,63 @@ class SessionUseCases(BaseCrudUseCases[Session]):
         return True
 
     async def logout_all_user_sessions(self, user_id: UUID) -> int:
+        # Tokens and sessions carry the user's token_version: bumping it (one row) fails every token check at once.
+        # The rows are still revoked so status, the revocation changelog and the affected count stay accurate
+        if not await self.user_repository.bump_token_version(user_id):
+            raise NotFoundError(f"User with ID {user_id} not found")
         return await self.session_repository.revoke_all_user_sessions(user_id)
 
+    async def ensure_token_version(self, user_id: UUID, token_version: int) -> User:
+        # Compared against the cached token version: UserCache documents how soon other workers see a bump
+        await self._ensure_current_version(user_id, token_version)
+        user = await self.user_repository.find_by_id(user_id)
+        if not user:
+            raise NotFoundError("User not found", error_code="USER_NOT_FOUND")
+        return user
+
+    async def _ensure_current_version(self, user_id: UUID, token_version: int):
+        current_version = await self.user_repository.find_token_version(user_id)
+        if current_version is None:
+            raise NotFoundError("User not found", error_code="USER_NOT_FOUND")
+        if current_version != token_version:
+            raise UnauthorizedError("Token has been revoked", error_code="TOKEN_REVOKED")
+
+    async def ensure_admin(self, user_id: UUID, session_id: UUID, token_version: int):
+        # Privileged operations: the token's session must still be live and the superuser flag is read from the database
+        session = await self.validate_session(session_id)
+        if session.user_id != user_id:
+            raise UnauthorizedError("Invalid token", error_code="UNAUTHORIZED")
+        # validate_session checked the session against the current version, the token must match it too
+        if session.token_version != token_version:
+            raise UnauthorizedError("Token has been revoked", error_code="TOKEN_REVOKED")
+        if not await self.user_repository.is_admin(user_id):
+            raise UnauthorizedError("Administrator privileges required", error_code="FORBIDDEN")
+
+    async def bulk_revoke_sessions(self, user_ids: Optional[List[UUID]] = None, criteria: Optional[Criteria] = None, ip_network: Optional[str] = None, chunk_size: Optional[int] = None) -> int:
+        criteria = criteria or Criteria()
+        if ip_network:
+            try:
+                network = ipaddress.ip_network(ip_network, strict=False)
+            except ValueError:
+                raise ValidationException(f"Invalid IP network: {ip_network}", error_code="INVALID_IP_NETWORK")
+            # Range comparison on ip_address: correct on PostgreSQL (inet), a plain string comparison on other backends
+            criteria.filters.filters.extend([Filter("ip_address", FilterOperator.GTE, str(network.network_address)), Filter("ip_address", FilterOperator.LTE, str(network.broadcast_address))])
+
+        # Never fall through to "revoke every active session" by accident
+        if not user_ids and not criteria.has_filters():
+            raise ValidationException("Specify user IDs, session filters or an IP network to revoke", error_code="BULK_REVOKE_SELECTOR_REQUIRED")
+
+        chunk_size = chunk_size or settings.SESSION_BULK_REVOKE_CHUNK_SIZE
+        if chunk_size <= 0:
+            raise ValidationException("Chunk size must be positive", error_code="INVALID_CHUNK_SIZE")
+
+        def report(affected_count: int, chunks: int):
+            logger.info("Bulk session revocation: %s sessions revoked after %s chunks", affected_count, chunks)
+
+        affected_count = await self.session_repository.revoke_sessions_bulk(user_ids=user_ids, criteria=criteria, chunk_size=chunk_size, on_progress=report)
+        logger.warning("Bulk session revocation finished: %s sessions revoked (users=%s, filters=%s)", affected_count, len(user_ids or []), len(criteria.filters.filters))
+        return affected_count
+
     async def validate_session(self, session_id: UUID) -> Session:
         session = await self.session_repository.find_by_id(session_id)
         if not session:
@@ -96,10 +170,17 @@ class SessionUseCases(BaseCrudUseCases[Session]):
         if not session.is_active:
             raise UnauthorizedError("Session is invalid or expired")
 
+        await self._ensure_current_version(session.user_id, session.token_version)
         return session
 
     async def get_user_active_sessions(self, user_id: UUID) -> list[Session]:
         return await self.session_repository.find_active_sessions_by_user_id(user_id)
 
+    async def get_active_sessions_by_user_ids(self, user_ids: List[UUID]) -> Dict[UUID, List[Session]]:
+        sessions_by_user: Dict[UUID, List[Session]] = {user_id: [] for user_id in user_ids}
+        for session in await self.session_repository.find_active_sessions_by_user_ids(user_ids):
+            sessions_by_user.setdefault(session.user_id, []).append(session)
+        return sessions_by_user
+
     async def cleanup_expired_sessions(self) -> int:
         return await self.session_repository.cleanup_expired_sessions()
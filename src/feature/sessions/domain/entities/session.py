@@ -17,6 +17,7 @@ class Session(BaseEntity):
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
         device_info: Optional[str] = None,
+        token_version: int = 0,
         id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
@@ -29,14 +30,16 @@ class Session(BaseEntity):
         self.ip_address = ip_address
         self.user_agent = user_agent
         self.device_info = device_info
+        self.token_version = token_version  # the user's token_version at login: "log out everywhere" ends sessions with an older one
 
     @property
     def is_active(self) -> bool:
-        return self.status == SessionStatus.ACTIVE and self.expires_at > datetime.now(timezone.utc)
+        return self.status == SessionStatus.ACTIVE and self.expires_at is not None and self.expires_at > datetime.now(timezone.utc)
 
     @property
     def is_expired(self) -> bool:
-        return self.expires_at <= datetime.now(timezone.utc)
+        # expires_at is None only for partially loaded (projected) sessions
+        return self.expires_at is not None and self.expires_at <= datetime.now(timezone.utc)
 
     def revoke(self):
         self.status = SessionStatus.REVOKED
@@ -58,6 +61,8 @@ class Session(BaseEntity):
         duration_minutes: int = 60,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
+        session_id: Optional[UUID] = None,
+        token_version: int = 0,
     ) -> "Session":
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=duration_minutes)
         return cls(
@@ -66,8 +71,24 @@ class Session(BaseEntity):
             expires_at=expires_at,
             ip_address=ip_address,
             user_agent=user_agent,
+            token_version=token_version,
+            id=session_id,
         )
 
+    @classmethod
+    def create_stateless_access_session(cls, refresh_session: "Session", duration_minutes: int = 5) -> "Session":
+        # Never persisted: shares the refresh session ID so revoking that row revokes the access token too
+        access_session = cls.create_access_token_session(
+            user_id=refresh_session.user_id,
+            duration_minutes=duration_minutes,
+            ip_address=refresh_session.ip_address,
+            user_agent=refresh_session.user_agent,
+            session_id=refresh_session.id,
+            token_version=refresh_session.token_version,
+        )
+        access_session.device_info = refresh_session.device_info
+        return access_session
+
     @classmethod
     def create_refresh_token_session(
         cls,
@@ -75,6 +96,7 @@ class Session(BaseEntity):
         duration_days: int = 7,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
+        token_version: int = 0,
     ) -> "Session":
         expires_at = datetime.now(timezone.utc) + timedelta(days=duration_days)
         return cls(
@@ -83,4 +105,5 @@ class Session(BaseEntity):
             expires_at=expires_at,
             ip_address=ip_address,
             user_agent=user_agent,
+            token_version=token_version,
         )
@@ -0,0 +1,11 @@
+import strawberry
+from typing import List, Optional
+from src.shared.criteria.graphql_inputs import CriteriaInput
+
+
+@strawberry.input
+class BulkRevokeSessionsInput:
+    user_ids: Optional[List[str]] = strawberry.field(default=None, description="Revoke the active sessions of these users")
+    criteria: Optional[CriteriaInput] = strawberry.field(default=None, description="Session filters, e.g. ip_address or created_at ranges (only filters are used)")
+    ip_network: Optional[str] = strawberry.field(default=None, description="Revoke sessions created from this CIDR range, e.g. 203.0.113.0/24 (matches the login client address; exact range semantics on PostgreSQL only)")
+    chunk_size: Optional[int] = strawberry.field(default=None, description="Sessions revoked per UPDATE statement")
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Callable, Optional, List, Tuple
 from uuid import UUID
 
 from src.core.domain.repositories.base_repository import BaseRepository
@@ -17,6 +18,10 @@ class SessionRepository(BaseRepository[Session]):
     async def find_active_sessions_by_user_id(self, user_id: UUID) -> List[Session]:
         pass
 
+    @abstractmethod
+    async def find_active_sessions_by_user_ids(self, user_ids: List[UUID]) -> List[Session]:
+        pass
+
     @abstractmethod
     async def find_by_user_and_token_type(self, user_id: UUID, token_type: TokenType) -> List[Session]:
         pass
@@ -29,10 +34,18 @@ class SessionRepository(BaseRepository[Session]):
     async def revoke_user_sessions_by_type(self, user_id: UUID, token_type: TokenType) -> int:
         pass
 
+    @abstractmethod
+    async def revoke_sessions_bulk(self, user_ids: Optional[List[UUID]] = None, criteria=None, chunk_size: int = 5000, on_progress: Optional[Callable[[int, int], None]] = None) -> int:
+        pass
+
     @abstractmethod
     async def cleanup_expired_sessions(self) -> int:
         pass
 
+    @abstractmethod
+    async def delete_expired_batch(self, expired_before: datetime, batch_size: int, expires_from: Optional[datetime] = None) -> Tuple[int, Optional[datetime]]:
+        pass
+
     @abstractmethod
     async def count_active_sessions_by_user(self, user_id: UUID) -> int:
         pass
@@ -1,9 +1,13 @@
 import strawberry
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Annotated, Optional
+from src.core.infrastructure.web.strawberry.helpers.context import request_loaders
 from ..value_objects.token_type import TokenType
 from ..value_objects.session_status import SessionStatus
 
+if TYPE_CHECKING:
+    from src.feature.users.domain.schemes.user import UserGraphQLType
+
 
 @strawberry.type
 class SessionGraphQLType:
@@ -24,6 +28,10 @@ class SessionGraphQLType:
     created_at: datetime = strawberry.field(name="createdAt", description="Creation timestamp")
     updated_at: datetime = strawberry.field(name="updatedAt", description="Last update timestamp")
 
+    @strawberry.field(description="Session owner, batched with the other sessions of the response")
+    async def user(self, info: strawberry.Info) -> Optional[Annotated["UserGraphQLType", strawberry.lazy("src.feature.users.domain.schemes.user")]]:
+        return await request_loaders(info).user_by_id.load(self.user_id)
+
     @classmethod
     def from_entity(cls, session) -> "SessionGraphQLType":
         return cls(
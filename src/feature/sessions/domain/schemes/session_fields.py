@@ -6,6 +6,23 @@ from ..value_objects.session_status import SessionStatus
 
 @dataclass
 class SessionFields:
+    # GraphQL field -> model columns it is built from, used to project list queries
+    GRAPHQL_COLUMNS = {
+        "id": ["id"],
+        "userId": ["user_id"],
+        "user": ["user_id"],
+        "tokenType": ["token_type"],
+        "status": ["status"],
+        "expiresAt": ["expires_at"],
+        "isActive": ["status", "expires_at"],
+        "isExpired": ["expires_at"],
+        "ipAddress": ["ip_address"],
+        "userAgent": ["user_agent"],
+        "deviceInfo": ["device_info"],
+        "createdAt": ["created_at"],
+        "updatedAt": ["updated_at"],
+    }
+
     @staticmethod
     def entity_to_model_data(entity) -> Dict[str, Any]:
         return {
@@ -17,6 +34,7 @@ class SessionFields:
             "ip_address": entity.ip_address,
             "user_agent": entity.user_agent,
             "device_info": entity.device_info,
+            "token_version": entity.token_version,
             "created_at": entity.created_at,
             "updated_at": entity.updated_at,
         }
@@ -26,12 +44,13 @@ class SessionFields:
         return {
             "id": model.id,
             "user_id": model.user_id,
-            "token_type": TokenType.from_string(model.token_type),
-            "status": SessionStatus.from_string(model.status),
+            "token_type": TokenType.from_string(model.token_type) if model.token_type is not None else None,
+            "status": SessionStatus.from_string(model.status) if model.status is not None else None,
             "expires_at": model.expires_at,
             "ip_address": model.ip_address,
             "user_agent": model.user_agent,
             "device_info": model.device_info,
+            "token_version": model.token_version,
             "created_at": model.created_at,
             "updated_at": model.updated_at,
         }
@@ -58,3 +77,12 @@ class SessionFields:
             "session_id": input_data.session_id,
             "logout_all": input_data.logout_all,
         }
+
+    @staticmethod
+    def bulk_revoke_args(input_data) -> Dict[str, Any]:
+        return {
+            "user_ids": input_data.user_ids,
+            "criteria": input_data.criteria,
+            "ip_network": input_data.ip_network,
+            "chunk_size": input_data.chunk_size,
+        }
@@ -1,4 +1,4 @@
-from .standard_responses import LoginResponse, RefreshTokenResponse, LogoutResponse, SessionCreateResponse, SessionUpdateResponse, SessionDeleteResponse, SessionFindResponse, SessionFindOneResponse
+from .standard_responses import LoginResponse, RefreshTokenResponse, LogoutResponse, BulkRevokeSessionsResponse, SessionCreateResponse, SessionUpdateResponse, SessionDeleteResponse, SessionFindResponse, SessionFindOneResponse
 
-__all__ = ["LoginResponse", "RefreshTokenResponse", "LogoutResponse", "SessionCreateResponse", "SessionUpdateResponse", "SessionDeleteResponse", "SessionFindResponse", "SessionFindOneResponse"]
+__all__ = ["LoginResponse", "RefreshTokenResponse", "LogoutResponse", "BulkRevokeSessionsResponse", "SessionCreateResponse", "SessionUpdateResponse", "SessionDeleteResponse", "SessionFindResponse", "SessionFindOneResponse"]
 
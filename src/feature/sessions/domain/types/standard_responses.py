@@ -38,3 +38,11 @@ class LogoutResponse:
     message: Optional[str] = strawberry.field(default=None, description="Response message")
     error_code: Optional[str] = strawberry.field(default=None, description="Error code if failed")
     sessions_affected: Optional[int] = strawberry.field(default=None, description="Number of sessions that were logged out")
+
+
+@strawberry.type
+class BulkRevokeSessionsResponse:
+    success: bool = strawberry.field(description="Operation success status")
+    message: Optional[str] = strawberry.field(default=None, description="Response message")
+    error_code: Optional[str] = strawberry.field(default=None, description="Error code if failed")
+    affected_count: Optional[int] = strawberry.field(default=None, description="Number of sessions revoked")
@@ -0,0 +1,300 @@
+# src/feature/sessions/infrastructure/database/cached_repository.py
+import copy
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+from django.utils import timezone
+
+from src.core.infrastructure.cache.shared_tier import INVALIDATION_MARK_SECONDS, LockedCounters, SharedTier, invalidated_since
+from src.core.infrastructure.cache.ttl_cache import TTLCache
+from src.core.infrastructure.metrics.registry import metrics_registry
+from src.feature.sessions.domain.entities.session import Session
+from src.feature.sessions.domain.repositories.session_repository import SessionRepository
+from src.feature.sessions.domain.value_objects.token_type import TokenType
+from src.feature.sessions.infrastructure.database.repositories import DjangoSessionRepository
+from src.shared.criteria.pagination import Page
+
+GLOBAL_GENERATION_KEY = "sessions:gen:all"
+
+
+class SessionValidityCache(LockedCounters):
+    """
+    Short TTL cache of sessions by ID for the validate/refresh hot path. Expiry needs no invalidation
+    (is_active compares expires_at on every read); status changes do.
+
+    Local tier: per process LRU+TTL, invalidated immediately in the process that performed the write.
+    Shared tier (optional Django cache alias): entries carry the per-user and global generation they
+    were read at; revoking bumps the generation, so every worker ignores older entries on its next
+    shared lookup. A worker holding a local copy keeps serving it until SESSION_CACHE_TTL_SECONDS
+    runs out: that TTL is the staleness window for revocations made by other workers.
+
+    Fills race with revocations, like UserCache: readers take begin_fill() before the database read.
+    set() drops the fill if this process invalidated anything meanwhile, tags the shared entry with the
+    global generation seen before the read, and drops it again if the session or its user was marked
+    invalidated since the read started.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 5.0, shared_alias: Optional[str] = None, shared_ttl_seconds: float = 60.0):
+        self.local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.shared = SharedTier(shared_alias, "Session cache")
+        self.shared_ttl_seconds = shared_ttl_seconds
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.shared_stale = 0
+        self.invalidations = 0
+        self.fills_dropped = 0
+
+    @staticmethod
+    def session_key(session_id: UUID) -> str:
+        return f"sessions:id:{session_id}"
+
+    @staticmethod
+    def user_generation_key(user_id: UUID) -> str:
+        return f"sessions:gen:user:{user_id}"
+
+    @staticmethod
+    def invalidated_key(session_id: UUID) -> str:
+        return f"sessions:invalidated:{session_id}"
+
+    @staticmethod
+    def user_invalidated_key(user_id: UUID) -> str:
+        return f"sessions:invalidated:user:{user_id}"
+
+    async def get(self, session_id: UUID) -> Optional[Session]:
+        session = self.local.get(session_id)
+        if session is None and self.shared.enabled:
+            session = await self._shared_get(session_id)
+            if session is not None:
+                self.local.set(session_id, session)
+        # Logout mutates and saves the returned session
+        return copy.deepcopy(session) if session is not None else None
+
+    async def begin_fill(self) -> Tuple[int, int, float]:
+        # Taken before the database read whose result is passed to set(); the user is not known yet
+        global_generation = await self.shared.get(GLOBAL_GENERATION_KEY, 0) if self.shared.enabled else 0
+        return self._generation, global_generation, time.time()
+
+    async def set(self, session: Session, fill: Tuple[int, int, float]):
+        generation, global_generation, started_at = fill
+        if generation != self._generation:
+            # Invalidated while the row was being read: it may predate that write
+            self._count("fills_dropped")
+            return
+
+        session = copy.deepcopy(session)
+        self.local.set(session.id, session)
+        if self.shared.enabled:
+            session_key = self.session_key(session.id)
+            entry = {"session": session, "user_gen": await self.shared.get(self.user_generation_key(session.user_id), 0), "global_gen": global_generation}
+            await self.shared.set(session_key, entry, timeout=self.shared_ttl_seconds)
+            # Invalidations write their mark before deleting/bumping: either that made this entry stale, or the mark is visible here
+            marks = await self.shared.get_many([self.invalidated_key(session.id), self.user_invalidated_key(session.user_id)])
+            if any(invalidated_since(invalidated_at, started_at) for invalidated_at in marks.values()):
+                self.local.delete(session.id)
+                await self.shared.delete(session_key)
+                self._count("fills_dropped")
+
+    async def invalidate_session(self, session_id: UUID):
+        self._begin_invalidation()
+        self.local.delete(session_id)
+        if self.shared.enabled:
+            await self.shared.set(self.invalidated_key(session_id), time.time(), timeout=INVALIDATION_MARK_SECONDS)
+            await self.shared.delete(self.session_key(session_id))
+        self._count("invalidations")
+
+    async def invalidate_user(self, user_id: UUID):
+        self._begin_invalidation()
+        self.local.delete_where(lambda _, session: session.user_id == user_id)
+        if self.shared.enabled:
+            await self.shared.set(self.user_invalidated_key(user_id), time.time(), timeout=INVALIDATION_MARK_SECONDS)
+            await self._bump_generation(self.user_generation_key(user_id))
+        self._count("invalidations")
+
+    async def invalidate_all(self):
+        # Fills read the global generation before the database, so a bump alone makes them stale
+        self._begin_invalidation()
+        self.local.clear()
+        if self.shared.enabled:
+            await self._bump_generation(GLOBAL_GENERATION_KEY)
+        self._count("invalidations")
+
+    def evict_expired(self, expired_before: datetime) -> int:
+        # Reaped rows were already invalid through expires_at; dropping them just frees memory.
+        # Shared entries age out on their own TTL
+        return self.local.delete_where(lambda _, session: session.expires_at is not None and session.expires_at < expired_before)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "local": self.local.snapshot(),
+            "shared": {"alias": self.shared.alias, "ttl_seconds": self.shared_ttl_seconds, "hits": self.shared_hits, "misses": self.shared_misses, "stale": self.shared_stale, "errors": self.shared.errors} if self.shared.enabled else None,
+            "invalidations": self.invalidations,
+            "fills_dropped": self.fills_dropped,
+        }
+
+    def _begin_invalidation(self):
+        with self._lock:
+            self._generation += 1
+
+    # ===== SHARED TIER =====
+    async def _shared_get(self, session_id: UUID) -> Optional[Session]:
+        session_key = self.session_key(session_id)
+        found = await self.shared.get_many([session_key, GLOBAL_GENERATION_KEY])
+        entry = found.get(session_key)
+        if entry is None:
+            self._count("shared_misses")
+            return None
+
+        user_key = self.user_generation_key(entry["session"].user_id)
+        user_generation = await self.shared.get(user_key, 0)
+        if entry["user_gen"] != user_generation or entry["global_gen"] != found.get(GLOBAL_GENERATION_KEY, 0):
+            self._count("shared_stale")
+            return None
+
+        self._count("shared_hits")
+        return entry["session"]
+
+    async def _bump_generation(self, key: str):
+        # Generations outlive every entry written before the bump
+        timeout = self.shared_ttl_seconds * 2
+        await self.shared.add(key, 0, timeout=timeout)
+        if await self.shared.incr(key) is None:
+            # Lost the key between add and incr (eviction/outage): fall back to a plain write
+            await self.shared.set(key, 1, timeout=timeout)
+
+
+class CachedSessionRepository(SessionRepository):
+    """Caches find_by_id; every status-changing write evicts the affected sessions."""
+
+    def __init__(self, repository: SessionRepository, cache: Optional[SessionValidityCache] = None):
+        self.repository = repository
+        self.cache = cache or get_session_cache()
+
+    # ===== CACHED READS =====
+    async def find_by_id(self, entity_id: UUID) -> Optional[Session]:
+        session = await self.cache.get(entity_id)
+        if session is None:
+            fill = await self.cache.begin_fill()
+            session = await self.repository.find_by_id(entity_id)
+            if session is not None:
+                await self.cache.set(session, fill)
+        return session
+
+    # ===== WRITES =====
+    async def save(self, entity: Session) -> Session:
+        is_new = entity.is_new
+        fill = await self.cache.begin_fill() if is_new else None
+        saved = await self.repository.save(entity)
+        # New sessions warm the cache (the refresh after a login); updates (logout) evict
+        if is_new:
+            await self.cache.set(saved, fill)
+        else:
+            await self.cache.invalidate_session(saved.id)
+        return saved
+
+    async def save_many(self, entities: List[Session]) -> List[Session]:
+        new_ids = {entity.id for entity in entities if entity.is_new}
+        fill = await self.cache.begin_fill() if new_ids else None
+        saved = await self.repository.save_many(entities)
+        for session in saved:
+            if session.id in new_ids:
+                await self.cache.set(session, fill)
+            else:
+                await self.cache.invalidate_session(session.id)
+        return saved
+
+    async def delete(self, entity_id: UUID) -> bool:
+        deleted = await self.repository.delete(entity_id)
+        await self.cache.invalidate_session(entity_id)
+        return deleted
+
+    async def revoke_all_user_sessions(self, user_id: UUID) -> int:
+        revoked = await self.repository.revoke_all_user_sessions(user_id)
+        await self.cache.invalidate_user(user_id)
+        return revoked
+
+    async def revoke_user_sessions_by_type(self, user_id: UUID, token_type: TokenType) -> int:
+        revoked = await self.repository.revoke_user_sessions_by_type(user_id, token_type)
+        await self.cache.invalidate_user(user_id)
+        return revoked
+
+    async def revoke_sessions_bulk(self, user_ids: Optional[List[UUID]] = None, criteria=None, chunk_size: int = 5000, on_progress: Optional[Callable[[int, int], None]] = None) -> int:
+        revoked = await self.repository.revoke_sessions_bulk(user_ids=user_ids, criteria=criteria, chunk_size=chunk_size, on_progress=on_progress)
+        await self.cache.invalidate_all()
+        return revoked
+
+    async def cleanup_expired_sessions(self) -> int:
+        now = timezone.now()
+        deleted = await self.repository.cleanup_expired_sessions()
+        self.cache.evict_expired(now)
+        return deleted
+
+    async def delete_expired_batch(self, expired_before: datetime, batch_size: int, expires_from: Optional[datetime] = None) -> Tuple[int, Optional[datetime]]:
+        deleted, checkpoint = await self.repository.delete_expired_batch(expired_before, batch_size, expires_from)
+        if deleted:
+            self.cache.evict_expired(expired_before)
+        return deleted, checkpoint
+
+    # ===== PASS-THROUGH =====
+    async def find_by_ids(self, entity_ids: List[UUID]) -> List[Session]:
+        return await self.repository.find_by_ids(entity_ids)
+
+    async def exists_by_id(self, entity_id: UUID) -> bool:
+        return await self.repository.exists_by_id(entity_id)
+
+    async def find_by_user_id(self, user_id: UUID) -> List[Session]:
+        return await self.repository.find_by_user_id(user_id)
+
+    async def find_active_sessions_by_user_id(self, user_id: UUID) -> List[Session]:
+        return await self.repository.find_active_sessions_by_user_id(user_id)
+
+    async def find_active_sessions_by_user_ids(self, user_ids: List[UUID]) -> List[Session]:
+        return await self.repository.find_active_sessions_by_user_ids(user_ids)
+
+    async def find_by_user_and_token_type(self, user_id: UUID, token_type: TokenType) -> List[Session]:
+        return await self.repository.find_by_user_and_token_type(user_id, token_type)
+
+    async def count_active_sessions_by_user(self, user_id: UUID) -> int:
+        return await self.repository.count_active_sessions_by_user(user_id)
+
+    async def find_with_criteria(self, criteria) -> List[Session]:
+        return await self.repository.find_with_criteria(criteria)
+
+    async def find_page_with_criteria(self, criteria) -> Page[Session]:
+        return await self.repository.find_page_with_criteria(criteria)
+
+    async def find_one_with_criteria(self, criteria) -> Optional[Session]:
+        return await self.repository.find_one_with_criteria(criteria)
+
+    async def count_with_criteria(self, criteria) -> int:
+        return await self.repository.count_with_criteria(criteria)
+
+    async def data_version(self):
+        return await self.repository.data_version()
+
+
+_session_cache: Optional[SessionValidityCache] = None
+
+
+def get_session_cache() -> SessionValidityCache:
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = SessionValidityCache(
+            max_size=settings.SESSION_CACHE_MAX_SIZE,
+            ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+            shared_alias=settings.SESSION_CACHE_SHARED_ALIAS,
+            shared_ttl_seconds=settings.SESSION_CACHE_SHARED_TTL_SECONDS,
+        )
+        metrics_registry.register("session_cache", _session_cache.snapshot)
+    return _session_cache
+
+
+def build_session_repository(repository: Optional[SessionRepository] = None) -> SessionRepository:
+    repository = repository or DjangoSessionRepository()
+    return CachedSessionRepository(repository) if settings.SESSION_CACHE_ENABLED else repository
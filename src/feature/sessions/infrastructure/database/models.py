@@ -34,6 +34,9 @@ class SessionModel(models.Model):
     user_agent = models.TextField(null=True, blank=True, verbose_name="User Agent")
     device_info = models.CharField(max_length=255, null=True, blank=True, verbose_name="Device Info")
 
+    # User's token_version when the session was created
+    token_version = models.PositiveIntegerField(default=0, verbose_name="Token Version")
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
@@ -62,3 +65,34 @@ class SessionModel(models.Model):
     def clean(self):
         super().clean()
         # Add any model-level validation here if needed
+
+
+class SessionRevocationModel(models.Model):
+    """Append-only revocation changelog; workers replay it by seq into their in-memory revocation set."""
+
+    class ScopeChoices(models.TextChoices):
+        SESSION = "session", "Session"
+        USER = "user", "User"
+
+    seq = models.BigAutoField(primary_key=True)
+    scope = models.CharField(max_length=10, choices=ScopeChoices.choices, verbose_name="Scope")
+
+    # No foreign keys: entries must survive the session rows being reaped/partitions dropped
+    session_id = models.UUIDField(null=True, blank=True, verbose_name="Session ID")
+    user_id = models.UUIDField(verbose_name="User ID")
+    token_type = models.CharField(max_length=10, choices=SessionModel.TokenTypeChoices.choices, null=True, blank=True, verbose_name="Token Type")  # user scope: None = every type
+
+    revoked_at = models.DateTimeField(verbose_name="Revoked At")  # user scope: tokens issued at or before are revoked
+    expires_at = models.DateTimeField(verbose_name="Expires At")  # no token covered by the entry outlives this
+
+    class Meta:
+        app_label = "auth_sessions"
+        db_table = "auth_session_revocations"
+        verbose_name = "Session Revocation"
+        verbose_name_plural = "Session Revocations"
+        indexes = [
+            models.Index(fields=["expires_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.seq} {self.scope} {self.session_id or self.user_id}"
@@ -0,0 +1,198 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .models import SessionModel
+
+TABLE = SessionModel._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+LEGACY_TABLE = f"{TABLE}_unpartitioned"
+BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+@dataclass
+class SessionPartition:
+    name: str
+    start: datetime
+    end: datetime
+
+
+class SessionPartitionManager:
+    """
+    Range partitioning of auth_sessions on expires_at (PostgreSQL only). Future partitions are
+    created ahead of time; a partition whose upper bound is in the past only holds expired
+    sessions and is detached and dropped as a metadata operation instead of row deletes.
+    """
+
+    def __init__(self, using: str = "default", interval: Optional[str] = None, premake: Optional[int] = None, retention: Optional[int] = None, drop: Optional[bool] = None):
+        self.connection = connections[using]
+        self.interval = interval or settings.SESSION_PARTITION_INTERVAL
+        self.premake = settings.SESSION_PARTITION_PREMAKE if premake is None else premake
+        self.retention = settings.SESSION_PARTITION_RETENTION if retention is None else retention
+        self.drop = settings.SESSION_PARTITION_DROP if drop is None else drop
+        if self.interval not in ("day", "week"):
+            raise ValueError(f"Unsupported partition interval: {self.interval}")
+
+    # ===== STATE =====
+    def is_supported(self) -> bool:
+        return self.connection.vendor == "postgresql"
+
+    def is_partitioned(self) -> bool:
+        if not self.is_supported():
+            return False
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+            row = cursor.fetchone()
+        return bool(row) and row[0] == "p"
+
+    def partitions(self) -> List[SessionPartition]:
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = %s ORDER BY child.relname",
+                [TABLE],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            match = BOUND_PATTERN.search(bound or "")
+            if match:
+                partitions.append(SessionPartition(name, self._parse_bound(match.group(1)), self._parse_bound(match.group(2))))
+        return partitions
+
+    # ===== MAINTENANCE =====
+    def maintain(self, now: Optional[datetime] = None) -> dict:
+        now = now or timezone.now()
+        created = self.create_future_partitions(now)
+        removed = self.remove_expired_partitions(now)
+        return {"created": created, "removed": removed}
+
+    def create_future_partitions(self, now: datetime) -> List[str]:
+        existing = {partition.name for partition in self.partitions()}
+        created = []
+        start = self._interval_start(now)
+        for _ in range(self.premake + 1):
+            end = start + self._step()
+            name = self._partition_name(start)
+            if name not in existing:
+                self._create_partition(name, start, end)
+                created.append(name)
+            start = end
+        return created
+
+    def remove_expired_partitions(self, now: datetime) -> List[str]:
+        # Every row in a partition whose upper bound is <= cutoff has expired
+        cutoff = self._interval_start(now) - self._step() * self.retention
+        removed = []
+        for partition in self.partitions():
+            if partition.end > cutoff:
+                continue
+            with self.connection.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{partition.name}"')
+                if self.drop:
+                    cursor.execute(f'DROP TABLE "{partition.name}"')
+            removed.append(partition.name)
+        return removed
+
+    # ===== CONVERSION =====
+    def convert_to_partitioned(self, now: Optional[datetime] = None):
+        # Rebuilds the table as a partitioned one (copying rows); run in a maintenance window
+        if not self.is_supported() or self.is_partitioned():
+            return
+
+        now = now or timezone.now()
+        with transaction.atomic(using=self.connection.alias), self.connection.cursor() as cursor:
+            index_definitions = self._index_definitions(cursor)
+            foreign_keys = self._foreign_keys(cursor)
+
+            cursor.execute(f'SELECT min(expires_at) FROM "{TABLE}"')
+            oldest = cursor.fetchone()[0] or now
+
+            cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{LEGACY_TABLE}"')
+            cursor.execute(f'CREATE TABLE "{TABLE}" (LIKE "{LEGACY_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (id, expires_at)) PARTITION BY RANGE (expires_at)')
+            cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+
+            start = self._interval_start(min(oldest, now))
+            end = self._interval_start(now) + self._step() * (self.premake + 1)
+            while start < end:
+                cursor.execute(self._create_partition_sql(self._partition_name(start), start, start + self._step()))
+                start += self._step()
+
+            cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{LEGACY_TABLE}"')
+            cursor.execute(f'DROP TABLE "{LEGACY_TABLE}"')
+            self._restore_constraints(cursor, index_definitions, foreign_keys)
+
+    def convert_to_regular(self):
+        if not self.is_partitioned():
+            return
+
+        with transaction.atomic(using=self.connection.alias), self.connection.cursor() as cursor:
+            index_definitions = self._index_definitions(cursor)
+            foreign_keys = self._foreign_keys(cursor)
+
+            cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{LEGACY_TABLE}"')
+            cursor.execute(f'CREATE TABLE "{TABLE}" (LIKE "{LEGACY_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (id))')
+            cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{LEGACY_TABLE}"')
+            cursor.execute(f'DROP TABLE "{LEGACY_TABLE}" CASCADE')
+            self._restore_constraints(cursor, index_definitions, foreign_keys)
+
+    # ===== HELPERS =====
+    def _create_partition(self, name: str, start: datetime, end: datetime):
+        with transaction.atomic(using=self.connection.alias), self.connection.cursor() as cursor:
+            cursor.execute(f'SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE expires_at >= %s AND expires_at < %s LIMIT 1', [start, end])
+            if cursor.fetchone() is None:
+                cursor.execute(self._create_partition_sql(name, start, end))
+                return
+
+            # Rows beyond the premade horizon landed in the default partition: move them first
+            cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"')
+            cursor.execute(self._create_partition_sql(name, start, end))
+            cursor.execute(f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" WHERE expires_at >= %s AND expires_at < %s RETURNING *) INSERT INTO "{TABLE}" SELECT * FROM moved', [start, end])
+            cursor.execute(f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT')
+
+    def _create_partition_sql(self, name: str, start: datetime, end: datetime) -> str:
+        return f"CREATE TABLE IF NOT EXISTS \"{name}\" PARTITION OF \"{TABLE}\" FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+
+    def _index_definitions(self, cursor) -> List[str]:
+        # Django's index names are kept so later migrations can still reference them
+        cursor.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p')", [TABLE, TABLE])
+        return [row[0] for row in cursor.fetchall()]
+
+    def _foreign_keys(self, cursor) -> List[tuple]:
+        cursor.execute("SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'", [TABLE])
+        return cursor.fetchall()
+
+    def _restore_constraints(self, cursor, index_definitions: List[str], foreign_keys: List[tuple]):
+        # The new primary key got a suffixed name while the old table still existed
+        cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'", [TABLE])
+        primary_key = cursor.fetchone()[0]
+        if primary_key != f"{TABLE}_pkey":
+            cursor.execute(f'ALTER TABLE "{TABLE}" RENAME CONSTRAINT "{primary_key}" TO "{TABLE}_pkey"')
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+    def _interval_start(self, moment: datetime) -> datetime:
+        moment = moment.astimezone(dt_timezone.utc)
+        start = datetime(moment.year, moment.month, moment.day, tzinfo=dt_timezone.utc)
+        if self.interval == "week":
+            start -= timedelta(days=start.weekday())
+        return start
+
+    def _step(self) -> timedelta:
+        return timedelta(days=7 if self.interval == "week" else 1)
+
+    def _partition_name(self, start: datetime) -> str:
+        return f"{TABLE}_p{start:%Y%m%d}"
+
+    @staticmethod
+    def _parse_bound(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace(" ", "T")).astimezone(dt_timezone.utc)
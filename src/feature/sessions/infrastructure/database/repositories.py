@@ -1,68 +1,174 @@
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, List, Tuple
 from uuid import UUID
 from asgiref.sync import sync_to_async
-from django.core.exceptions import ObjectDoesNotExist
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
 from src.core.infrastructure.database.repositories import DjangoBaseRepository
+from src.core.infrastructure.database.routing import pin_to_primary
 from src.feature.sessions.domain.entities.session import Session
 from src.feature.sessions.domain.repositories.session_repository import SessionRepository
 from src.feature.sessions.domain.value_objects.token_type import TokenType
 from src.feature.sessions.domain.value_objects.session_status import SessionStatus
-from src.feature.sessions.infrastructure.database.models import SessionModel
+from src.feature.sessions.infrastructure.database.models import SessionModel, SessionRevocationModel
 from src.feature.sessions.infrastructure.database.mappers.session_mapper import SessionEntityMapper
+from src.feature.sessions.infrastructure.services.revocation_registry import get_revocation_registry
 
 
 class DjangoSessionRepository(DjangoBaseRepository[Session], SessionRepository):
-    def __init__(self):
+    def __init__(self, async_driver: Optional[bool] = None):
         mapper = SessionEntityMapper()
-        super().__init__(SessionModel, mapper)
+        super().__init__(SessionModel, mapper, async_driver=async_driver)
 
-    async def save(self, entity: Session) -> Session:
+    def _insert_model_data(self, entity: Session) -> Dict[str, Any]:
         data = self.mapper.entity_to_model_data(entity)
+        data["user_id"] = entity.user_id
+        return data
 
-        try:
-            model = await sync_to_async(SessionModel.objects.get)(id=entity.id)
-            for key, value in data.items():
-                setattr(model, key, value)
-            await sync_to_async(model.save)()
-        except ObjectDoesNotExist:
-            data["user_id"] = entity.user_id
-            model = await sync_to_async(SessionModel.objects.create)(**data)
-
-        return self.mapper.model_to_entity(model)
+    async def save(self, entity: Session) -> Session:
+        # A loaded session leaving ACTIVE (logout/revoke) goes to the revocation changelog
+        ending = not entity.is_new and "status" in entity.dirty_fields and entity.status != SessionStatus.ACTIVE
+        saved = await super().save(entity)
+        if ending:
+            await self._log_revocations([self._session_revocation(saved.id, saved.user_id, saved.expires_at)])
+        return saved
 
     async def find_by_user_id(self, user_id: UUID) -> List[Session]:
-        models = await sync_to_async(list)(SessionModel.objects.filter(user_id=user_id).order_by("-created_at"))
+        models = await self._query_list(SessionModel.objects.filter(user_id=user_id).order_by("-created_at"))
         return self.mapper.models_to_entities(models)
 
     async def find_active_sessions_by_user_id(self, user_id: UUID) -> List[Session]:
+        # A login racing a "log out everywhere" can still create an ACTIVE session with the old token_version
         now = timezone.now()
-        models = await sync_to_async(list)(SessionModel.objects.filter(user_id=user_id, status=SessionModel.StatusChoices.ACTIVE, expires_at__gt=now).order_by("-created_at"))
+        models = await self._query_list(SessionModel.objects.filter(user_id=user_id, status=SessionModel.StatusChoices.ACTIVE, expires_at__gt=now, token_version=F("user__token_version")).order_by("-created_at"))
+        return self.mapper.models_to_entities(models)
+
+    async def find_active_sessions_by_user_ids(self, user_ids: List[UUID]) -> List[Session]:
+        if not user_ids:
+            return []
+        now = timezone.now()
+        models = await self._query_list(SessionModel.objects.filter(user_id__in=list(user_ids), status=SessionModel.StatusChoices.ACTIVE, expires_at__gt=now, token_version=F("user__token_version")).order_by("-created_at"))
         return self.mapper.models_to_entities(models)
 
     async def find_by_user_and_token_type(self, user_id: UUID, token_type: TokenType) -> List[Session]:
-        models = await sync_to_async(list)(SessionModel.objects.filter(user_id=user_id, token_type=token_type.value).order_by("-created_at"))
+        models = await self._query_list(SessionModel.objects.filter(user_id=user_id, token_type=token_type.value).order_by("-created_at"))
         return self.mapper.models_to_entities(models)
 
     async def revoke_all_user_sessions(self, user_id: UUID) -> int:
-        updated_count = await sync_to_async(SessionModel.objects.filter(user_id=user_id, status=SessionModel.StatusChoices.ACTIVE).update)(status=SessionModel.StatusChoices.REVOKED, updated_at=timezone.now())
+        now = timezone.now()
+        updated_count = await self._query_update(SessionModel.objects.filter(user_id=user_id, status=SessionModel.StatusChoices.ACTIVE), status=SessionModel.StatusChoices.REVOKED, updated_at=now)
+        if updated_count:
+            await self._log_revocations([self._user_revocation(user_id, now)])
 
         return updated_count
 
     async def revoke_user_sessions_by_type(self, user_id: UUID, token_type: TokenType) -> int:
-        updated_count = await sync_to_async(SessionModel.objects.filter(user_id=user_id, token_type=token_type.value, status=SessionModel.StatusChoices.ACTIVE).update)(status=SessionModel.StatusChoices.REVOKED, updated_at=timezone.now())
+        now = timezone.now()
+        updated_count = await self._query_update(SessionModel.objects.filter(user_id=user_id, token_type=token_type.value, status=SessionModel.StatusChoices.ACTIVE), status=SessionModel.StatusChoices.REVOKED, updated_at=now)
+        if updated_count:
+            await self._log_revocations([self._user_revocation(user_id, now, token_type)])
 
         return updated_count
 
-    async def cleanup_expired_sessions(self) -> int:
+    async def revoke_sessions_bulk(self, user_ids: Optional[List[UUID]] = None, criteria=None, chunk_size: int = 5000, on_progress: Optional[Callable[[int, int], None]] = None) -> int:
+        from src.shared.criteria.converter import CriteriaConverter
+        from src.shared.criteria.base_criteria import Criteria
+
+        # Set-based and chunked: UPDATE ... WHERE id IN (<chunk of ids>). Revoked rows drop out of the
+        # scope, so each round takes the next chunk; only (id, user_id, expires_at) reach Python, for the changelog
         now = timezone.now()
-        deleted_count, _ = await sync_to_async(SessionModel.objects.filter(expires_at__lt=now).delete)()
+        scope = SessionModel.objects.filter(status=SessionModel.StatusChoices.ACTIVE, expires_at__gt=now)
+        if criteria is not None:
+            scope = CriteriaConverter.apply_criteria(scope, Criteria(filters=criteria.filters))
+        # Whole users revoked: one user-scope changelog entry per user instead of one per session
+        user_scope = user_ids is not None and criteria is None
+
+        user_chunks = [user_ids[index : index + chunk_size] for index in range(0, len(user_ids), chunk_size)] if user_ids else [None]
+        affected_count, chunks = 0, 0
+        pin_to_primary()
+        for user_chunk in user_chunks:
+            scoped = scope.filter(user_id__in=user_chunk) if user_chunk is not None else scope
+            while True:
+                selected_count, updated_count, entries = await sync_to_async(self._revoke_chunk_sync)(scoped, chunk_size, user_scope)
+                if not selected_count:
+                    break
+                if settings.SESSION_REVOCATION_LOG_ENABLED:
+                    get_revocation_registry().apply(entries)
+                affected_count += updated_count
+                chunks += 1
+                if on_progress:
+                    on_progress(affected_count, chunks)
+                if selected_count < chunk_size:
+                    break
+
+        if affected_count:
+            await self._data_changed()
+        return affected_count
+
+    def _revoke_chunk_sync(self, scoped, chunk_size: int, user_scope: bool) -> Tuple[int, int, List[SessionRevocationModel]]:
+        # The UPDATE and its changelog commit together; the selected rows stay locked until then, so exactly
+        # the rows this chunk revoked are logged (a concurrent logout either went first or waits)
+        with transaction.atomic():
+            chunk = list(scoped.select_for_update(of=("self",)).order_by().values_list("id", "user_id", "expires_at")[:chunk_size])
+            if not chunk:
+                return 0, 0, []
+            now = timezone.now()
+            updated_count = SessionModel.objects.filter(id__in=[row[0] for row in chunk]).update(status=SessionModel.StatusChoices.REVOKED, updated_at=now)
+            if user_scope:
+                entries = [self._user_revocation(user_id, now) for user_id in dict.fromkeys(row[1] for row in chunk)]
+            else:
+                entries = [self._session_revocation(session_id, session_user_id, expires_at, now) for session_id, session_user_id, expires_at in chunk]
+            if settings.SESSION_REVOCATION_LOG_ENABLED:
+                SessionRevocationModel.objects.bulk_create(entries)
+        return len(chunk), updated_count, entries
 
-        return deleted_count
+    async def cleanup_expired_sessions(self) -> int:
+        # Bounded batches instead of one long DELETE holding locks on the whole expired range
+        now = timezone.now()
+        deleted_count, checkpoint = 0, None
+        while True:
+            deleted, checkpoint = await self.delete_expired_batch(now, settings.SESSION_REAPER_BATCH_SIZE, checkpoint)
+            deleted_count += deleted
+            if deleted < settings.SESSION_REAPER_BATCH_SIZE:
+                return deleted_count
+
+    async def delete_expired_batch(self, expired_before: datetime, batch_size: int, expires_from: Optional[datetime] = None) -> Tuple[int, Optional[datetime]]:
+        # Index range scan on expires_at picks the ids, then a primary key DELETE; returns the
+        # last expires_at reached so the next batch (or a resumed run) starts from there
+        queryset = SessionModel.objects.filter(expires_at__lt=expired_before)
+        if expires_from is not None:
+            queryset = queryset.filter(expires_at__gte=expires_from)
+
+        rows = await self._query_list(queryset.order_by("expires_at").values_list("id", "expires_at")[:batch_size])
+        if not rows:
+            return 0, expires_from
+
+        deleted_count = await self._query_delete(SessionModel.objects.filter(id__in=[row[0] for row in rows]))
+        return deleted_count, rows[-1][1]
 
     async def count_active_sessions_by_user(self, user_id: UUID) -> int:
         now = timezone.now()
-        count = await sync_to_async(SessionModel.objects.filter(user_id=user_id, status=SessionModel.StatusChoices.ACTIVE, expires_at__gt=now).count)()
+        count = await self._query_count(SessionModel.objects.filter(user_id=user_id, status=SessionModel.StatusChoices.ACTIVE, expires_at__gt=now, token_version=F("user__token_version")))
 
         return count
+
+    # ===== REVOCATION CHANGELOG =====
+    @staticmethod
+    def _session_revocation(session_id: UUID, user_id: UUID, expires_at: Optional[datetime], revoked_at: Optional[datetime] = None) -> SessionRevocationModel:
+        revoked_at = revoked_at or timezone.now()
+        return SessionRevocationModel(scope=SessionRevocationModel.ScopeChoices.SESSION, session_id=session_id, user_id=user_id, revoked_at=revoked_at, expires_at=expires_at or revoked_at + timedelta(days=settings.SESSION_REVOCATION_USER_TTL_DAYS))
+
+    @staticmethod
+    def _user_revocation(user_id: UUID, revoked_at: datetime, token_type: Optional[TokenType] = None) -> SessionRevocationModel:
+        # Covers every token of the user issued up to now: keep it as long as the longest token lifetime
+        return SessionRevocationModel(scope=SessionRevocationModel.ScopeChoices.USER, user_id=user_id, token_type=token_type.value if token_type else None, revoked_at=revoked_at, expires_at=revoked_at + timedelta(days=settings.SESSION_REVOCATION_USER_TTL_DAYS))
+
+    async def _log_revocations(self, entries: List[SessionRevocationModel]):
+        if not settings.SESSION_REVOCATION_LOG_ENABLED or not entries:
+            return
+        pin_to_primary()
+        await sync_to_async(SessionRevocationModel.objects.bulk_create)(entries)
+        get_revocation_registry().apply(entries)
@@ -3,10 +3,11 @@ from .auth_resolvers import (
     AuthQueries,
     AuthMutations,
 )
+from .loaders import build_active_sessions_loader
 
 __all__ = [
     "AuthResolvers",
     "AuthQueries",
     "AuthMutations",
+    "build_active_sessions_loader",
 ]
-
@@ -2,65 +2,30 @@ import strawberry
 from ...domain.inputs.login import LoginInput
 from ...domain.inputs.refresh import RefreshTokenInput
 from ...domain.inputs.logout import LogoutInput
+from ...domain.inputs.bulk_revoke import BulkRevokeSessionsInput
 from ...domain.inputs.find import SessionFindInput
 from ...domain.inputs.find_one import SessionFindOneInput
-from ...domain.types.standard_responses import LoginResponse, RefreshTokenResponse, LogoutResponse, SessionFindResponse, SessionFindOneResponse
+from ...domain.types.standard_responses import LoginResponse, RefreshTokenResponse, LogoutResponse, BulkRevokeSessionsResponse, SessionFindResponse, SessionFindOneResponse
 
-from ...application.use_cases.session_use_cases import SessionUseCases
-from src.feature.users.infrastructure.database.repositories import DjangoUserRepository
-from ..database.repositories import DjangoSessionRepository
+from src.core.infrastructure.web.strawberry.helpers.context import bearer_token, client_ip, http_request, request_container
 from ..services.auth_service import AuthService
 
 
 @strawberry.type
 class AuthResolvers:
-    def __init__(self):
-        self._session_repository = None
-        self._user_repository = None
-        self._use_cases = None
-        self._service = None
-
-    @property
-    def session_repository(self):
-        if self._session_repository is None:
-            self._session_repository = DjangoSessionRepository()
-        return self._session_repository
-
-    @property
-    def user_repository(self):
-        if self._user_repository is None:
-            self._user_repository = DjangoUserRepository()
-        return self._user_repository
-
-    @property
-    def use_cases(self):
-        if self._use_cases is None:
-            self._use_cases = SessionUseCases(self.session_repository, self.user_repository)
-        return self._use_cases
-
-    @property
-    def service(self):
-        if self._service is None:
-            self._service = AuthService(self.use_cases, self.user_repository)
-        return self._service
+    def __init__(self, service: AuthService):
+        # Built once by the application container and shared by every request
+        self.service = service
 
     # ===== AUTH MUTATIONS =====
     @strawberry.mutation(name="login")
     async def login(self, input: LoginInput, info: strawberry.Info) -> LoginResponse:
-        # Manejo seguro del contexto - versión simplificada
+        request = http_request(info)
         request_info = {
-            "ip_address": "127.0.0.1",  # Por ahora hardcodeado
-            "user_agent": "GraphQL Client",  # Por ahora hardcodeado
+            "ip_address": client_ip(request),
+            "user_agent": request.META.get("HTTP_USER_AGENT") if request is not None else None,
         }
 
-        # TODO: Implementar extracción real del contexto cuando sea necesario
-        # try:
-        #     if hasattr(info.context, 'request'):
-        #         request_info["ip_address"] = info.context.request.META.get("REMOTE_ADDR", "127.0.0.1")
-        #         request_info["user_agent"] = info.context.request.META.get("HTTP_USER_AGENT", "GraphQL Client")
-        # except Exception:
-        #     pass  # Usar valores por defecto
-
         return await self.service.login(input, request_info)
 
     @strawberry.mutation(name="refreshToken")
@@ -73,10 +38,16 @@ class AuthResolvers:
         user_context = {}  # Will be populated by auth middleware
         return await self.service.logout(input, user_context)
 
+    @strawberry.mutation(name="revokeSessionsBulk")
+    async def revoke_sessions_bulk(self, input: BulkRevokeSessionsInput, info: strawberry.Info) -> BulkRevokeSessionsResponse:
+        # Administrators only: the service checks the access token sent as "Authorization: Bearer <token>"
+        user_context = {"access_token": bearer_token(http_request(info))}
+        return await self.service.bulk_revoke(input, user_context)
+
     # ===== SESSION QUERIES =====
     @strawberry.field(name="sessionsFind")
-    async def sessions_find(self, input: SessionFindInput) -> SessionFindResponse:
-        return await self.service.find(input)
+    async def sessions_find(self, input: SessionFindInput, info: strawberry.Info) -> SessionFindResponse:
+        return await self.service.find(input, info)
 
     @strawberry.field(name="sessionFindOne")
     async def session_find_one(self, input: SessionFindOneInput) -> SessionFindOneResponse:
@@ -87,29 +58,28 @@ class AuthResolvers:
 @strawberry.type
 class AuthQueries:
     @strawberry.field
-    async def sessions_find(self, input: SessionFindInput) -> SessionFindResponse:
-        resolver = AuthResolvers()
-        return await resolver.sessions_find(input)
+    async def sessions_find(self, input: SessionFindInput, info: strawberry.Info) -> SessionFindResponse:
+        return await request_container(info).auth_resolvers.sessions_find(input, info)
 
     @strawberry.field
-    async def session_find_one(self, input: SessionFindOneInput) -> SessionFindOneResponse:
-        resolver = AuthResolvers()
-        return await resolver.session_find_one(input)
+    async def session_find_one(self, input: SessionFindOneInput, info: strawberry.Info) -> SessionFindOneResponse:
+        return await request_container(info).auth_resolvers.session_find_one(input)
 
 
 @strawberry.type
 class AuthMutations:
     @strawberry.mutation
     async def login(self, input: LoginInput, info: strawberry.Info) -> LoginResponse:
-        resolver = AuthResolvers()
-        return await resolver.login(input, info)
+        return await request_container(info).auth_resolvers.login(input, info)
 
     @strawberry.mutation
-    async def refresh_token(self, input: RefreshTokenInput) -> RefreshTokenResponse:
-        resolver = AuthResolvers()
-        return await resolver.refresh_token(input)
+    async def refresh_token(self, input: RefreshTokenInput, info: strawberry.Info) -> RefreshTokenResponse:
+        return await request_container(info).auth_resolvers.refresh_token(input)
 
     @strawberry.mutation
-    async def logout(self, input: LogoutInput) -> LogoutResponse:
-        resolver = AuthResolvers()
-        return await resolver.logout(input)
+    async def logout(self, input: LogoutInput, info: strawberry.Info) -> LogoutResponse:
+        return await request_container(info).auth_resolvers.logout(input)
+
+    @strawberry.mutation
+    async def revoke_sessions_bulk(self, input: BulkRevokeSessionsInput, info: strawberry.Info) -> BulkRevokeSessionsResponse:
+        return await request_container(info).auth_resolvers.revoke_sessions_bulk(input, info)
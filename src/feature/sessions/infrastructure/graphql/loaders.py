@@ -0,0 +1,16 @@
+from typing import List
+from uuid import UUID
+
+from strawberry.dataloader import DataLoader
+
+from ...application.use_cases.session_use_cases import SessionUseCases
+from ...domain.schemes.session import SessionGraphQLType
+
+
+def build_active_sessions_loader(session_use_cases: SessionUseCases) -> DataLoader[str, List[SessionGraphQLType]]:
+    # Request scoped: active sessions of every user requested during one tick come from a single user_id__in query
+    async def load(user_ids: List[str]) -> List[List[SessionGraphQLType]]:
+        sessions_by_user = await session_use_cases.get_active_sessions_by_user_ids([UUID(user_id) for user_id in user_ids])
+        return [SessionGraphQLType.from_entities(sessions_by_user.get(UUID(user_id), [])) for user_id in user_ids]
+
+    return DataLoader(load_fn=load)
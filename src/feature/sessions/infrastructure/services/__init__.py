@@ -1,5 +1,6 @@
 from .jwt_service import JWTService
 from .auth_service import AuthService
+from .session_reaper import SessionReaper
+from .revocation_registry import RevocationRegistry, get_revocation_registry
 
-__all__ = ["JWTService", "AuthService"]
-
+__all__ = ["JWTService", "AuthService", "SessionReaper", "RevocationRegistry", "get_revocation_registry"]
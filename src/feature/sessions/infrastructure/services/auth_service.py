@@ -1,31 +1,37 @@
 from uuid import UUID
 from typing import Dict, Any, Optional
 
+import strawberry
+from django.conf import settings
+
 from src.core.infrastructure.web.strawberry.services.base_service import BaseService
 from src.core.infrastructure.web.strawberry.responses import FindData, FindOneData
 from src.shared.criteria.service_helper import CriteriaServiceHelper
+from src.shared.criteria.input_converter import CriteriaInputConverter
 from src.feature.users.domain.repositories.user_repository import UserRepository
 from ...application.use_cases.session_use_cases import SessionUseCases
 from ...domain.inputs.login import LoginInput
 from ...domain.inputs.refresh import RefreshTokenInput
 from ...domain.inputs.logout import LogoutInput
+from ...domain.inputs.bulk_revoke import BulkRevokeSessionsInput
 from ...domain.inputs.find import SessionFindInput
 from ...domain.inputs.find_one import SessionFindOneInput
-from ...domain.types.standard_responses import LoginResponse, RefreshTokenResponse, LogoutResponse, SessionFindResponse, SessionFindOneResponse
+from ...domain.types.standard_responses import LoginResponse, RefreshTokenResponse, LogoutResponse, BulkRevokeSessionsResponse, SessionFindResponse, SessionFindOneResponse
 from ...domain.schemes.session import SessionGraphQLType, AuthResponse
 from ...domain.schemes.session_fields import SessionFields
-from src.core.exceptions.base_exceptions import BaseDomainException
+from src.core.exceptions.base_exceptions import BaseDomainException, UnauthorizedError
 from src.core.infrastructure.web.strawberry.helpers.validators import validate_uuid
+from src.core.infrastructure.web.strawberry.helpers.selection import selected_item_fields
 from .jwt_service import JWTService
 
 
 class AuthService(BaseService):
-    def __init__(self, session_use_cases: SessionUseCases, user_repository: UserRepository):
+    def __init__(self, session_use_cases: SessionUseCases, user_repository: UserRepository, jwt_service: Optional[JWTService] = None):
         super().__init__("Session")
         self.session_use_cases = session_use_cases
         self.user_repository = user_repository
-        self.jwt_service = JWTService()
-        self.criteria_helper = CriteriaServiceHelper(feature_name="session", search_fields=["user_agent", "device_info"], boolean_fields=["is_active", "is_expired"], string_fields=["status", "token_type", "ip_address"])
+        self.jwt_service = jwt_service or JWTService()
+        self.criteria_helper = CriteriaServiceHelper(feature_name="session", search_fields=["user_agent", "device_info"], boolean_fields=["is_active", "is_expired"], string_fields=["status", "token_type", "ip_address"], projection_columns=SessionFields.GRAPHQL_COLUMNS, cache_ttl_seconds=settings.SESSION_FIND_CACHE_TTL_SECONDS, cache_max_size=settings.SESSION_FIND_CACHE_MAX_SIZE)
 
     # ===== AUTH OPERATIONS =====
 
@@ -39,16 +45,11 @@ class AuthService(BaseService):
             login_args = SessionFields.login_args(input)
             login_args.update({"ip_address": ip_address, "user_agent": user_agent})
 
-            # Authenticate and create sessions
-            access_session, refresh_session = await self.session_use_cases.authenticate_user(**login_args)
-
-            # Get user for email (needed for JWT)
-            user = await self.user_repository.find_by_id(access_session.user_id)
-            if not user:
-                return LoginResponse(success=False, message="Authentication failed", error_code="USER_NOT_FOUND")
+            # Authenticate and create sessions (the authenticated user comes back with them, no extra lookup)
+            access_session, refresh_session, user = await self.session_use_cases.authenticate_user(**login_args)
 
             # Generate JWT tokens
-            token_data = self.jwt_service.generate_token_pair(access_session, refresh_session, str(user.email))
+            token_data = self.jwt_service.generate_token_pair(access_session, refresh_session, str(user.email), user.token_version)
 
             # Build response
             auth_response = AuthResponse(access_token=token_data["access_token"], refresh_token=token_data["refresh_token"], expires_in=token_data["expires_in"], token_type=token_data["token_type"], user_id=token_data["user_id"], user_email=token_data["user_email"], session_id=token_data["session_id"])
@@ -62,22 +63,22 @@ class AuthService(BaseService):
         try:
             # Extract session ID from refresh token
             refresh_token = input.refresh_token
+            payload = await self.jwt_service.ensure_not_revoked(refresh_token)
             session_id = self.jwt_service.extract_session_id(refresh_token)
 
             # Validate refresh token type
             if not self.jwt_service.validate_token_type(refresh_token, "refresh"):
                 return RefreshTokenResponse(success=False, message="Invalid token type", error_code="INVALID_TOKEN_TYPE")
 
+            # "Log out everywhere" bumps the user's token_version (the cached user supplies the email)
+            token_version = self.jwt_service.token_version(payload)
+            user = await self.session_use_cases.ensure_token_version(self.jwt_service.extract_user_id(refresh_token), token_version)
+
             # Create new access token
             new_access_session = await self.session_use_cases.refresh_access_token(session_id)
 
-            # Get user for email
-            user = await self.user_repository.find_by_id(new_access_session.user_id)
-            if not user:
-                return RefreshTokenResponse(success=False, message="User not found", error_code="USER_NOT_FOUND")
-
             # Generate new access token
-            token_data = self.jwt_service.generate_access_token(new_access_session, str(user.email))
+            token_data = self.jwt_service.generate_access_token(new_access_session, str(user.email), token_version)
 
             # Build response (keep same refresh token)
             auth_response = AuthResponse(
@@ -120,17 +121,37 @@ class AuthService(BaseService):
         except BaseDomainException as e:
             return LogoutResponse(success=False, message=e.message, error_code=e.error_code)
 
+    async def bulk_revoke(self, input: BulkRevokeSessionsInput, user_context: Dict[str, Any]) -> BulkRevokeSessionsResponse:
+        try:
+            await self.authorize_admin(user_context.get("access_token"))
+            revoke_args = SessionFields.bulk_revoke_args(input)
+            user_ids = [validate_uuid(user_id, "User ID") for user_id in revoke_args["user_ids"] or []]
+            criteria = CriteriaInputConverter.from_graphql_input(revoke_args["criteria"]) if revoke_args["criteria"] else None
+
+            affected_count = await self.session_use_cases.bulk_revoke_sessions(user_ids=user_ids, criteria=criteria, ip_network=revoke_args["ip_network"], chunk_size=revoke_args["chunk_size"])
+            return BulkRevokeSessionsResponse(success=True, message=f"Revoked {affected_count} sessions", affected_count=affected_count)
+        except BaseDomainException as e:
+            return BulkRevokeSessionsResponse(success=False, message=e.message, error_code=e.error_code)
+
+    async def authorize_admin(self, access_token: Optional[str]):
+        if not access_token:
+            raise UnauthorizedError("Authentication required", error_code="UNAUTHORIZED")
+        payload = await self.jwt_service.ensure_not_revoked(access_token)
+        if payload.get("token_type") != "access":
+            raise UnauthorizedError("Invalid token type", error_code="INVALID_TOKEN_TYPE")
+        await self.session_use_cases.ensure_admin(self.jwt_service.extract_user_id(access_token), self.jwt_service.extract_session_id(access_token), self.jwt_service.token_version(payload))
+
     # ===== CRUD OPERATIONS =====
 
-    async def find(self, input: SessionFindInput) -> SessionFindResponse:
+    async def find(self, input: SessionFindInput, info: Optional[strawberry.Info] = None) -> SessionFindResponse:
         try:
-            prepare = self.criteria_helper.build_find_prepare(input)
-            sessions, total_count = await self.session_use_cases.find_with_criteria(prepare)
+            prepare = self.criteria_helper.build_find_prepare(input, selected_item_fields(info))
+            page = await self.session_use_cases.find_with_criteria(prepare)
 
-            session_graphql_list = SessionGraphQLType.from_entities(sessions)
-            response_data = self.handle_success_find(session_graphql_list, total_count)
+            session_graphql_list = SessionGraphQLType.from_entities(page.items)
+            response_data = self.handle_success_find(session_graphql_list, page.total_count, page.next_cursor, page.prev_cursor, page.has_next_page)
 
-            return SessionFindResponse(success=response_data["success"], data=FindData(items=response_data["data"]), total_count=response_data["total_count"], message=response_data["message"])
+            return SessionFindResponse(success=response_data["success"], data=FindData(items=response_data["data"]), total_count=response_data["total_count"], has_next_page=response_data["has_next_page"], next_cursor=response_data["next_cursor"], prev_cursor=response_data["prev_cursor"], message=response_data["message"])
         except BaseDomainException as e:
             error_data = self.handle_exception(e, [])
             return SessionFindResponse(success=error_data["success"], data=FindData(items=error_data["data"]), total_count=0, message=error_data["message"], error_code=error_data["error_code"])
@@ -7,14 +7,22 @@ from django.conf import settings
 from src.core.exceptions.base_exceptions import ValidationException, UnauthorizedError
 from ...domain.entities.session import Session
 from ...domain.value_objects.token_type import TokenType
+from .revocation_registry import RevocationRegistry, get_revocation_registry
 
 
 class JWTService:
-    def __init__(self):
+    def __init__(self, revocation_registry: Optional[RevocationRegistry] = None):
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = "HS256"
+        self._revocation_registry = revocation_registry
 
-    def generate_token_pair(self, access_session: Session, refresh_session: Session, user_email: str) -> Dict[str, Any]:
+    @property
+    def revocation_registry(self) -> Optional[RevocationRegistry]:
+        if self._revocation_registry is None and settings.SESSION_REVOCATION_LOG_ENABLED:
+            self._revocation_registry = get_revocation_registry()
+        return self._revocation_registry
+
+    def generate_token_pair(self, access_session: Session, refresh_session: Session, user_email: str, token_version: int = 0) -> Dict[str, Any]:
         if access_session.token_type != TokenType.ACCESS:
             raise ValidationException("Invalid access session type")
 
@@ -27,8 +35,10 @@ class JWTService:
             "user_id": str(access_session.user_id),
             "user_email": user_email,
             "token_type": "access",
+            "ver": token_version,
             "exp": int(access_session.expires_at.timestamp()),
-            "iat": int(access_session.created_at.timestamp()),
+            # Sub-second: user-level revocation cut-offs compare against it, a login right after "log out everywhere" must pass
+            "iat": access_session.created_at.timestamp(),
         }
         access_token = jwt.encode(access_payload, self.secret_key, algorithm=self.algorithm)
 
@@ -37,8 +47,9 @@ class JWTService:
             "session_id": str(refresh_session.id),
             "user_id": str(refresh_session.user_id),
             "token_type": "refresh",
+            "ver": token_version,
             "exp": int(refresh_session.expires_at.timestamp()),
-            "iat": int(refresh_session.created_at.timestamp()),
+            "iat": refresh_session.created_at.timestamp(),
         }
         refresh_token = jwt.encode(refresh_payload, self.secret_key, algorithm=self.algorithm)
 
@@ -55,7 +66,7 @@ class JWTService:
             "user_email": user_email,
         }
 
-    def generate_access_token(self, session: Session, user_email: str) -> Dict[str, Any]:
+    def generate_access_token(self, session: Session, user_email: str, token_version: int = 0) -> Dict[str, Any]:
         if session.token_type != TokenType.ACCESS:
             raise ValidationException("Session must be ACCESS type")
 
@@ -64,8 +75,9 @@ class JWTService:
             "user_id": str(session.user_id),
             "user_email": user_email,
             "token_type": "access",
+            "ver": token_version,
             "exp": int(session.expires_at.timestamp()),
-            "iat": int(session.created_at.timestamp()),
+            "iat": session.created_at.timestamp(),
         }
 
         access_token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
@@ -89,6 +101,16 @@ class JWTService:
         except jwt.InvalidTokenError:
             raise UnauthorizedError("Invalid token")
 
+    async def ensure_not_revoked(self, token: str) -> Dict[str, Any]:
+        # In-memory lookup against the replicated revocation changelog, no session query
+        payload = self.decode_token(token)
+        registry = self.revocation_registry
+        if registry is not None:
+            await registry.refresh()
+            if registry.is_revoked(payload):
+                raise UnauthorizedError("Token has been revoked", error_code="TOKEN_REVOKED")
+        return payload
+
     def extract_session_id(self, token: str) -> UUID:
         payload = self.decode_token(token)
         session_id_str = payload.get("session_id")
@@ -113,6 +135,11 @@ class JWTService:
         except ValueError:
             raise UnauthorizedError("Invalid user ID in token")
 
+    @staticmethod
+    def token_version(payload: Dict[str, Any]) -> int:
+        # Tokens issued before versioning carry no claim and count as version 0
+        return int(payload.get("ver", 0))
+
     def validate_token_type(self, token: str, expected_type: str) -> bool:
         payload = self.decode_token(token)
         token_type = payload.get("token_type")
@@ -0,0 +1,185 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Q
+from django.utils import timezone
+
+from src.core.infrastructure.metrics.registry import metrics_registry
+from ..database.models import SessionRevocationModel
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationRegistry:
+    """
+    Per-worker in-memory view of the revocation changelog (auth_session_revocations), so token
+    checks are dictionary lookups instead of a session query per request.
+
+    Polled incrementally by seq at most every poll_interval_seconds. Sequence numbers are assigned
+    at INSERT but become visible at COMMIT, so a lower seq can show up after a higher one: skipped
+    numbers are re-queried for gap_grace_seconds before being treated as rolled back.
+    """
+
+    def __init__(self, poll_interval_seconds: float = 1.0, gap_grace_seconds: float = 30.0, batch_size: int = 5000):
+        self.poll_interval_seconds = poll_interval_seconds
+        self.gap_grace_seconds = gap_grace_seconds
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._sessions: Dict[str, float] = {}  # session_id -> expires_at timestamp
+        self._users: Dict[Tuple[str, Optional[str]], Tuple[float, float]] = {}  # (user_id, token_type) -> (cutoff, expires_at) timestamps
+        self._last_seq = 0
+        self._gaps: Dict[int, float] = {}  # missing seq -> monotonic time first noticed
+        self._last_sync = 0.0
+        self._loaded = False
+
+        self.syncs = 0
+        self.sync_errors = 0
+        self.entries_applied = 0
+        self.revoked_hits = 0
+
+    # ===== CHECKS =====
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        # payload: decoded JWT claims (session_id, user_id, token_type, iat)
+        session_id = payload.get("session_id")
+        user_id = payload.get("user_id")
+        now = time.time()
+
+        expires_at = self._sessions.get(session_id)
+        revoked = expires_at is not None and expires_at > now
+        if not revoked and user_id:
+            issued_at = payload.get("iat", 0)
+            for key in ((user_id, None), (user_id, payload.get("token_type"))):
+                entry = self._users.get(key)
+                if entry is not None and entry[1] > now and issued_at <= entry[0]:
+                    revoked = True
+                    break
+
+        if revoked:
+            with self._lock:
+                self.revoked_hits += 1
+        return revoked
+
+    async def refresh(self):
+        # Called on the request path; polls only when the last sync is older than the interval
+        if self._is_stale():
+            await sync_to_async(self.sync_if_stale)()
+
+    def sync_if_stale(self):
+        if self._is_stale():
+            self.sync()
+
+    # ===== CHANGELOG =====
+    def sync(self) -> int:
+        # Concurrent callers keep using the current view instead of queueing behind the poll
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            return self._sync()
+        except Exception:
+            self.sync_errors += 1
+            logger.exception("Revocation registry sync failed")
+            return 0
+        finally:
+            self._last_sync = time.monotonic()
+            self._sync_lock.release()
+
+    def apply(self, entries: Iterable[SessionRevocationModel]) -> int:
+        # Local writes are applied right away; the poll replays them later (idempotent)
+        applied = 0
+        with self._lock:
+            for entry in entries:
+                expires_at = entry.expires_at.timestamp()
+                if entry.scope == SessionRevocationModel.ScopeChoices.SESSION:
+                    self._sessions[str(entry.session_id)] = expires_at
+                else:
+                    key = (str(entry.user_id), entry.token_type)
+                    cutoff, previous_expiry = self._users.get(key, (0.0, 0.0))
+                    self._users[key] = (max(cutoff, entry.revoked_at.timestamp()), max(previous_expiry, expires_at))
+                applied += 1
+            self.entries_applied += applied
+        return applied
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "revoked_sessions": len(self._sessions),
+            "revoked_user_cutoffs": len(self._users),
+            "last_seq": self._last_seq,
+            "pending_gaps": len(self._gaps),
+            "seconds_since_sync": round(time.monotonic() - self._last_sync, 3) if self._loaded else None,
+            "syncs": self.syncs,
+            "sync_errors": self.sync_errors,
+            "entries_applied": self.entries_applied,
+            "revoked_hits": self.revoked_hits,
+        }
+
+    # ===== INTERNALS =====
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._last_sync >= self.poll_interval_seconds
+
+    def _sync(self) -> int:
+        queryset = SessionRevocationModel.objects.using(DEFAULT_DB_ALIAS)
+        if not self._loaded:
+            # First load: everything still in force; older rows only cover expired tokens
+            queryset = queryset.filter(expires_at__gt=timezone.now())
+            predicate = Q()
+        else:
+            predicate = Q(seq__gt=self._last_seq)
+            if self._gaps:
+                predicate |= Q(seq__in=list(self._gaps))
+
+        applied = 0
+        while True:
+            batch = list(queryset.filter(predicate).order_by("seq")[: self.batch_size])
+            if not batch:
+                break
+            applied += self.apply(batch)
+            self._track_sequence([entry.seq for entry in batch])
+            if len(batch) < self.batch_size:
+                break
+            predicate = Q(seq__gt=self._last_seq)
+
+        self._loaded = True
+        self._prune()
+        self.syncs += 1
+        return applied
+
+    def _track_sequence(self, seqs: List[int]):
+        now = time.monotonic()
+        for seq in seqs:
+            self._gaps.pop(seq, None)
+            if self._loaded and seq > self._last_seq + 1:
+                for missing in range(self._last_seq + 1, seq):
+                    self._gaps.setdefault(missing, now)
+            self._last_seq = max(self._last_seq, seq)
+
+    def _prune(self):
+        now = time.time()
+        monotonic_now = time.monotonic()
+        with self._lock:
+            self._sessions = {session_id: expires_at for session_id, expires_at in self._sessions.items() if expires_at > now}
+            self._users = {key: entry for key, entry in self._users.items() if entry[1] > now}
+        self._gaps = {seq: first_seen for seq, first_seen in self._gaps.items() if monotonic_now - first_seen < self.gap_grace_seconds}
+
+
+def prune_revocation_log() -> int:
+    # Rows whose tokens have all expired are dead weight for the next worker's first load
+    deleted_count, _ = SessionRevocationModel.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted_count
+
+
+_revocation_registry: Optional[RevocationRegistry] = None
+
+
+def get_revocation_registry() -> RevocationRegistry:
+    global _revocation_registry
+    if _revocation_registry is None:
+        _revocation_registry = RevocationRegistry(poll_interval_seconds=settings.SESSION_REVOCATION_POLL_SECONDS)
+        metrics_registry.register("revocation_registry", _revocation_registry.snapshot)
+    return _revocation_registry
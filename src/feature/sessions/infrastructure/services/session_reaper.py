@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from src.core.infrastructure.metrics.registry import metrics_registry
+from ...domain.repositories.session_repository import SessionRepository
+from .revocation_registry import prune_revocation_log
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_CACHE_KEY = "session_reaper:checkpoint"
+LOCK_CACHE_KEY = "session_reaper:lock"
+# The lock is a lease renewed after every batch: it holds for unbounded runs and lapses soon after a crashed reaper
+LOCK_LEASE_SECONDS = 60.0
+
+
+@dataclass
+class ReaperRun:
+    deleted: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    completed: bool = False  # False when stopped by max runtime; the checkpoint resumes it
+    checkpoint: Optional[datetime] = None
+    started_at: datetime = field(default_factory=timezone.now)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class SessionReaper:
+    """
+    Deletes expired sessions in bounded batches ordered by expires_at, sleeping between
+    batches so cleanup can run continuously without competing with logins for locks/IO.
+    """
+
+    def __init__(self, session_repository: SessionRepository, batch_size: Optional[int] = None, sleep_seconds: Optional[float] = None, max_runtime_seconds: Optional[float] = None):
+        self.session_repository = session_repository
+        self.batch_size = batch_size or settings.SESSION_REAPER_BATCH_SIZE
+        self.sleep_seconds = settings.SESSION_REAPER_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+        self.max_runtime_seconds = settings.SESSION_REAPER_MAX_RUNTIME_SECONDS if max_runtime_seconds is None else max_runtime_seconds
+        self.last_run: Optional[ReaperRun] = None
+        self.total_deleted = 0
+        self.runs = 0
+
+    async def run(self, resume: bool = True) -> ReaperRun:
+        # Only one reaper (per shared cache) works at a time; others skip this cycle
+        lock_token = uuid.uuid4().hex
+        if not await cache.aadd(LOCK_CACHE_KEY, lock_token, timeout=self.lock_lease_seconds):
+            return ReaperRun(completed=True)
+
+        try:
+            return await self._run(resume, lock_token)
+        finally:
+            # Never release a lease that lapsed and was taken by another reaper
+            if await cache.aget(LOCK_CACHE_KEY) == lock_token:
+                await cache.adelete(LOCK_CACHE_KEY)
+
+    @property
+    def lock_lease_seconds(self) -> float:
+        return LOCK_LEASE_SECONDS + self.sleep_seconds
+
+    async def _renew_lock(self, lock_token: str) -> bool:
+        if await cache.aget(LOCK_CACHE_KEY) != lock_token:
+            return False
+        return await cache.atouch(LOCK_CACHE_KEY, self.lock_lease_seconds)
+
+    async def _run(self, resume: bool, lock_token: str) -> ReaperRun:
+        if settings.SESSION_PARTITIONING_ENABLED:
+            # Whole expired partitions go first as a metadata operation; batches handle the rest
+            await sync_to_async(self._maintain_partitions)()
+
+        result = ReaperRun(checkpoint=await self._load_checkpoint() if resume else None)
+        expired_before = timezone.now()
+        started = time.monotonic()
+        lock_lost = False
+
+        while True:
+            deleted, result.checkpoint = await self.session_repository.delete_expired_batch(expired_before, self.batch_size, result.checkpoint)
+            result.deleted += deleted
+            result.batches += 1
+            result.elapsed_seconds = time.monotonic() - started
+
+            if deleted < self.batch_size:
+                result.completed = True
+                break
+            if self.max_runtime_seconds and result.elapsed_seconds >= self.max_runtime_seconds:
+                break
+            if not await self._renew_lock(lock_token):
+                logger.warning("Session reaper lost its lock after %s batches, stopping", result.batches)
+                lock_lost = True
+                break
+            if self.sleep_seconds:
+                await asyncio.sleep(self.sleep_seconds)
+
+        if settings.SESSION_REVOCATION_LOG_ENABLED and not lock_lost:
+            await sync_to_async(prune_revocation_log)()
+
+        # A finished run leaves nothing below "now", so the next one starts from the beginning;
+        # after losing the lock the checkpoint belongs to the reaper that took it over
+        if not lock_lost:
+            await self._save_checkpoint(None if result.completed else result.checkpoint)
+        self.last_run = result
+        self.total_deleted += result.deleted
+        self.runs += 1
+        logger.info("Session reaper deleted %s rows in %s batches (%.1f rows/s, completed=%s)", result.deleted, result.batches, result.rows_per_second, result.completed)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        last = self.last_run
+        return {
+            "runs": self.runs,
+            "total_deleted": self.total_deleted,
+            "last_run_at": last.started_at.isoformat() if last else None,
+            "last_deleted": last.deleted if last else 0,
+            "last_batches": last.batches if last else 0,
+            "last_rows_per_second": round(last.rows_per_second, 1) if last else 0.0,
+            "last_completed": last.completed if last else None,
+        }
+
+    def _maintain_partitions(self):
+        from ..database.partitions import SessionPartitionManager
+
+        manager = SessionPartitionManager()
+        if manager.is_partitioned():
+            manager.maintain()
+
+    async def _load_checkpoint(self) -> Optional[datetime]:
+        value = await cache.aget(CHECKPOINT_CACHE_KEY)
+        return parse_datetime(value) if value else None
+
+    async def _save_checkpoint(self, checkpoint: Optional[datetime]):
+        if checkpoint is None:
+            await cache.adelete(CHECKPOINT_CACHE_KEY)
+        else:
+            await cache.aset(CHECKPOINT_CACHE_KEY, checkpoint.isoformat(), timeout=None)
+
+
+class SessionReaperThread(threading.Thread):
+    # Optional in-process periodic reaper (SESSION_REAPER_ENABLED); prefer the management command under cron
+    def __init__(self, reaper: SessionReaper, interval_seconds: float):
+        super().__init__(name="session-reaper", daemon=True)
+        self.reaper = reaper
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                asyncio.run(self.reaper.run())
+            except Exception:
+                logger.exception("Session reaper run failed")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_reaper_thread: Optional[SessionReaperThread] = None
+
+
+def start_session_reaper() -> SessionReaperThread:
+    global _reaper_thread
+    if _reaper_thread is None:
+        from ..database.cached_repository import build_session_repository
+
+        # Same process as the API: go through the cached repository so reaped sessions leave the cache too
+        reaper = SessionReaper(build_session_repository())
+        metrics_registry.register("session_reaper", reaper.snapshot)
+        _reaper_thread = SessionReaperThread(reaper, settings.SESSION_REAPER_INTERVAL_SECONDS)
+        _reaper_thread.start()
+    return _reaper_thread
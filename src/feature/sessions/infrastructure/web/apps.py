@@ -1,3 +1,5 @@
+import sys
+
 from django.apps import AppConfig
 
 
@@ -8,4 +10,15 @@ class SessionsConfig(AppConfig):
     verbose_name = "Authentication Sessions"
 
     def ready(self):
+        from django.conf import settings
+
+        # Only in the serving process, not for migrate/shell/other management commands
+        if settings.SESSION_REAPER_ENABLED and not _is_management_command():
+            from src.feature.sessions.infrastructure.services.session_reaper import start_session_reaper
+
+            start_session_reaper()
         print("🔐 Auth Sessions feature ready")
+
+
+def _is_management_command() -> bool:
+    return sys.argv[0].endswith("manage.py") and sys.argv[1:2] != ["runserver"]
@@ -0,0 +1,23 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from src.feature.sessions.infrastructure.database.repositories import DjangoSessionRepository
+from src.feature.sessions.infrastructure.services.session_reaper import SessionReaper
+
+
+class Command(BaseCommand):
+    help = "Delete expired sessions in bounded, rate-limited batches (resumes from the last checkpoint)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Rows deleted per batch (SESSION_REAPER_BATCH_SIZE)")
+        parser.add_argument("--sleep", type=float, default=None, help="Seconds to pause between batches (SESSION_REAPER_SLEEP_SECONDS)")
+        parser.add_argument("--max-runtime", type=float, default=None, help="Stop after this many seconds, 0 for no limit (SESSION_REAPER_MAX_RUNTIME_SECONDS)")
+        parser.add_argument("--no-resume", action="store_true", help="Ignore the saved checkpoint and start from the oldest expired session")
+
+    def handle(self, *args, **options):
+        reaper = SessionReaper(DjangoSessionRepository(), batch_size=options["batch_size"], sleep_seconds=options["sleep"], max_runtime_seconds=options["max_runtime"])
+        result = asyncio.run(reaper.run(resume=not options["no_resume"]))
+
+        status = "completed" if result.completed else "stopped at max runtime, will resume from checkpoint"
+        self.stdout.write(f"Deleted {result.deleted} expired sessions in {result.batches} batches, {result.elapsed_seconds:.2f}s ({result.rows_per_second:.1f} rows/s) - {status}")
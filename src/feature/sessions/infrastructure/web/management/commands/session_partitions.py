@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.feature.sessions.infrastructure.database.partitions import SessionPartitionManager
+
+
+class Command(BaseCommand):
+    help = "Maintain the expires_at range partitions of auth_sessions: create upcoming ones, detach/drop expired ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--convert", action="store_true", help="Rebuild auth_sessions as a partitioned table (copies rows, needs a maintenance window)")
+        parser.add_argument("--unpartition", action="store_true", help="Rebuild auth_sessions as a regular table")
+        parser.add_argument("--list", action="store_true", help="List existing partitions")
+
+    def handle(self, *args, **options):
+        manager = SessionPartitionManager()
+        if not manager.is_supported():
+            raise CommandError("Session partitioning requires PostgreSQL")
+
+        if options["unpartition"]:
+            manager.convert_to_regular()
+            self.stdout.write("auth_sessions is a regular table")
+            return
+
+        if options["convert"]:
+            manager.convert_to_partitioned()
+        if not manager.is_partitioned():
+            raise CommandError("auth_sessions is not partitioned (enable SESSION_PARTITIONING_ENABLED and migrate, or use --convert)")
+
+        if options["list"]:
+            for partition in manager.partitions():
+                self.stdout.write(f"{partition.name}: {partition.start.isoformat()} -> {partition.end.isoformat()}")
+            return
+
+        result = manager.maintain()
+        self.stdout.write(f"Created {len(result['created'])} partitions {result['created']}; removed {len(result['removed'])} expired partitions {result['removed']}")
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db import migrations
+
+
+def partition_sessions(apps, schema_editor):
+    # Opt-in layout: only with SESSION_PARTITIONING_ENABLED on PostgreSQL, otherwise a no-op
+    if not settings.SESSION_PARTITIONING_ENABLED or schema_editor.connection.vendor != "postgresql":
+        return
+
+    from src.feature.sessions.infrastructure.database.partitions import SessionPartitionManager
+
+    SessionPartitionManager(using=schema_editor.connection.alias).convert_to_partitioned()
+
+
+def unpartition_sessions(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    from src.feature.sessions.infrastructure.database.partitions import SessionPartitionManager
+
+    SessionPartitionManager(using=schema_editor.connection.alias).convert_to_regular()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_sessions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_sessions, unpartition_sessions),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_sessions', '0002_partition_auth_sessions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionRevocationModel',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('scope', models.CharField(choices=[('session', 'Session'), ('user', 'User')], max_length=10, verbose_name='Scope')),
+                ('session_id', models.UUIDField(blank=True, null=True, verbose_name='Session ID')),
+                ('user_id', models.UUIDField(verbose_name='User ID')),
+                ('token_type', models.CharField(blank=True, choices=[('access', 'Access Token'), ('refresh', 'Refresh Token')], max_length=10, null=True, verbose_name='Token Type')),
+                ('revoked_at', models.DateTimeField(verbose_name='Revoked At')),
+                ('expires_at', models.DateTimeField(verbose_name='Expires At')),
+            ],
+            options={
+                'verbose_name': 'Session Revocation',
+                'verbose_name_plural': 'Session Revocations',
+                'db_table': 'auth_session_revocations',
+                'indexes': [models.Index(fields=['expires_at'], name='auth_sessio_expires_f99cac_idx')],
+            },
+        ),
+    ]
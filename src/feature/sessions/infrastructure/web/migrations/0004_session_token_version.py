@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_sessions', '0003_session_revocations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sessionmodel',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, verbose_name='Token Version'),
+        ),
+    ]
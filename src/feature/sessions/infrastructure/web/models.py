@@ -1,3 +1,3 @@
-from src.feature.sessions.infrastructure.database.models import SessionModel
+from src.feature.sessions.infrastructure.database.models import SessionModel, SessionRevocationModel
 
-__all__ = ["SessionModel"]
+__all__ = ["SessionModel", "SessionRevocationModel"]
@@ -0,0 +1,242 @@
+# src/feature/sessions/tests.py
+import asyncio
+import copy
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from src.core.exceptions.base_exceptions import UnauthorizedError
+from src.feature.sessions.application.use_cases.session_use_cases import SessionUseCases
+from src.feature.sessions.domain.entities.session import Session
+from src.feature.sessions.infrastructure.database.models import SessionRevocationModel
+from src.feature.sessions.infrastructure.database.cached_repository import CachedSessionRepository, SessionValidityCache
+from src.feature.sessions.infrastructure.services.revocation_registry import RevocationRegistry
+from src.feature.sessions.infrastructure.services.session_reaper import CHECKPOINT_CACHE_KEY, LOCK_CACHE_KEY, SessionReaper
+
+
+class FakeExpiredSessions:
+    """delete_expired_batch over an in-memory count; on_batch runs after every batch"""
+
+    def __init__(self, expired: int, on_batch=None):
+        self.expired = expired
+        self.on_batch = on_batch
+        self.batches = 0
+
+    async def delete_expired_batch(self, expired_before, batch_size, checkpoint):
+        deleted = min(batch_size, self.expired)
+        self.expired -= deleted
+        self.batches += 1
+        if self.on_batch:
+            self.on_batch(self.batches)
+        return deleted, timezone.now() - timedelta(seconds=self.expired)
+
+
+@override_settings(SESSION_PARTITIONING_ENABLED=False, SESSION_REVOCATION_LOG_ENABLED=False)
+class SessionReaperLockTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def reaper(self, repository, **kwargs):
+        return SessionReaper(repository, batch_size=10, sleep_seconds=0, **kwargs)
+
+    def test_unbounded_run_keeps_renewing_its_lock(self):
+        leases = []
+        repository = FakeExpiredSessions(100, on_batch=lambda _: leases.append(cache.get(LOCK_CACHE_KEY)))
+
+        result = asyncio.run(self.reaper(repository, max_runtime_seconds=0).run(resume=False))
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.deleted, 100)
+        self.assertEqual(len(set(leases)), 1)
+        self.assertIsNotNone(leases[0])
+        self.assertIsNone(cache.get(LOCK_CACHE_KEY))
+
+    def test_second_reaper_skips_while_the_lock_is_held(self):
+        cache.set(LOCK_CACHE_KEY, "other-reaper")
+        repository = FakeExpiredSessions(100)
+
+        result = asyncio.run(self.reaper(repository).run(resume=False))
+
+        self.assertEqual((result.deleted, repository.batches), (0, 0))
+        self.assertEqual(cache.get(LOCK_CACHE_KEY), "other-reaper")
+
+    def test_reaper_stops_when_its_lease_was_taken_over(self):
+        def take_over(batch):
+            if batch == 2:
+                cache.set(LOCK_CACHE_KEY, "other-reaper")
+
+        repository = FakeExpiredSessions(100, on_batch=take_over)
+        with self.assertLogs("src.feature.sessions.infrastructure.services.session_reaper", "WARNING"):
+            result = asyncio.run(self.reaper(repository, max_runtime_seconds=0).run(resume=False))
+
+        self.assertFalse(result.completed)
+        self.assertEqual(repository.batches, 2)
+        # The other reaper's lock and checkpoint are left alone
+        self.assertIsNone(cache.get(CHECKPOINT_CACHE_KEY))
+        self.assertEqual(cache.get(LOCK_CACHE_KEY), "other-reaper")
+
+
+class RacingSessionReads:
+    """find_by_id returns the row as read, then runs during_read: a revocation committing after the read"""
+
+    def __init__(self, session: Session, during_read=None):
+        self.session = session
+        self.during_read = during_read
+
+    async def find_by_id(self, entity_id):
+        session = copy.deepcopy(self.session)
+        if self.during_read:
+            await self.during_read()
+        return session
+
+
+class SessionCacheFillTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.session = Session.create_access_token_session(user_id=uuid.uuid4(), session_id=uuid.uuid4())
+
+    def worker(self) -> SessionValidityCache:
+        return SessionValidityCache(shared_alias="default")
+
+    def read_through(self, worker: SessionValidityCache, during_read=None):
+        repository = CachedSessionRepository(RacingSessionReads(self.session, during_read), cache=worker)
+        return asyncio.run(repository.find_by_id(self.session.id))
+
+    def cached(self, worker: SessionValidityCache):
+        return asyncio.run(worker.get(self.session.id))
+
+    def test_fill_without_invalidation_is_shared(self):
+        self.read_through(self.worker())
+
+        self.assertEqual(self.cached(self.worker()).id, self.session.id)
+
+    def test_fill_racing_a_local_invalidation_is_dropped(self):
+        worker = self.worker()
+        self.read_through(worker, lambda: worker.invalidate_session(self.session.id))
+
+        self.assertIsNone(self.cached(worker))
+        self.assertEqual(worker.fills_dropped, 1)
+
+    def test_fill_racing_another_workers_logout_is_dropped(self):
+        reader, writer = self.worker(), self.worker()
+        self.read_through(reader, lambda: writer.invalidate_session(self.session.id))
+
+        self.assertIsNone(self.cached(reader))
+        self.assertIsNone(self.cached(self.worker()))
+
+    def test_fill_racing_another_workers_user_revocation_is_dropped(self):
+        reader, writer = self.worker(), self.worker()
+        self.read_through(reader, lambda: writer.invalidate_user(self.session.user_id))
+
+        self.assertIsNone(self.cached(reader))
+        self.assertIsNone(self.cached(self.worker()))
+
+    def test_fill_racing_a_bulk_revocation_is_stale_in_the_shared_tier(self):
+        reader, writer = self.worker(), self.worker()
+        self.read_through(reader, writer.invalidate_all)
+
+        # The generation read before the database is older than the bump
+        self.assertIsNone(self.cached(self.worker()))
+
+    def test_generation_bump_hides_entries_written_before_it(self):
+        self.read_through(self.worker())
+        asyncio.run(self.worker().invalidate_user(self.session.user_id))
+
+        self.assertIsNone(self.cached(self.worker()))
+
+
+class RevocationRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.registry = RevocationRegistry(poll_interval_seconds=60, gap_grace_seconds=30)
+        self.user_id = str(uuid.uuid4())
+        self.now = timezone.now()
+
+    def user_revocation(self, revoked_at, token_type=None):
+        return SessionRevocationModel(scope=SessionRevocationModel.ScopeChoices.USER, user_id=self.user_id, token_type=token_type, revoked_at=revoked_at, expires_at=self.now + timedelta(days=1))
+
+    def claims(self, issued_at, token_type="access"):
+        return {"session_id": str(uuid.uuid4()), "user_id": self.user_id, "token_type": token_type, "iat": int(issued_at.timestamp())}
+
+    def test_user_cutoff_revokes_tokens_issued_up_to_it(self):
+        self.registry.apply([self.user_revocation(self.now)])
+
+        self.assertTrue(self.registry.is_revoked(self.claims(self.now - timedelta(minutes=5))))
+        self.assertFalse(self.registry.is_revoked(self.claims(self.now + timedelta(seconds=5))))
+
+    def test_token_type_cutoff_only_covers_that_type(self):
+        self.registry.apply([self.user_revocation(self.now, token_type="refresh")])
+
+        self.assertTrue(self.registry.is_revoked(self.claims(self.now - timedelta(minutes=5), token_type="refresh")))
+        self.assertFalse(self.registry.is_revoked(self.claims(self.now - timedelta(minutes=5), token_type="access")))
+
+    def test_later_cutoff_wins_whatever_the_apply_order(self):
+        self.registry.apply([self.user_revocation(self.now + timedelta(minutes=1)), self.user_revocation(self.now)])
+
+        self.assertTrue(self.registry.is_revoked(self.claims(self.now + timedelta(seconds=30))))
+
+    def test_skipped_sequence_numbers_are_tracked_until_they_show_up(self):
+        self.registry._loaded = True
+        self.registry._track_sequence([1, 2, 5])
+        self.assertEqual(set(self.registry._gaps), {3, 4})
+
+        # A transaction that committed late fills its gap
+        self.registry._track_sequence([4, 6])
+        self.assertEqual(set(self.registry._gaps), {3})
+        self.assertEqual(self.registry._last_seq, 6)
+
+    def test_gaps_older_than_the_grace_period_are_treated_as_rolled_back(self):
+        self.registry._loaded = True
+        self.registry._track_sequence([1, 3])
+        self.registry._gaps[2] -= self.registry.gap_grace_seconds
+
+        self.registry._prune()
+        self.assertEqual(self.registry._gaps, {})
+
+    def test_sync_if_stale_polls_once_per_interval(self):
+        syncs = []
+        self.registry.sync = lambda: (syncs.append(1), setattr(self.registry, "_last_sync", time.monotonic()))
+
+        self.registry.sync_if_stale()
+        self.registry.sync_if_stale()
+        self.assertEqual(len(syncs), 1)
+
+        self.registry._last_sync -= self.registry.poll_interval_seconds
+        self.registry.sync_if_stale()
+        self.assertEqual(len(syncs), 2)
+
+
+class UnknownAccounts:
+    async def find_credentials_by_email(self, email):
+        return None
+
+
+class RecordingPasswordExecutor:
+    def __init__(self):
+        self.dummy_checks = []
+
+    async def verify_dummy(self, password):
+        self.dummy_checks.append(password)
+        return False
+
+
+class UniformLoginTimingTests(SimpleTestCase):
+    def login_unknown_account(self):
+        executor = RecordingPasswordExecutor()
+        use_cases = SessionUseCases(session_repository=None, user_repository=UnknownAccounts(), password_executor=executor)
+        with self.assertRaises(UnauthorizedError) as raised:
+            asyncio.run(use_cases.authenticate_user("nobody@b.co", "pw12345678"))
+        # Same answer as a wrong password
+        self.assertEqual(raised.exception.message, "Invalid email or password")
+        return executor.dummy_checks
+
+    @override_settings(AUTH_UNIFORM_LOGIN_TIMING=True)
+    def test_unknown_email_pays_for_a_dummy_hash_check(self):
+        self.assertEqual(self.login_unknown_account(), ["pw12345678"])
+
+    @override_settings(AUTH_UNIFORM_LOGIN_TIMING=False)
+    def test_dummy_check_can_be_turned_off(self):
+        self.assertEqual(self.login_unknown_account(), [])
@@ -25,7 +25,9 @@ class UserUseCases(BaseCrudUseCases[User]):
             raise ValidationException(f"User with email {email} already exists")
 
         user = User(email=email_vo, first_name=first_name.strip(), last_name=last_name.strip(), status=UserStatus.PENDING_VERIFICATION if not email_verified else UserStatus.ACTIVE, email_verified=email_verified)
-        return await self.user_repository.save_with_password(user, password)
+        user = await self.user_repository.save_with_password(user, password)
+        await self.user_repository.invalidate_cached(user.id, user.email)
+        return user
 
     async def update_user(self, user_id: UUID, first_name: Optional[str] = None, last_name: Optional[str] = None) -> User:
         user = await self.repository.find_by_id(user_id)
@@ -33,4 +35,15 @@ class UserUseCases(BaseCrudUseCases[User]):
             raise NotFoundError(f"User with ID {user_id} not found")
 
         user.update_profile(first_name=first_name, last_name=last_name)
-        return await self.repository.save(user)
+        user = await self.repository.save(user)
+        await self.user_repository.invalidate_cached(user.id, user.email)
+        return user
+
+    async def delete_by_id(self, entity_id: UUID) -> bool:
+        user = await self.user_repository.find_by_id(entity_id)
+        if not user:
+            raise NotFoundError(f"User with ID {entity_id} not found")
+
+        deleted = await self.user_repository.delete_by_id(entity_id)
+        await self.user_repository.invalidate_cached(entity_id, user.email)
+        return deleted
@@ -15,16 +15,19 @@ class User(BaseEntity):
         last_name: str,
         status: UserStatus = UserStatus.ACTIVE,
         email_verified: bool = False,
+        token_version: int = 0,
         id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
         super().__init__(id, created_at, updated_at)
         self.email = email
-        self.first_name = first_name.strip()
-        self.last_name = last_name.strip()
+        # None only for partially loaded (projected) users
+        self.first_name = first_name.strip() if first_name is not None else None
+        self.last_name = last_name.strip() if last_name is not None else None
         self.status = status
         self.email_verified = email_verified
+        self.token_version = token_version
 
     @property
     def full_name(self) -> str:
@@ -5,6 +5,7 @@ from uuid import UUID
 from src.core.domain.value_objects.email import Email
 from src.core.domain.repositories.base_repository import BaseRepository
 from ..entities.user import User
+from ..value_objects.user_credentials import UserCredentials
 
 
 class UserRepository(BaseRepository[User]):
@@ -16,6 +17,10 @@ class UserRepository(BaseRepository[User]):
     async def find_by_email(self, email: Email) -> Optional[User]:
         pass
 
+    @abstractmethod
+    async def find_credentials_by_email(self, email: Email) -> Optional[UserCredentials]:
+        pass
+
     @abstractmethod
     async def exists_by_email(self, email: Email) -> bool:
         pass
@@ -24,3 +29,18 @@ class UserRepository(BaseRepository[User]):
     async def delete_by_id(self, user_id: UUID) -> bool:
         pass
 
+    @abstractmethod
+    async def bump_token_version(self, user_id: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    async def find_token_version(self, user_id: UUID) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def is_admin(self, user_id: UUID) -> bool:
+        pass
+
+    async def invalidate_cached(self, user_id: UUID, email: Optional[Email] = None):
+        # Hook for caching repositories; uncached implementations have nothing to evict
+        pass
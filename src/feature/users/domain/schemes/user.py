@@ -1,7 +1,12 @@
 import strawberry
 from datetime import datetime
+from typing import TYPE_CHECKING, Annotated, List
+from src.core.infrastructure.web.strawberry.helpers.context import request_loaders
 from ..value_objects.user_status import UserStatus
 
+if TYPE_CHECKING:
+    from src.feature.sessions.domain.schemes.session import SessionGraphQLType
+
 
 @strawberry.type
 class UserGraphQLType:
@@ -18,6 +23,10 @@ class UserGraphQLType:
     created_at: datetime = strawberry.field(name="createdAt", description="Creation timestamp")
     updated_at: datetime = strawberry.field(name="updatedAt", description="Last update timestamp")
 
+    @strawberry.field(name="activeSessions", description="Active sessions, batched with the other users of the response")
+    async def active_sessions(self, info: strawberry.Info) -> List[Annotated["SessionGraphQLType", strawberry.lazy("src.feature.sessions.domain.schemes.session")]]:
+        return await request_loaders(info).active_sessions_by_user_id.load(self.id)
+
     @classmethod
     def from_entity(cls, user) -> "UserGraphQLType":
         return cls(
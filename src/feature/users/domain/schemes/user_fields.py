@@ -6,6 +6,20 @@ from ..value_objects.user_status import UserStatus
 
 @dataclass
 class UserFields:
+    # GraphQL field -> model columns it is built from, used to project list queries
+    GRAPHQL_COLUMNS = {
+        "id": ["id"],
+        "email": ["email"],
+        "firstName": ["first_name"],
+        "lastName": ["last_name"],
+        "fullName": ["first_name", "last_name"],
+        "status": ["status"],
+        "emailVerified": ["email_verified"],
+        "createdAt": ["created_at"],
+        "updatedAt": ["updated_at"],
+        "activeSessions": ["id"],
+    }
+
     @staticmethod
     def entity_to_model_data(entity) -> Dict[str, Any]:
         return {
@@ -15,6 +29,7 @@ class UserFields:
             "last_name": entity.last_name,
             "status": entity.status.value,
             "email_verified": entity.email_verified,
+            "token_version": entity.token_version,
             "created_at": entity.created_at,
             "updated_at": entity.updated_at,
             "is_active": entity.status == UserStatus.ACTIVE,
@@ -24,11 +39,12 @@ class UserFields:
     def model_to_entity_args(model) -> Dict[str, Any]:
         return {
             "id": model.id,
-            "email": Email(model.email),
+            "email": Email(model.email) if model.email is not None else None,
             "first_name": model.first_name,
             "last_name": model.last_name,
-            "status": UserStatus.from_string(model.status),
+            "status": UserStatus.from_string(model.status) if model.status is not None else None,
             "email_verified": model.email_verified,
+            "token_version": model.token_version,
             "created_at": model.created_at,
             "updated_at": model.updated_at,
         }
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from ..entities.user import User
+
+
+@dataclass(frozen=True)
+class UserCredentials:
+    # Authentication read model: the user and its password hash loaded in a single query
+    user: User
+    password_hash: str
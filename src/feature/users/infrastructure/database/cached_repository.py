@@ -0,0 +1,340 @@
+# src/feature/users/infrastructure/database/cached_repository.py
+import copy
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+
+from src.core.domain.value_objects.email import Email
+from src.core.infrastructure.cache.shared_tier import INVALIDATION_MARK_SECONDS, LockedCounters, SharedTier, invalidated_since
+from src.core.infrastructure.cache.ttl_cache import TTLCache
+from src.core.infrastructure.metrics.registry import metrics_registry
+from src.feature.users.domain.entities.user import User
+from src.feature.users.domain.repositories.user_repository import UserRepository
+from src.feature.users.domain.value_objects.user_credentials import UserCredentials
+from src.feature.users.infrastructure.database.repositories import DjangoUserRepository
+from src.shared.criteria.pagination import Page
+
+
+class UserCache(LockedCounters):
+    """
+    Two tier read-through cache for users keyed by ID and by email.
+    Local tier: per process LRU+TTL; other processes only see an invalidation once their local
+    TTL runs out, so USER_CACHE_TTL_SECONDS is the staleness bound across workers.
+    Shared tier (optional): a Django cache alias, invalidated directly on every write.
+    Negative entries remember emails that matched no user, so repeated logins for unknown accounts
+    (credential stuffing) skip the database; creating the user clears them. They live in the shared tier
+    only, and are off without one: a per-process copy would keep rejecting a new account on the other workers.
+    Token versions ("log out everywhere" counters) get their own short local TTL: a bump made by another
+    worker is seen after at most USER_TOKEN_VERSION_CACHE_TTL_SECONDS (the worker's local copy expiring);
+    the bumping worker and the shared tier see it immediately.
+
+    Fills race with writes: a reader that loaded the row before an update commits must not cache it after
+    the invalidation. Readers take begin_fill() before the database read; set() drops the fill if this
+    process invalidated anything meanwhile, and after writing the shared tier it drops the entry again
+    if another worker marked the user invalidated since the read started (so for about CLOCK_SKEW_SECONDS
+    after a write, that user is read from the database without being cached).
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 30.0, shared_alias: Optional[str] = None, shared_ttl_seconds: float = 300.0, missing_ttl_seconds: float = 30.0, version_ttl_seconds: float = 5.0):
+        self.local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.versions = TTLCache(max_size=max_size, ttl_seconds=version_ttl_seconds)
+        self.shared = SharedTier(shared_alias, "User cache")
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.missing_ttl_seconds = missing_ttl_seconds if self.shared.enabled else 0.0
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.missing_hits = 0
+        self.invalidations = 0
+        self.fills_dropped = 0
+
+    @staticmethod
+    def id_key(user_id: UUID) -> str:
+        return f"users:id:{user_id}"
+
+    @staticmethod
+    def email_key(email: Email) -> str:
+        return f"users:email:{str(email).lower()}"
+
+    @staticmethod
+    def missing_key(email: Email) -> str:
+        return f"users:missing:{str(email).lower()}"
+
+    @staticmethod
+    def token_version_key(user_id: UUID) -> str:
+        return f"users:token_version:{user_id}"
+
+    @staticmethod
+    def invalidated_key(user_id: UUID) -> str:
+        return f"users:invalidated:{user_id}"
+
+    @staticmethod
+    def email_invalidated_key(email: Email) -> str:
+        return f"users:invalidated:email:{str(email).lower()}"
+
+    async def get(self, key: str) -> Optional[User]:
+        user = self.local.get(key)
+        if user is None and self.shared.enabled:
+            user = await self.shared.get(key)
+            self._count("shared_hits" if user is not None else "shared_misses")
+            if user is not None:
+                self.local.set(key, user)
+        # Callers mutate and save entities: never hand out the cached instance
+        return copy.deepcopy(user) if user is not None else None
+
+    def begin_fill(self) -> Tuple[int, float]:
+        # Taken before the database read whose result is passed to set()
+        return self._generation, time.time()
+
+    async def set(self, user: User, fill: Tuple[int, float]):
+        generation, started_at = fill
+        if generation != self._generation:
+            # Invalidated while the row was being read: it may predate that write
+            self._count("fills_dropped")
+            return
+
+        user = copy.deepcopy(user)
+        keys = [self.id_key(user.id)]
+        if user.email is not None:
+            keys.append(self.email_key(user.email))
+
+        for key in keys:
+            self.local.set(key, user)
+        if self.shared.enabled and not await self._set_shared({key: user for key in keys}, self.invalidated_key(user.id), started_at):
+            for key in keys:
+                self.local.delete(key)
+
+    async def get_token_version(self, user_id: UUID) -> Optional[int]:
+        version = self.versions.get(user_id)
+        if version is None and self.shared.enabled:
+            version = await self.shared.get(self.token_version_key(user_id))
+            if version is not None:
+                self.versions.set(user_id, version)
+        return version
+
+    async def set_token_version(self, user_id: UUID, version: int, fill: Tuple[int, float]):
+        generation, started_at = fill
+        if generation != self._generation:
+            self._count("fills_dropped")
+            return
+
+        self.versions.set(user_id, version)
+        if self.shared.enabled and not await self._set_shared({self.token_version_key(user_id): version}, self.invalidated_key(user_id), started_at):
+            self.versions.delete(user_id)
+
+    async def is_missing(self, email: Email) -> bool:
+        if not self.missing_ttl_seconds:
+            return False
+        if await self.shared.get(self.missing_key(email)):
+            self._count("missing_hits")
+            return True
+        return False
+
+    async def set_missing(self, email: Email, fill: Tuple[int, float]):
+        generation, started_at = fill
+        if not self.missing_ttl_seconds or generation != self._generation:
+            return
+        key = self.missing_key(email)
+        await self.shared.set(key, True, timeout=self.missing_ttl_seconds)
+        # Same ordering as set(): a user created with this email since the read started removes the entry again
+        invalidated_at = await self.shared.get(self.email_invalidated_key(email))
+        if invalidated_since(invalidated_at, started_at):
+            await self.shared.delete(key)
+            self._count("fills_dropped")
+
+    async def invalidate(self, user_id: UUID, email: Optional[Email] = None):
+        keys = [self.id_key(user_id)]
+        cached = self.local.peek(keys[0])
+        for known_email in {email, cached.email if cached is not None else None}:
+            if known_email is not None:
+                keys.append(self.email_key(known_email))
+
+        with self._lock:
+            self._generation += 1
+        for key in keys:
+            self.local.delete(key)
+        self.versions.delete(user_id)
+        if self.shared.enabled:
+            keys.append(self.token_version_key(user_id))
+            marks = {self.invalidated_key(user_id): time.time()}
+            if email is not None and self.missing_ttl_seconds:
+                # A new user with a recently missed email must be able to log in right away
+                marks[self.email_invalidated_key(email)] = time.time()
+                keys.append(self.missing_key(email))
+            await self.shared.set_many(marks, timeout=INVALIDATION_MARK_SECONDS)
+            await self.shared.delete_many(keys)
+        self._count("invalidations")
+
+    def clear(self):
+        self.local.clear()
+        self.versions.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "local": self.local.snapshot(),
+            "token_versions": self.versions.snapshot(),
+            "missing": {"ttl_seconds": self.missing_ttl_seconds, "hits": self.missing_hits} if self.missing_ttl_seconds else None,
+            "shared": {"alias": self.shared.alias, "ttl_seconds": self.shared_ttl_seconds, "hits": self.shared_hits, "misses": self.shared_misses, "errors": self.shared.errors} if self.shared.enabled else None,
+            "invalidations": self.invalidations,
+            "fills_dropped": self.fills_dropped,
+        }
+
+    async def _set_shared(self, entries: Dict[str, Any], mark_key: str, started_at: float) -> bool:
+        await self.shared.set_many(entries, timeout=self.shared_ttl_seconds)
+        # Invalidations write their mark before deleting: either that delete removed these entries, or the mark is visible here
+        if invalidated_since(await self.shared.get(mark_key), started_at):
+            await self.shared.delete_many(entries)
+            self._count("fills_dropped")
+            return False
+        return True
+
+
+class CachedUserRepository(UserRepository):
+    """
+    Read-through cache for find_by_id/find_by_email; everything else goes straight to the wrapped repository.
+    Writes do not evict on their own: UserUseCases calls invalidate_cached once the write is committed.
+    """
+
+    def __init__(self, repository: UserRepository, cache: Optional[UserCache] = None):
+        self.repository = repository
+        self.cache = cache or get_user_cache()
+
+    # ===== CACHED READS =====
+    async def find_by_id(self, entity_id: UUID) -> Optional[User]:
+        user = await self.cache.get(UserCache.id_key(entity_id))
+        if user is None:
+            fill = self.cache.begin_fill()
+            user = await self.repository.find_by_id(entity_id)
+            if user is not None:
+                await self.cache.set(user, fill)
+        return user
+
+    async def find_by_email(self, email: Email) -> Optional[User]:
+        user = await self.cache.get(UserCache.email_key(email))
+        if user is None:
+            if await self.cache.is_missing(email):
+                return None
+            fill = self.cache.begin_fill()
+            user = await self.repository.find_by_email(email)
+            if user is not None:
+                await self.cache.set(user, fill)
+            else:
+                await self.cache.set_missing(email, fill)
+        return user
+
+    async def find_by_ids(self, entity_ids: List[UUID]) -> List[User]:
+        # Cached users are served directly, only the misses go to the database in one query
+        users, missing = [], []
+        for entity_id in entity_ids:
+            user = await self.cache.get(UserCache.id_key(entity_id))
+            if user is None:
+                missing.append(entity_id)
+            else:
+                users.append(user)
+        if missing:
+            fill = self.cache.begin_fill()
+            for user in await self.repository.find_by_ids(missing):
+                await self.cache.set(user, fill)
+                users.append(user)
+        return users
+
+    async def invalidate_cached(self, user_id: UUID, email: Optional[Email] = None):
+        await self.cache.invalidate(user_id, email)
+
+    # ===== WRITES =====
+    async def save(self, entity: User) -> User:
+        return await self.repository.save(entity)
+
+    async def save_many(self, entities: List[User]) -> List[User]:
+        return await self.repository.save_many(entities)
+
+    async def save_with_password(self, user: User, password: str) -> User:
+        return await self.repository.save_with_password(user, password)
+
+    async def delete(self, entity_id: UUID) -> bool:
+        return await self.repository.delete(entity_id)
+
+    async def bump_token_version(self, user_id: UUID) -> bool:
+        bumped = await self.repository.bump_token_version(user_id)
+        # The bump is committed: drop the old version (and the user row carrying it) everywhere
+        await self.cache.invalidate(user_id)
+        return bumped
+
+    async def delete_by_id(self, user_id: UUID) -> bool:
+        return await self.repository.delete_by_id(user_id)
+
+    # ===== PASS-THROUGH =====
+    async def find_token_version(self, user_id: UUID) -> Optional[int]:
+        # Checked on every validate/refresh; see UserCache for how long another worker's bump can take to show up here
+        version = await self.cache.get_token_version(user_id)
+        if version is None:
+            fill = self.cache.begin_fill()
+            version = await self.repository.find_token_version(user_id)
+            if version is not None:
+                await self.cache.set_token_version(user_id, version, fill)
+        return version
+
+    async def is_admin(self, user_id: UUID) -> bool:
+        # Authorization is never served from cache: revoking superuser status applies to the next request
+        return await self.repository.is_admin(user_id)
+
+    async def find_credentials_by_email(self, email: Email) -> Optional[UserCredentials]:
+        # Password hashes are never cached, but the freshly loaded user warms the cache for the refreshes that follow a login
+        if await self.cache.is_missing(email):
+            return None
+        fill = self.cache.begin_fill()
+        credentials = await self.repository.find_credentials_by_email(email)
+        if credentials is not None:
+            await self.cache.set(credentials.user, fill)
+        else:
+            await self.cache.set_missing(email, fill)
+        return credentials
+
+    async def exists_by_email(self, email: Email) -> bool:
+        return await self.repository.exists_by_email(email)
+
+    async def exists_by_id(self, entity_id: UUID) -> bool:
+        return await self.repository.exists_by_id(entity_id)
+
+    async def find_with_criteria(self, criteria) -> List[User]:
+        return await self.repository.find_with_criteria(criteria)
+
+    async def find_page_with_criteria(self, criteria) -> Page[User]:
+        return await self.repository.find_page_with_criteria(criteria)
+
+    async def find_one_with_criteria(self, criteria) -> Optional[User]:
+        return await self.repository.find_one_with_criteria(criteria)
+
+    async def count_with_criteria(self, criteria) -> int:
+        return await self.repository.count_with_criteria(criteria)
+
+    async def data_version(self):
+        return await self.repository.data_version()
+
+
+_user_cache: Optional[UserCache] = None
+
+
+def get_user_cache() -> UserCache:
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = UserCache(
+            max_size=settings.USER_CACHE_MAX_SIZE,
+            ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+            shared_alias=settings.USER_CACHE_SHARED_ALIAS,
+            shared_ttl_seconds=settings.USER_CACHE_SHARED_TTL_SECONDS,
+            missing_ttl_seconds=settings.USER_NEGATIVE_CACHE_TTL_SECONDS,
+            version_ttl_seconds=settings.USER_TOKEN_VERSION_CACHE_TTL_SECONDS,
+        )
+        metrics_registry.register("user_cache", _user_cache.snapshot)
+    return _user_cache
+
+
+def build_user_repository(repository: Optional[UserRepository] = None) -> UserRepository:
+    repository = repository or DjangoUserRepository()
+    return CachedUserRepository(repository) if settings.USER_CACHE_ENABLED else repository
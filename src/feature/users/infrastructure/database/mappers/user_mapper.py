@@ -7,6 +7,8 @@ from src.feature.users.domain.schemes.user_fields import UserFields
 
 
 class UserEntityMapper(BaseEntityMapper[User, UserModel]):
+    field_columns = {"status": ["status", "is_active"]}
+
     def model_to_entity(self, model: UserModel) -> User:
         args = UserFields.model_to_entity_args(model)
         return User(**args)
@@ -53,6 +53,9 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
 
     is_active = models.BooleanField(default=True)
 
+    # Embedded in every JWT ("ver"); bumping it logs the user out everywhere in one row update
+    token_version = models.PositiveIntegerField(default=0, verbose_name="Token Version")
+
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
 
@@ -1,37 +1,58 @@
 from typing import Optional
 from uuid import UUID
-from asgiref.sync import sync_to_async
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
+from django.utils import timezone
 
 from src.core.domain.value_objects.email import Email
 from src.core.infrastructure.database.repositories import DjangoBaseRepository
+from src.core.infrastructure.security.password_executor import get_password_executor
 from src.feature.users.domain.entities.user import User
 from src.feature.users.domain.repositories.user_repository import UserRepository
+from src.feature.users.domain.value_objects.user_credentials import UserCredentials
 from src.feature.users.infrastructure.database.models import UserModel
 from src.feature.users.infrastructure.database.mappers.user_mapper import UserEntityMapper
 
 
 class DjangoUserRepository(DjangoBaseRepository[User], UserRepository):
-    def __init__(self):
+    def __init__(self, async_driver: Optional[bool] = None):
         mapper = UserEntityMapper()
-        super().__init__(UserModel, mapper)
+        super().__init__(UserModel, mapper, async_driver=async_driver)
 
     async def find_by_email(self, email: Email) -> Optional[User]:
         try:
-            model = await sync_to_async(UserModel.objects.get)(email=str(email))
-            return self.mapper.model_to_entity(model)
+            model = await self._query_get(UserModel.objects.all(), email=str(email))
+            return self.mapper.to_entity(model)
+        except ObjectDoesNotExist:
+            return None
+
+    async def find_credentials_by_email(self, email: Email) -> Optional[UserCredentials]:
+        try:
+            model = await self._query_get(UserModel.objects.all(), email=str(email))
+            return UserCredentials(user=self.mapper.to_entity(model), password_hash=model.password)
         except ObjectDoesNotExist:
             return None
 
     async def exists_by_email(self, email: Email) -> bool:
-        return await sync_to_async(UserModel.objects.filter(email=str(email)).exists)()
+        return await self._query_exists(UserModel.objects.filter(email=str(email)))
 
     async def save_with_password(self, entity: User, plain_password: str) -> User:
-        data = self.mapper.entity_to_model_data(entity)
-        model, _ = await sync_to_async(self.model_class.objects.update_or_create)(id=entity.id, defaults=data)
-        model.set_password(plain_password)
-        await sync_to_async(model.save)()
-        return self.mapper.model_to_entity(model)
+        # Hash first so a new user is a single INSERT with its password
+        password_hash = await get_password_executor().hash(plain_password)
+        if entity.is_new:
+            return await self._insert(entity, password=password_hash)
+        return await self._update(entity, password=password_hash)
+
+    async def bump_token_version(self, user_id: UUID) -> bool:
+        # Single-row UPDATE: every token carrying the previous version stops verifying
+        updated_count = await self._query_update(UserModel.objects.filter(id=user_id), token_version=F("token_version") + 1, updated_at=timezone.now())
+        return updated_count > 0
+
+    async def find_token_version(self, user_id: UUID) -> Optional[int]:
+        return await self._query_first(UserModel.objects.filter(id=user_id).order_by().values_list("token_version", flat=True))
+
+    async def is_admin(self, user_id: UUID) -> bool:
+        return await self._query_exists(UserModel.objects.filter(id=user_id, is_superuser=True, is_active=True))
 
     async def delete_by_id(self, user_id: UUID) -> bool:
         return await super().delete(user_id)
@@ -3,10 +3,11 @@ from .user_resolvers import (
     UserQueries,
     UserMutations,
 )
+from .loaders import build_user_loader
 
 __all__ = [
     "UserResolvers",
     "UserQueries",
     "UserMutations",
+    "build_user_loader",
 ]
-
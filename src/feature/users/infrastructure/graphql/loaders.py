@@ -0,0 +1,17 @@
+from typing import List, Optional
+from uuid import UUID
+
+from strawberry.dataloader import DataLoader
+
+from ...application.use_cases.user_use_cases import UserUseCases
+from ...domain.schemes.user import UserGraphQLType
+
+
+def build_user_loader(user_use_cases: UserUseCases) -> DataLoader[str, Optional[UserGraphQLType]]:
+    # Request scoped: every user ID requested during one tick goes out as a single id__in query
+    async def load(user_ids: List[str]) -> List[Optional[UserGraphQLType]]:
+        users = await user_use_cases.find_by_ids([UUID(user_id) for user_id in user_ids])
+        by_id = {str(user.id): UserGraphQLType.from_entity(user) for user in users}
+        return [by_id.get(user_id) for user_id in user_ids]
+
+    return DataLoader(load_fn=load)
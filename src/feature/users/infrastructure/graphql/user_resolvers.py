@@ -5,40 +5,20 @@ from ...domain.inputs.find import UserFindInput
 from ...domain.inputs.find_one import UserFindOneInput
 from ...domain.types.standard_responses import UserCreateResponse, UserUpdateResponse, UserDeleteResponse, UserFindResponse, UserFindOneResponse
 
-from ...application.use_cases.user_use_cases import UserUseCases
-from ..database.repositories import DjangoUserRepository
+from src.core.infrastructure.web.strawberry.helpers.context import request_container
 from ..services.user_service import UserService
 
 
 @strawberry.type
 class UserResolvers:
-    def __init__(self):
-        self._repository = None
-        self._use_cases = None
-        self._service = None
-
-    @property
-    def repository(self):
-        if self._repository is None:
-            self._repository = DjangoUserRepository()
-        return self._repository
-
-    @property
-    def use_cases(self):
-        if self._use_cases is None:
-            self._use_cases = UserUseCases(self.repository)
-        return self._use_cases
-
-    @property
-    def service(self):
-        if self._service is None:
-            self._service = UserService(self.use_cases)
-        return self._service
+    def __init__(self, service: UserService):
+        # Built once by the application container and shared by every request
+        self.service = service
 
     # ===== QUERIES =====
     @strawberry.field(name="usersFind")
-    async def users_find(self, input: UserFindInput) -> UserFindResponse:
-        return await self.service.find(input)
+    async def users_find(self, input: UserFindInput, info: strawberry.Info) -> UserFindResponse:
+        return await self.service.find(input, info)
 
     @strawberry.field(name="userFindOne")
     async def user_find_one(self, input: UserFindOneInput) -> UserFindOneResponse:
@@ -62,29 +42,24 @@ class UserResolvers:
 @strawberry.type
 class UserQueries:
     @strawberry.field
-    async def users_find(self, input: UserFindInput) -> UserFindResponse:
-        resolver = UserResolvers()
-        return await resolver.users_find(input)
+    async def users_find(self, input: UserFindInput, info: strawberry.Info) -> UserFindResponse:
+        return await request_container(info).user_resolvers.users_find(input, info)
 
     @strawberry.field
-    async def user_find_one(self, input: UserFindOneInput) -> UserFindOneResponse:
-        resolver = UserResolvers()
-        return await resolver.user_find_one(input)
+    async def user_find_one(self, input: UserFindOneInput, info: strawberry.Info) -> UserFindOneResponse:
+        return await request_container(info).user_resolvers.user_find_one(input)
 
 
 @strawberry.type
 class UserMutations:
     @strawberry.mutation
-    async def user_create(self, input: UserCreateInput) -> UserCreateResponse:
-        resolver = UserResolvers()
-        return await resolver.user_create(input)
+    async def user_create(self, input: UserCreateInput, info: strawberry.Info) -> UserCreateResponse:
+        return await request_container(info).user_resolvers.user_create(input)
 
     @strawberry.mutation
-    async def user_update(self, input: UserUpdateInput) -> UserUpdateResponse:
-        resolver = UserResolvers()
-        return await resolver.user_update(input)
+    async def user_update(self, input: UserUpdateInput, info: strawberry.Info) -> UserUpdateResponse:
+        return await request_container(info).user_resolvers.user_update(input)
 
     @strawberry.mutation
-    async def user_delete(self, user_id: str) -> UserDeleteResponse:
-        resolver = UserResolvers()
-        return await resolver.user_delete(user_id)
+    async def user_delete(self, user_id: str, info: strawberry.Info) -> UserDeleteResponse:
+        return await request_container(info).user_resolvers.user_delete(user_id)
@@ -1,4 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import strawberry
+from django.conf import settings
 
 from src.core.infrastructure.web.strawberry.services.base_service import BaseService
 from src.core.infrastructure.web.strawberry.responses import FindData, FindOneData
@@ -13,23 +16,24 @@ from ...domain.schemes.user import UserGraphQLType
 from ...domain.schemes.user_fields import UserFields
 from src.core.exceptions.base_exceptions import BaseDomainException
 from src.core.infrastructure.web.strawberry.helpers.validators import validate_uuid
+from src.core.infrastructure.web.strawberry.helpers.selection import selected_item_fields
 
 
 class UserService(BaseService):
     def __init__(self, user_use_cases: UserUseCases):
         super().__init__("User")
         self.user_use_cases = user_use_cases
-        self.criteria_helper = CriteriaServiceHelper(feature_name="user", search_fields=["first_name", "last_name", "email"], boolean_fields=["email_verified"], string_fields=["email", "status"])
+        self.criteria_helper = CriteriaServiceHelper(feature_name="user", search_fields=["first_name", "last_name", "email"], boolean_fields=["email_verified"], string_fields=["email", "status"], projection_columns=UserFields.GRAPHQL_COLUMNS, cache_ttl_seconds=settings.USER_FIND_CACHE_TTL_SECONDS, cache_max_size=settings.USER_FIND_CACHE_MAX_SIZE)
 
     # ===== QUERIES =====
-    async def find(self, input: UserFindInput) -> UserFindResponse:
+    async def find(self, input: UserFindInput, info: Optional[strawberry.Info] = None) -> UserFindResponse:
         try:
-            prepare = self.criteria_helper.build_find_prepare(input)
-            users, total_count = await self.user_use_cases.find_with_criteria(prepare)
-            user_graphql_list = UserGraphQLType.from_entities(users)
-            response_data = self.handle_success_find(user_graphql_list, total_count)
+            prepare = self.criteria_helper.build_find_prepare(input, selected_item_fields(info))
+            page = await self.user_use_cases.find_with_criteria(prepare)
+            user_graphql_list = UserGraphQLType.from_entities(page.items)
+            response_data = self.handle_success_find(user_graphql_list, page.total_count, page.next_cursor, page.prev_cursor, page.has_next_page)
 
-            return UserFindResponse(success=response_data["success"], data=FindData(items=response_data["data"]), total_count=response_data["total_count"], message=response_data["message"])
+            return UserFindResponse(success=response_data["success"], data=FindData(items=response_data["data"]), total_count=response_data["total_count"], has_next_page=response_data["has_next_page"], next_cursor=response_data["next_cursor"], prev_cursor=response_data["prev_cursor"], message=response_data["message"])
         except BaseDomainException as e:
             error_data = self.handle_exception(e, [])
             return UserFindResponse(success=error_data["success"], data=FindData(items=error_data["data"]), total_count=0, message=error_data["message"], error_code=error_data["error_code"])
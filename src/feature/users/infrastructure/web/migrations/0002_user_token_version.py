@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usermodel',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, verbose_name='Token Version'),
+        ),
+    ]
@@ -0,0 +1,117 @@
+# src/feature/users/tests.py
+import asyncio
+import uuid
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from src.core.domain.value_objects.email import Email
+from src.feature.users.domain.entities.user import User
+from src.feature.users.infrastructure.database.cached_repository import CachedUserRepository, UserCache
+
+
+class TokenVersions:
+    """The users table's token_version column; bump_during_read runs between reading a version and returning it"""
+
+    def __init__(self):
+        self.versions = {}
+        self.reads = 0
+        self.bump_during_read = None
+
+    async def find_token_version(self, user_id):
+        self.reads += 1
+        version = self.versions.get(user_id, 0)
+        if self.bump_during_read:
+            bump, self.bump_during_read = self.bump_during_read, None
+            await bump()
+        return version
+
+    async def bump_token_version(self, user_id):
+        self.versions[user_id] = self.versions.get(user_id, 0) + 1
+        return True
+
+
+class TokenVersionCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.table = TokenVersions()
+        self.user_id = uuid.uuid4()
+
+    def worker(self, version_ttl_seconds=5.0) -> CachedUserRepository:
+        return CachedUserRepository(self.table, cache=UserCache(shared_alias="default", version_ttl_seconds=version_ttl_seconds))
+
+    def version(self, worker: CachedUserRepository):
+        return asyncio.run(worker.find_token_version(self.user_id))
+
+    def test_versions_are_served_from_the_shared_tier(self):
+        self.version(self.worker())
+        self.version(self.worker())
+
+        self.assertEqual(self.table.reads, 1)
+
+    def test_bump_is_seen_at_once_by_the_bumping_worker_and_the_shared_tier(self):
+        writer = self.worker()
+        self.version(writer)
+        asyncio.run(writer.bump_token_version(self.user_id))
+
+        self.assertEqual(self.version(writer), 1)
+        self.assertEqual(self.version(self.worker()), 1)
+
+    def test_other_workers_see_a_bump_once_their_local_copy_expires(self):
+        reader, writer = self.worker(version_ttl_seconds=60), self.worker()
+        self.version(reader)
+        asyncio.run(writer.bump_token_version(self.user_id))
+
+        # The documented staleness bound: the reader's local copy lives for version_ttl_seconds
+        self.assertEqual(self.version(reader), 0)
+        reader.cache.versions.clear()
+        self.assertEqual(self.version(reader), 1)
+
+    def test_fill_racing_another_workers_bump_is_dropped(self):
+        reader, writer = self.worker(), self.worker()
+        self.table.bump_during_read = lambda: writer.bump_token_version(self.user_id)
+
+        self.assertEqual(self.version(reader), 0)
+        # The version read before the bump is cached nowhere
+        self.assertIsNone(reader.cache.versions.get(self.user_id))
+        self.assertEqual(self.version(self.worker()), 1)
+
+
+class UserCacheFillTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User(email=Email("a@b.co"), first_name="A", last_name="B", id=uuid.uuid4())
+
+    def worker(self) -> UserCache:
+        return UserCache(shared_alias="default")
+
+    def cached(self, worker: UserCache):
+        return asyncio.run(worker.get(UserCache.id_key(self.user.id)))
+
+    def fill_racing(self, reader: UserCache, invalidation):
+        async def scenario():
+            fill = reader.begin_fill()
+            await invalidation()
+            await reader.set(self.user, fill)
+
+        asyncio.run(scenario())
+
+    def test_fill_without_invalidation_is_shared(self):
+        self.fill_racing(self.worker(), lambda: asyncio.sleep(0))
+
+        self.assertEqual(self.cached(self.worker()).id, self.user.id)
+
+    def test_fill_racing_a_local_invalidation_is_dropped(self):
+        reader = self.worker()
+        self.fill_racing(reader, lambda: reader.invalidate(self.user.id, self.user.email))
+
+        self.assertIsNone(self.cached(reader))
+        self.assertEqual(reader.fills_dropped, 1)
+
+    def test_fill_racing_another_workers_invalidation_is_dropped(self):
+        reader, writer = self.worker(), self.worker()
+        self.fill_racing(reader, lambda: writer.invalidate(self.user.id, self.user.email))
+
+        self.assertIsNone(self.cached(reader))
+        self.assertIsNone(self.cached(self.worker()))
+        self.assertIsNone(asyncio.run(self.worker().get(UserCache.email_key(self.user.email))))
@@ -9,8 +9,11 @@ from .base_criteria import (
     CriteriaOptions,
     FilterOperator,
     SortDirection,
+    CountMode,
 )
 from .converter import CriteriaConverter
+from .pagination import Page, CursorCodec
+from .encoding import CriteriaJSONEncoder
 from .prepare import PrepareFind, PrepareFindOne
 from .input_converter import CriteriaInputConverter
 from .service_helper import CriteriaServiceHelper
@@ -22,6 +25,7 @@ from .graphql_inputs import (
     CriteriaOptionsInput,
     FilterOperatorInput,
     SortDirectionInput,
+    CountModeInput,
 )
 
 __all__ = [
@@ -37,10 +41,15 @@ __all__ = [
     # Enums
     "FilterOperator",
     "SortDirection",
+    "CountMode",
     # Converters and helpers
     "CriteriaConverter",
     "CriteriaInputConverter",
     "CriteriaServiceHelper",
+    # Pagination
+    "Page",
+    "CursorCodec",
+    "CriteriaJSONEncoder",
     # Prepare classes
     "PrepareFind",
     "PrepareFindOne",
@@ -52,4 +61,5 @@ __all__ = [
     "CriteriaOptionsInput",
     "FilterOperatorInput",
     "SortDirectionInput",
+    "CountModeInput",
 ]
@@ -1,10 +1,14 @@
 # src/shared/criteria/base_criteria.py
+import hashlib
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, TypeVar, Generic
 from django.db.models import QuerySet
 from enum import Enum
 from dataclasses import dataclass
 
+from .encoding import CriteriaJSONEncoder
+
 
 class FilterOperator(Enum):
     EQ = "eq"  # Equal
@@ -84,6 +88,7 @@ class Order:
 
 @dataclass
 class Projection:
+    # Model columns to load; the rest are deferred (QuerySet.only)
     fields: List[str]
 
     def to_django_values(self) -> List[str]:
@@ -123,9 +128,36 @@ class Orders:
             orders.append(order_obj)
         return cls(orders)
 
+    @classmethod
+    def from_django_ordering(cls, ordering) -> "Orders":
+        # Model Meta.ordering ("-created_at", ...); expressions and "?" have no keyset equivalent and are skipped
+        orders = []
+        for entry in ordering or []:
+            if isinstance(entry, str) and entry != "?":
+                field = entry.lstrip("-")
+                orders.append(Order(field=field, direction=SortDirection.DESC if entry.startswith("-") else SortDirection.ASC))
+        return cls(orders)
+
     def to_django_order_by(self) -> List[str]:
         return [order.to_django_order() for order in self.orders]
 
+    def with_tiebreak(self, field: str = "id") -> "Orders":
+        # Keyset pagination needs a total order: append the unique field unless already ordered by it
+        if any(order.field == field for order in self.orders):
+            return Orders(list(self.orders))
+        direction = self.orders[-1].direction if self.orders else SortDirection.ASC
+        return Orders(list(self.orders) + [Order(field=field, direction=direction)])
+
+    def reversed(self) -> "Orders":
+        flipped = {SortDirection.ASC: SortDirection.DESC, SortDirection.DESC: SortDirection.ASC}
+        return Orders([Order(field=order.field, direction=flipped[order.direction]) for order in self.orders])
+
+
+class CountMode(Enum):
+    EXACT = "exact"  # COUNT(*) OVER () in the page query
+    ESTIMATED = "estimated"  # Planner estimate, pg_class.reltuples when unfiltered
+    NONE = "none"  # No total, only has_next_page
+
 
 @dataclass
 class CriteriaOptions:
@@ -133,16 +165,24 @@ class CriteriaOptions:
     max_time_ms: Optional[int] = None
     comment: Optional[str] = None
     batch_size: Optional[int] = None
+    count_mode: CountMode = CountMode.EXACT
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, cls=CriteriaJSONEncoder, sort_keys=True, separators=(",", ":"))
 
 
 class Criteria:
-    def __init__(self, filters: Filters = None, orders: Orders = None, limit: Optional[int] = None, offset: Optional[int] = None, projection: Optional[Projection] = None, options: Optional[CriteriaOptions] = None):
+    def __init__(self, filters: Filters = None, orders: Orders = None, limit: Optional[int] = None, offset: Optional[int] = None, projection: Optional[Projection] = None, options: Optional[CriteriaOptions] = None, after: Optional[str] = None, before: Optional[str] = None):
         self.filters = filters or Filters.none()
         self.orders = orders or Orders.none()
         self.limit = limit
         self.offset = offset
         self.projection = projection
         self.options = options or CriteriaOptions()
+        # Keyset pagination cursors (take precedence over offset)
+        self.after = after
+        self.before = before
 
     def has_filters(self) -> bool:
         return len(self.filters.filters) > 0
@@ -156,6 +196,28 @@ class Criteria:
     def has_pagination(self) -> bool:
         return self.limit is not None or self.offset is not None
 
+    def has_cursor(self) -> bool:
+        return self.after is not None or self.before is not None
+
+    def fingerprint(self) -> str:
+        # Canonical identity of the query: AND-ed filters (and nested AND/OR lists) are order-insensitive,
+        # orders are not; projection is a set
+        def canonical(filter_obj: Filter) -> Dict[str, Any]:
+            nested = sorted((canonical(nested) for nested in filter_obj.nested_filters or []), key=_canonical_json)
+            return {"field": filter_obj.field, "operator": filter_obj.operator.value, "value": filter_obj.value, "nested": nested}
+
+        payload = {
+            "filters": sorted((canonical(filter_obj) for filter_obj in self.filters.filters), key=_canonical_json),
+            "orders": [[order.field, order.direction.value] for order in self.orders.orders],
+            "limit": self.limit,
+            "offset": self.offset,
+            "projection": sorted(self.projection.fields) if self.has_projection() else None,
+            "after": self.after,
+            "before": self.before,
+            "count_mode": self.options.count_mode.value,
+        }
+        return hashlib.sha256(_canonical_json(payload).encode()).hexdigest()
+
     @classmethod
     def builder(cls) -> "CriteriaBuilder":
         return CriteriaBuilder()
@@ -169,6 +231,8 @@ class CriteriaBuilder:
         self._offset: Optional[int] = None
         self._projection: Optional[Projection] = None
         self._options: CriteriaOptions = CriteriaOptions()
+        self._after: Optional[str] = None
+        self._before: Optional[str] = None
 
     def set_filters(self, filters: Filters) -> "CriteriaBuilder":
         self._filters = filters
@@ -190,6 +254,14 @@ class CriteriaBuilder:
         self._projection = projection
         return self
 
+    def set_after(self, cursor: str) -> "CriteriaBuilder":
+        self._after = cursor
+        return self
+
+    def set_before(self, cursor: str) -> "CriteriaBuilder":
+        self._before = cursor
+        return self
+
     def set_explain(self, explain: bool) -> "CriteriaBuilder":
         self._options.explain = explain
         return self
@@ -199,4 +271,4 @@ class CriteriaBuilder:
         return self
 
     def build(self) -> Criteria:
-        return Criteria(filters=self._filters, orders=self._orders, limit=self._limit, offset=self._offset, projection=self._projection, options=self._options)
+        return Criteria(filters=self._filters, orders=self._orders, limit=self._limit, offset=self._offset, projection=self._projection, options=self._options, after=self._after, before=self._before)
@@ -1,34 +1,149 @@
 # src/shared/criteria/converter.py
-from django.db.models import QuerySet, Q
+from typing import Any, Dict, List, Optional
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Field, QuerySet, Q
 from functools import reduce
 import operator
-from .base_criteria import Criteria, Filters, FilterOperator, Filter
+from .base_criteria import Criteria, Filters, FilterOperator, Filter, Orders, SortDirection
+from .pagination import CursorCodec
+from src.core.exceptions.base_exceptions import ValidationException
 
 
 class CriteriaConverter:
     @staticmethod
-    def apply_criteria(queryset: QuerySet, criteria: Criteria) -> QuerySet:
+    def apply_criteria(queryset: QuerySet, criteria: Criteria, annotations: Optional[Dict[str, Any]] = None) -> QuerySet:
         if criteria.has_filters():
             queryset = CriteriaConverter._apply_filters(queryset, criteria.filters)
 
-        if criteria.has_orders():
-            order_fields = criteria.orders.to_django_order_by()
-            queryset = queryset.order_by(*order_fields)
+        orders = CriteriaConverter.keyset_orders(criteria, queryset.model)
+        if orders.orders:
+            queryset = queryset.order_by(*CriteriaConverter._order_by(queryset.model, orders))
+
+        if criteria.has_cursor():
+            cursor = criteria.before if criteria.before is not None else criteria.after
+            queryset = queryset.filter(CriteriaConverter._seek_q(queryset.model, orders, CursorCodec.decode(cursor)))
+
+        if annotations:
+            queryset = queryset.annotate(**annotations)
 
         if criteria.has_projection():
-            fields = criteria.projection.to_django_values()
-            queryset = queryset.values(*fields)
+            queryset = queryset.only(*CriteriaConverter._projection_columns(queryset, criteria, orders))
 
-        if criteria.has_pagination():
-            if criteria.offset is not None:
-                queryset = queryset[criteria.offset :]
+        if criteria.has_cursor():
+            # The seek predicate replaces OFFSET: page N costs the same as page 1
+            if criteria.limit is not None:
+                queryset = queryset[: criteria.limit]
+        elif criteria.has_pagination():
+            # Single slice: slicing an already sliced queryset is relative and would skip offset twice
+            start_index = criteria.offset or 0
             if criteria.limit is not None:
-                end_index = (criteria.offset or 0) + criteria.limit
-                start_index = criteria.offset or 0
-                queryset = queryset[start_index:end_index]
+                queryset = queryset[start_index : start_index + criteria.limit]
+            else:
+                queryset = queryset[start_index:]
 
         return queryset
 
+    @staticmethod
+    def keyset_orders(criteria: Criteria, model: Optional[type] = None) -> Orders:
+        # Paginated or ordered reads get an id tiebreak so every row has a unique, stable position;
+        # without explicit orders the model's Meta.ordering is kept (ids are random UUIDs).
+        # "before" walks the same order backwards (callers reverse the rows afterwards)
+        if not (criteria.has_orders() or criteria.has_cursor() or criteria.limit is not None):
+            return Orders.none()
+
+        orders = criteria.orders
+        if not criteria.has_orders() and model is not None:
+            orders = Orders.from_django_ordering(model._meta.ordering)
+        orders = orders.with_tiebreak()
+        return orders.reversed() if criteria.before is not None else orders
+
+    @staticmethod
+    def _order_field(model: type, path: str) -> Field:
+        current = model
+        field = None
+        try:
+            for part in path.split("__"):
+                field = current._meta.get_field(part)
+                if field.is_relation:
+                    current = field.related_model
+        except (FieldDoesNotExist, AttributeError):
+            raise ValidationException(f"Unknown order field: {path}", error_code="INVALID_CRITERIA")
+        return field
+
+    @staticmethod
+    def _order_by(model: type, orders: Orders) -> List[Any]:
+        # NULLs sort last ascending and first descending on every backend (PostgreSQL's default, so its
+        # indexes still serve the order); the seek predicate relies on that placement
+        order_by = []
+        for order in orders.orders:
+            if CriteriaConverter._order_field(model, order.field).null:
+                expression = F(order.field)
+                order_by.append(expression.asc(nulls_last=True) if order.direction == SortDirection.ASC else expression.desc(nulls_first=True))
+            else:
+                order_by.append(order.to_django_order())
+        return order_by
+
+    @staticmethod
+    def _projection_columns(queryset: QuerySet, criteria: Criteria, orders: Orders) -> List[str]:
+        # Deferred loading keeps model instances; id and ordering columns are always needed (cursors),
+        # anything else left deferred would cost one query per row if touched
+        columns = ["id"]
+        for field in criteria.projection.to_django_values() + [order.field for order in orders.orders if "__" not in order.field]:
+            try:
+                queryset.model._meta.get_field(field)
+            except FieldDoesNotExist:
+                raise ValidationException(f"Unknown projection field: {field}", error_code="INVALID_CRITERIA")
+            if field not in columns:
+                columns.append(field)
+        return columns
+
+    @staticmethod
+    def cursor_for(row: Any, orders: Orders) -> str:
+        values: Dict[str, Any] = {}
+        for order in orders.orders:
+            if isinstance(row, dict):
+                value = row.get(order.field)
+            else:
+                value = row
+                for part in order.field.split("__"):
+                    value = getattr(value, part, None)
+            values[order.field] = value
+        return CursorCodec.encode(values)
+
+    @staticmethod
+    def _seek_q(model: type, orders: Orders, values: Dict[str, Any]) -> Q:
+        # (a, b, id) > (va, vb, vid) expanded per column so mixed ASC/DESC orders work:
+        # a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND id > vid)
+        missing = [order.field for order in orders.orders if order.field not in values]
+        if missing:
+            raise ValidationException("Pagination cursor does not match the requested ordering", error_code="INVALID_CURSOR")
+
+        seek = Q(pk__in=[])
+        equal_prefix = Q()
+        for order in orders.orders:
+            field = CriteriaConverter._order_field(model, order.field)
+            try:
+                value = field.to_python(values[order.field])
+            except (DjangoValidationError, TypeError, ValueError):
+                raise ValidationException("Invalid pagination cursor", error_code="INVALID_CURSOR")
+
+            ascending = order.direction == SortDirection.ASC
+            if value is None:
+                # NULLs are last ascending (nothing follows them) and first descending (every value follows)
+                after = None if ascending else Q(**{f"{order.field}__isnull": False})
+                equal = Q(**{f"{order.field}__isnull": True})
+            else:
+                after = Q(**{f"{order.field}__{'gt' if ascending else 'lt'}": value})
+                if ascending and field.null:
+                    after |= Q(**{f"{order.field}__isnull": True})
+                equal = Q(**{order.field: value})
+
+            if after is not None:
+                seek |= equal_prefix & after
+            equal_prefix &= equal
+        return seek
+
     @staticmethod
     def _apply_filters(queryset: QuerySet, filters: Filters) -> QuerySet:
         if not filters.filters:
@@ -0,0 +1,13 @@
+# src/shared/criteria/encoding.py
+import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class CriteriaJSONEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder cuts datetimes/times to milliseconds: two rows (or filter values) inside the same
+    # millisecond would encode identically, so cursors and cache keys keep the full microseconds
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
@@ -29,6 +29,13 @@ class SortDirectionInput(Enum):
     DESC = "desc"
 
 
+@strawberry.enum
+class CountModeInput(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 @strawberry.input
 class FilterInput:
     field: Optional[str] = strawberry.field(default=None, description="Field to filter on")
@@ -45,7 +52,7 @@ class OrderInput:
 
 @strawberry.input
 class ProjectionInput:
-    fields: List[str] = strawberry.field(description="Fields to include in response")
+    fields: List[str] = strawberry.field(description="Columns to load; others are left unloaded (defaults to the selected GraphQL fields)")
 
 
 @strawberry.input
@@ -53,6 +60,7 @@ class CriteriaOptionsInput:
     explain: bool = strawberry.field(default=False, description="Explain query execution")
     comment: Optional[str] = strawberry.field(default=None, description="Query comment for debugging")
     batch_size: Optional[int] = strawberry.field(default=None, description="Batch size for query")
+    count_mode: CountModeInput = strawberry.field(default=CountModeInput.EXACT, description="Total count: exact, planner estimate, or none (only hasNextPage)")
 
 
 @strawberry.input
@@ -61,5 +69,7 @@ class CriteriaInput:
     orders: Optional[List[OrderInput]] = strawberry.field(default=None, description="Query ordering")
     limit: Optional[int] = strawberry.field(default=None, description="Limit number of results")
     offset: Optional[int] = strawberry.field(default=None, description="Offset for pagination")
+    after: Optional[str] = strawberry.field(default=None, description="Cursor: return items after this one (keyset pagination, ignores offset)")
+    before: Optional[str] = strawberry.field(default=None, description="Cursor: return items before this one (keyset pagination, ignores offset)")
     projection: Optional[ProjectionInput] = strawberry.field(default=None, description="Field projection")
     options: Optional[CriteriaOptionsInput] = strawberry.field(default=None, description="Additional query options")
@@ -1,4 +1,4 @@
-from .base_criteria import Criteria, Filters, Orders, Filter, Order, Projection, CriteriaOptions, FilterOperator, SortDirection
+from .base_criteria import Criteria, Filters, Orders, Filter, Order, Projection, CriteriaOptions, FilterOperator, SortDirection, CountMode
 from .graphql_inputs import CriteriaInput, FilterInput, OrderInput, ProjectionInput, CriteriaOptionsInput, FilterOperatorInput, SortDirectionInput
 
 
@@ -28,8 +28,9 @@ class CriteriaInputConverter:
             options.explain = input_data.options.explain
             options.comment = input_data.options.comment
             options.batch_size = input_data.options.batch_size
+            options.count_mode = CountMode(input_data.options.count_mode.value)
 
-        return Criteria(filters=filters, orders=orders, limit=input_data.limit, offset=input_data.offset, projection=projection, options=options)
+        return Criteria(filters=filters, orders=orders, limit=input_data.limit, offset=input_data.offset, projection=projection, options=options, after=input_data.after, before=input_data.before)
 
     @staticmethod
     def _convert_filter(filter_input: FilterInput) -> Filter:
@@ -0,0 +1,41 @@
+# src/shared/criteria/pagination.py
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from src.core.exceptions.base_exceptions import ValidationException
+
+from .encoding import CriteriaJSONEncoder
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    total_count: Optional[int] = None  # None with CountMode.NONE
+    has_next_page: bool = False
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class CursorCodec:
+    # Opaque to clients: base64 of the ordering values of the boundary row, as JSON (datetimes at full
+    # precision); the converter parses them back with each order field's to_python
+    @staticmethod
+    def encode(values: Dict[str, Any]) -> str:
+        payload = json.dumps(values, cls=CriteriaJSONEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> Dict[str, Any]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (ValueError, TypeError):
+            raise ValidationException("Invalid pagination cursor", error_code="INVALID_CURSOR")
+
+        if not isinstance(values, dict):
+            raise ValidationException("Invalid pagination cursor", error_code="INVALID_CURSOR")
+        return values
@@ -1,16 +1,26 @@
-from typing import TypeVar, Generic
+from typing import Generic, Optional, TypeVar
 from dataclasses import dataclass
 from .base_criteria import Criteria, Filters
 
 T = TypeVar("T")
 
 
+@dataclass
+class FindCachePolicy:
+    # Per-feature result cache for find (see BaseCrudUseCases.find_with_criteria)
+    namespace: str
+    ttl_seconds: float
+    max_size: int = 256
+
+
 @dataclass
 class PrepareFind(Generic[T]):
     criteria: Criteria
+    cache: Optional[FindCachePolicy] = None
 
-    def __init__(self, criteria: Criteria):
+    def __init__(self, criteria: Criteria, cache: Optional[FindCachePolicy] = None):
         self.criteria = criteria
+        self.cache = cache
 
 
 @dataclass
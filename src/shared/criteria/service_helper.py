@@ -1,27 +1,45 @@
 # src/shared/criteria/service_helper.py
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from .input_converter import CriteriaInputConverter
-from .prepare import PrepareFind, PrepareFindOne
-from .base_criteria import Criteria, Filters, Orders, Filter, Order, FilterOperator, SortDirection
+from .prepare import FindCachePolicy, PrepareFind, PrepareFindOne
+from .base_criteria import Criteria, Filters, Orders, Filter, Order, FilterOperator, SortDirection, Projection
 from src.core.exceptions.base_exceptions import ValidationException
 
 
 class CriteriaServiceHelper:
-    def __init__(self, feature_name: str, search_fields: List[str] = None, boolean_fields: List[str] = None, string_fields: List[str] = None, additional_field_mapping: Dict[str, str] = None):
+    def __init__(self, feature_name: str, search_fields: List[str] = None, boolean_fields: List[str] = None, string_fields: List[str] = None, additional_field_mapping: Dict[str, str] = None, projection_columns: Dict[str, List[str]] = None, cache_ttl_seconds: float = 0.0, cache_max_size: int = 256):
         self.feature_name = feature_name
         self.search_fields = search_fields or []
         self.boolean_fields = boolean_fields or []
         self.string_fields = string_fields or []
         self.additional_field_mapping = additional_field_mapping or {}
+        # GraphQL field -> model columns, to project list queries onto what the client selected
+        self.projection_columns = projection_columns or {}
+        # Find result cache for this feature (0 = disabled)
+        self.cache_policy = FindCachePolicy(namespace=feature_name, ttl_seconds=cache_ttl_seconds, max_size=cache_max_size) if cache_ttl_seconds > 0 else None
 
-    def build_find_prepare(self, input_obj) -> PrepareFind:
+    def build_find_prepare(self, input_obj, selected_fields: Optional[Iterable[str]] = None) -> PrepareFind:
         if not hasattr(input_obj, "criteria") or not input_obj.criteria:
             # Provide default criteria with sensible defaults
             criteria = self._build_default_find_criteria()
         else:
             criteria = CriteriaInputConverter.from_graphql_input(input_obj.criteria)
 
-        return PrepareFind(criteria=criteria)
+        if not criteria.has_projection() and selected_fields is not None:
+            criteria.projection = self._selection_projection(selected_fields)
+
+        return PrepareFind(criteria=criteria, cache=self.cache_policy)
+
+    def _selection_projection(self, selected_fields: Iterable[str]) -> Optional[Projection]:
+        columns: List[str] = []
+        for field in selected_fields:
+            if field.startswith("__"):
+                continue
+            if field not in self.projection_columns:
+                # Unknown field (e.g. a custom resolver): load everything rather than guess
+                return None
+            columns.extend(column for column in self.projection_columns[field] if column not in columns)
+        return Projection(columns or ["id"])
 
     def build_find_one_prepare(self, input_obj) -> PrepareFindOne:
         if not hasattr(input_obj, "criteria") or not input_obj.criteria:
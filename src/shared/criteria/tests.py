@@ -0,0 +1,59 @@
+# src/shared/criteria/tests.py
+import datetime
+
+from django.test import SimpleTestCase
+
+from src.core.exceptions.base_exceptions import ValidationException
+from src.feature.sessions.infrastructure.database.models import SessionModel
+from src.shared.criteria import Criteria, CriteriaConverter, CursorCodec, Filter, FilterOperator, Filters, Order, Orders, SortDirection
+
+
+class CursorCodecTests(SimpleTestCase):
+    def test_datetime_round_trip_keeps_microseconds(self):
+        created_at = datetime.datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc)
+        values = CursorCodec.decode(CursorCodec.encode({"created_at": created_at, "id": "a"}))
+
+        self.assertEqual(SessionModel._meta.get_field("created_at").to_python(values["created_at"]), created_at)
+
+    def test_rows_in_the_same_millisecond_get_distinct_cursors(self):
+        first = datetime.datetime(2026, 1, 2, 3, 4, 5, 123001, tzinfo=datetime.timezone.utc)
+        second = first.replace(microsecond=123999)
+
+        self.assertNotEqual(CursorCodec.encode({"created_at": first}), CursorCodec.encode({"created_at": second}))
+
+    def test_garbage_cursor_is_invalid(self):
+        with self.assertRaises(ValidationException) as raised:
+            CursorCodec.decode("not base64 json")
+        self.assertEqual(raised.exception.error_code, "INVALID_CURSOR")
+
+
+class FingerprintTests(SimpleTestCase):
+    def test_datetime_filters_in_the_same_millisecond_get_distinct_fingerprints(self):
+        first = datetime.datetime(2026, 1, 2, 3, 4, 5, 123001, tzinfo=datetime.timezone.utc)
+        second = first.replace(microsecond=123999)
+
+        def fingerprint(value):
+            return Criteria(filters=Filters([Filter("created_at", FilterOperator.GT, value)])).fingerprint()
+
+        self.assertNotEqual(fingerprint(first), fingerprint(second))
+
+
+class KeysetOrderTests(SimpleTestCase):
+    def test_limit_without_orders_keeps_model_ordering(self):
+        orders = CriteriaConverter.keyset_orders(Criteria(limit=10), SessionModel)
+
+        self.assertEqual(orders.to_django_order_by(), ["-created_at", "-id"])
+
+    def test_seek_on_null_value_has_no_null_comparison(self):
+        orders = Orders([Order(field="ip_address", direction=SortDirection.ASC)]).with_tiebreak()
+        seek = CriteriaConverter._seek_q(SessionModel, orders, {"ip_address": None, "id": "6f1c5b8e-2d4e-4c1a-9a57-1c3f0d1e2b3a"})
+
+        self.assertNotIn("ip_address__gt", str(seek))
+        self.assertIn("ip_address__isnull", str(seek))
+
+    def test_tampered_cursor_value_is_invalid(self):
+        orders = Orders([Order(field="created_at", direction=SortDirection.DESC)]).with_tiebreak()
+
+        with self.assertRaises(ValidationException) as raised:
+            CriteriaConverter._seek_q(SessionModel, orders, {"created_at": "not-a-date", "id": "6f1c5b8e-2d4e-4c1a-9a57-1c3f0d1e2b3a"})
+        self.assertEqual(raised.exception.error_code, "INVALID_CURSOR")